@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:54
+
+import core.upload_paths
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="clientfile",
+            name="file",
+            field=models.FileField(upload_to=core.upload_paths.DateShardedPath("client_files/", "uploaded_at")),
+        ),
+    ]
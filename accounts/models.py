@@ -4,6 +4,8 @@ from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, Permis
 from django.db import models
 from django.utils import timezone
 
+from core.upload_paths import DateShardedPath
+
 
 class CustomUserManager(BaseUserManager):
     def create_user(self, email, first_name, last_name, password=None, **extra_fields):
@@ -54,6 +56,13 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
 
     objects = CustomUserManager()
 
+    class Meta:
+        indexes = [
+            # Portal user table: sorted by last name or join date, paged on (column, id).
+            models.Index(fields=["last_name", "id"], name="accounts_user_last_name_idx"),
+            models.Index(fields=["date_joined", "id"], name="accounts_user_joined_idx"),
+        ]
+
     def get_full_name(self):
         return f"{self.first_name} {self.last_name}".strip()
 
@@ -101,7 +110,7 @@ class ClientFile(models.Model):
         blank=True,
         related_name="uploaded_files",
     )
-    file = models.FileField(upload_to="client_files/")
+    file = models.FileField(upload_to=DateShardedPath("client_files/", "uploaded_at"))
     description = models.CharField(max_length=255, blank=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -9,7 +9,9 @@ from .models import (
     Amenity,
     Photo,
     Lead,
+    NormalizedImage,
 )
+from .signals import rows_updated
 
 
 # ---------------------------------------------------------------------------
@@ -19,7 +21,7 @@ from .models import (
 class PhotoInline(GenericTabularInline):
     model = Photo
     extra = 1
-    fields = ("image", "caption")
+    fields = ("image", "caption", "sort_order")
     verbose_name = "Photo"
     verbose_name_plural = "Photos"
 
@@ -39,11 +41,15 @@ class FeaturedAdminMixin:
 
     @admin.action(description="Mark selected as featured")
     def make_featured(self, request, queryset):
+        pks = list(queryset.values_list("pk", flat=True))
         queryset.update(is_featured=True)
+        rows_updated(queryset.model, pks)
 
     @admin.action(description="Remove from featured")
     def clear_featured(self, request, queryset):
+        pks = list(queryset.values_list("pk", flat=True))
         queryset.update(is_featured=False, featured_rank=0)
+        rows_updated(queryset.model, pks)
 
     actions = ("make_featured", "clear_featured")
 
@@ -161,3 +167,17 @@ class LeadAdmin(admin.ModelAdmin):
     def has_add_permission(self, request):
         # Leads are created by the website, not manually
         return False
+
+
+# ---------------------------------------------------------------------------
+# Normalized images (read-only ledger written by catalog/ingest.py)
+# ---------------------------------------------------------------------------
+
+@admin.register(NormalizedImage)
+class NormalizedImageAdmin(admin.ModelAdmin):
+    list_display = ("name", "original_bytes", "stored_bytes", "width", "height", "created")
+    search_fields = ("name", "original_name")
+    readonly_fields = ("name", "original_name", "original_bytes", "stored_bytes", "width", "height", "created")
+
+    def has_add_permission(self, request):
+        return False
@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class CatalogConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "catalog"
-    verbose_name = "Catalog (Communities, Plans, Homes, Gallery, Leads)"
\ No newline at end of file
+    verbose_name = "Catalog (Communities, Plans, Homes, Gallery, Leads)"
+
+    def ready(self):
+        from . import signals  # noqa: F401
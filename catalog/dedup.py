@@ -0,0 +1,115 @@
+# -----------------------------------------------------------------------------
+# catalog/dedup.py  (content-hash reuse of stored images)
+# -----------------------------------------------------------------------------
+# Staff often upload the same photo to a community, a plan and a home, and the
+# same banner to several share pages. Uploads are hashed (SHA-256 of the bytes
+# as uploaded, before normalization) and the hash is kept on the row
+# (Photo.content_hash, <model>.share_banner_hash). When a matching hash is
+# already stored, the new row points at that file (and, for photos, at its
+# renditions) instead of storing and processing another copy.
+#
+# Because files can be shared, deleting one is reference-counted: release()
+# deletes a file only once no FileField in the project names it any more.
+import hashlib
+import logging
+
+from django.apps import apps
+from django.db import models, transaction
+
+from .ingest import store_normalized
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def content_hash(field_file):
+    """SHA-256 hex digest of the bytes behind an upload or a stored file."""
+    digest = hashlib.sha256()
+    if field_file._committed:
+        with field_file.storage.open(field_file.name, "rb") as stored:
+            for chunk in iter(lambda: stored.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+    else:
+        upload = field_file.file
+        upload.seek(0)
+        for chunk in iter(lambda: upload.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+        upload.seek(0)
+    return digest.hexdigest()
+
+
+def file_fields():
+    """(model, field) for every FileField/ImageField in the project."""
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, models.FileField):
+                yield model, field
+
+
+def reference_count(name):
+    """How many rows, across every file field, store `name`."""
+    return sum(model._base_manager.filter(**{field.name: name}).count() for model, field in file_fields())
+
+
+def photo_twins(hashes):
+    """{hash: Photo} for stored photos already holding any of `hashes`."""
+    from .models import Photo  # models imports this module
+
+    qs = Photo.objects.filter(content_hash__in=[h for h in hashes if h]).exclude(image="")
+    return {photo.content_hash: photo for photo in qs.only("image", "width", "height", "renditions", "content_hash")}
+
+
+def banner_twin(digest):
+    """Stored name of a share banner with this hash on any share model, or None."""
+    from .models import AvailableHome, CombinedClientSharePage, Community, FloorPlan
+
+    for model in (Community, FloorPlan, AvailableHome, CombinedClientSharePage):
+        name = (
+            model._base_manager.filter(share_banner_hash=digest)
+            .exclude(share_banner_image="")
+            .exclude(share_banner_image__isnull=True)
+            .values_list("share_banner_image", flat=True)
+            .first()
+        )
+        if name:
+            return name
+    return None
+
+
+def store_share_banner(instance):
+    """
+    Hash a newly uploaded share_banner_image; point at an existing banner
+    with the same bytes, or normalize and store the upload.
+    """
+    banner = instance.share_banner_image
+    instance.share_banner_hash = content_hash(banner)
+    twin = banner_twin(instance.share_banner_hash)
+    if twin:
+        instance.share_banner_image = twin
+    else:
+        store_normalized(banner)
+
+
+def release(storage, name, renditions=None):
+    """
+    Once the current transaction commits, delete `name` (and its rendition
+    files) if nothing references it any more. Safe to call for files that
+    are still shared: they are left alone.
+    """
+    if not name:
+        return
+
+    def delete_if_unreferenced():
+        if reference_count(name):
+            return
+        paths = {name}
+        for entry in (renditions or {}).values():
+            paths.update(value for value in entry.values() if isinstance(value, str))
+        for path in paths:
+            try:
+                storage.delete(path)
+            except Exception:
+                logger.exception("Could not delete released file %s", path)
+
+    transaction.on_commit(delete_if_unreferenced)
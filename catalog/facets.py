@@ -0,0 +1,182 @@
+# -----------------------------------------------------------------------------
+# catalog/facets.py  (filter state + facet counts for the Available Homes list)
+# -----------------------------------------------------------------------------
+# Facet counts come from a single GROUP BY over every facet dimension (the
+# "cube"); each facet is then summed in Python with every *other* active
+# filter applied, so picking a status still shows counts for the rest. The
+# result is cached per normalized filter state and dropped whenever an
+# AvailableHome or Community changes (see catalog/signals.py).
+import hashlib
+import json
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from core import generations
+
+from .models import HomeStatus
+from .search import search_queryset
+
+BED_BUCKETS = (1, 2, 3, 4, 5)
+
+# Price bands are ceilings, matching the list view's `max_price` filter.
+PRICE_BANDS = (
+    (400000, "Up to $400k"),
+    (600000, "Up to $600k"),
+    (800000, "Up to $800k"),
+    (1000000, "Up to $1M"),
+)
+
+MAX_PRICE_DIGITS = 10
+CENTS = Decimal("0.01")
+
+FACET_CACHE_TIMEOUT = 60 * 10
+GENERATION = "home-facets"
+
+
+def home_filter_state(params):
+    """
+    Normalize the list view's GET params. Invalid values are dropped, so
+    "?beds=abc" and "?" share one cache entry.
+    """
+    state = {}
+    status = params.get("status")
+    if status in dict(HomeStatus.choices):
+        state["status"] = status
+    beds = params.get("beds", "").strip()
+    # Same guard as employee_portal/filters.py's _int(): isdigit() alone
+    # accepts "²" and other digits int() rejects.
+    if beds.isascii() and beds.isdigit() and len(beds) <= 18:
+        state["beds"] = int(beds)
+    max_price = params.get("max_price", "").replace(",", "").replace("$", "").strip()
+    if max_price:
+        # AvailableHome.price holds at most 10 whole digits, so a bigger
+        # ceiling excludes nothing and is dropped; checking the exponent first
+        # also keeps "1e5000000" away from quantize()/normalize().
+        try:
+            value = Decimal(max_price)
+            if value.is_finite() and value >= 0 and value.adjusted() < MAX_PRICE_DIGITS:
+                state["max_price"] = format(value.quantize(CENTS).normalize(), "f")
+        except ArithmeticError:
+            pass
+    city = params.get("city", "").strip()
+    if city:
+        state["city"] = city.lower()
+    community = params.get("community", "").strip()
+    if community:
+        state["community"] = community
+    q = " ".join(params.get("q", "").split())
+    if q:
+        state["q"] = q.lower()
+    return state
+
+
+def apply_home_filters(qs, state):
+    if "status" in state:
+        qs = qs.filter(status=state["status"])
+    if "beds" in state:
+        qs = qs.filter(beds__gte=state["beds"])
+    if "max_price" in state:
+        qs = qs.filter(price__lte=Decimal(state["max_price"]))
+    if "city" in state:
+        qs = qs.filter(city__icontains=state["city"])
+    if "community" in state:
+        qs = qs.filter(community__slug=state["community"])
+    if "q" in state:
+        q = state["q"]
+        qs = search_queryset(qs, q, Q(address_1__icontains=q) | Q(description__icontains=q))
+    return qs
+
+
+def _cube(qs, state):
+    # Only the text search runs in SQL; every facet filter is re-applied per
+    # facet in Python. One row per distinct combination, so the row count is
+    # bounded by the inventory size, not multiplied by the number of facets.
+    if "q" in state:
+        qs = apply_home_filters(qs, {"q": state["q"]})
+    rows = (
+        qs.order_by()
+        .values("status", "beds", "price", "city", "community__slug", "community__name")
+        .annotate(n=Count("pk"))
+    )
+    return list(rows)
+
+
+def _matches(row, state, skip):
+    if skip != "status" and "status" in state and row["status"] != state["status"]:
+        return False
+    if skip != "beds" and "beds" in state and row["beds"] < state["beds"]:
+        return False
+    if skip != "price" and "max_price" in state:
+        if row["price"] is None or row["price"] > Decimal(state["max_price"]):
+            return False
+    if skip != "city" and "city" in state and state["city"] not in (row["city"] or "").lower():
+        return False
+    if skip != "community" and "community" in state and row["community__slug"] != state["community"]:
+        return False
+    return True
+
+
+def _summarize(rows, state):
+    status_counts = dict.fromkeys(dict(HomeStatus.choices), 0)
+    bed_counts = dict.fromkeys(BED_BUCKETS, 0)
+    city_counts = {}
+    community_counts = {}
+    price_counts = dict.fromkeys([ceiling for ceiling, _label in PRICE_BANDS], 0)
+    total = 0
+
+    for row in rows:
+        n = row["n"]
+        if _matches(row, state, "status"):
+            status_counts[row["status"]] = status_counts.get(row["status"], 0) + n
+        if _matches(row, state, "beds"):
+            for bucket in BED_BUCKETS:
+                if row["beds"] >= bucket:
+                    bed_counts[bucket] += n
+        if _matches(row, state, "city"):
+            city = (row["city"] or "").strip()
+            if city:
+                city_counts[city] = city_counts.get(city, 0) + n
+        if _matches(row, state, "community"):
+            slug = row["community__slug"]
+            label, count = community_counts.get(slug, (row["community__name"], 0))
+            community_counts[slug] = (label, count + n)
+        if _matches(row, state, "price") and row["price"] is not None:
+            for ceiling in price_counts:
+                if row["price"] <= ceiling:
+                    price_counts[ceiling] += n
+        if _matches(row, state, None):
+            total += n
+
+    return {
+        "total": total,
+        "status": [(value, label, status_counts.get(value, 0)) for value, label in HomeStatus.choices],
+        "beds": [(bucket, f"{bucket}+ bd", bed_counts[bucket]) for bucket in BED_BUCKETS],
+        "price": [(ceiling, label, price_counts[ceiling]) for ceiling, label in PRICE_BANDS],
+        "city": sorted(city_counts.items(), key=lambda item: item[0].lower()),
+        "community": sorted(
+            ((slug, label, count) for slug, (label, count) in community_counts.items()),
+            key=lambda item: item[1].lower(),
+        ),
+    }
+
+
+def _cache_key(state):
+    generation = generations.current(GENERATION)
+    digest = hashlib.md5(json.dumps(state, sort_keys=True).encode()).hexdigest()
+    return f"catalog:home-facets:{generation}:{digest}"
+
+
+def home_facets(qs, state):
+    """Facet counts for `state`, computed with one aggregate query and cached."""
+    key = _cache_key(state)
+    facets = cache.get(key)
+    if facets is None:
+        facets = _summarize(_cube(qs, state), state)
+        cache.set(key, facets, FACET_CACHE_TIMEOUT)
+    return facets
+
+
+def invalidate_home_facets():
+    generations.bump(GENERATION)
@@ -0,0 +1,61 @@
+# -----------------------------------------------------------------------------
+# catalog/featured.py  (materialized homepage slate)
+# -----------------------------------------------------------------------------
+# The homepage shows up to three featured communities, plans and homes, with
+# a fallback to the first three of each when nothing is featured. The slate is
+# built once per worker and rebuilt only when the "featured-slate" generation
+# moves: catalog/signals.py bumps it on save/delete, and the admin
+# make_featured/clear_featured actions (queryset.update, no signals) call
+# catalog.signals.rows_updated().
+import threading
+
+from django.db.models import Count
+
+from core import generations
+
+from .models import AvailableHome, Community, FloorPlan
+
+GENERATION = "featured-slate"
+SLATE_SIZE = 3
+
+_lock = threading.Lock()
+_state = {"generation": None, "slate": None}
+
+
+def build_featured_slate():
+    # With signed storage URLs the cards build their image URL from cover_photo.
+    communities = Community.objects.select_related("cover_photo")
+    featured_communities = list(communities.filter(is_featured=True).order_by("featured_rank", "name")[:SLATE_SIZE])
+    if not featured_communities:
+        featured_communities = list(communities[:SLATE_SIZE])
+
+    plans = FloorPlan.objects.select_related("cover_photo").annotate(community_count=Count("available_in", distinct=True)).order_by("name")
+    featured_plans = list(plans.filter(is_featured=True).order_by("featured_rank", "name")[:SLATE_SIZE])
+    if not featured_plans:
+        featured_plans = list(plans[:SLATE_SIZE])
+
+    homes = AvailableHome.objects.select_related("community", "cover_photo")
+    featured_homes = list(homes.filter(is_featured=True).order_by("featured_rank", "-created")[:SLATE_SIZE])
+    if not featured_homes:
+        featured_homes = list(homes[:SLATE_SIZE])
+
+    return {
+        "featured_communities": tuple(featured_communities),
+        "featured_plans": tuple(featured_plans),
+        "featured_homes": tuple(featured_homes),
+    }
+
+
+def featured_slate():
+    """{"featured_communities": (...), "featured_plans": (...), "featured_homes": (...)}"""
+    generation = generations.current(GENERATION)
+    if _state["generation"] == generation:
+        return _state["slate"]
+    with _lock:
+        if _state["generation"] != generation:
+            _state.update(slate=build_featured_slate(), generation=generation)
+    return _state["slate"]
+
+
+def invalidate_featured():
+    generations.bump(GENERATION)
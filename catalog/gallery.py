@@ -0,0 +1,114 @@
+# -----------------------------------------------------------------------------
+# catalog/gallery.py  (paged photo galleries: first screenful + JSON API)
+# -----------------------------------------------------------------------------
+# A community can carry hundreds of photos; rendering every one (twice: grid
+# and lightbox carousel) made detail and share pages multi-megabyte. Pages
+# now render FIRST_PAGE photos and static/js/gallery-loader.js fetches the
+# rest from the gallery API as the visitor scrolls:
+#
+#   /api/gallery/                          every catalog photo, newest first
+#   /api/gallery/<communities|plans|homes>/<slug>/   one object, gallery order
+#
+# Both are keyset-paginated (core/pagination.py): ?cursor= from the previous
+# page's "next" URL, ?limit= up to MAX_PAGE_SIZE.
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Exists, OuterRef
+from django.urls import reverse
+
+from core.pagination import KeysetPaginator
+
+from .models import AvailableHome, Community, FloorPlan, Photo
+from .renditions import RENDITIONS
+
+FIRST_PAGE = 12
+PAGE_SIZE = 24
+MAX_PAGE_SIZE = 60
+OWNER_ORDERING = ("sort_order", "id")
+SITE_ORDERING = ("-id",)
+PHOTO_FIELDS = ("image", "width", "height", "renditions", "caption", "sort_order", "content_hash")
+
+# URL segment -> (model, page-cache tag prefix)
+OWNERS = {
+    "communities": (Community, "community"),
+    "plans": (FloorPlan, "plan"),
+    "homes": (AvailableHome, "home"),
+}
+OWNER_KINDS = {model: kind for kind, (model, _prefix) in OWNERS.items()}
+
+
+def owner_photos(obj):
+    return Photo.objects.filter(
+        content_type=ContentType.objects.get_for_model(obj), object_id=obj.pk
+    ).only(*PHOTO_FIELDS)
+
+
+def site_photos():
+    """Photos of every catalog object, one row per stored file (dedup'd copies are skipped)."""
+    content_types = ContentType.objects.get_for_models(*(model for model, _prefix in OWNERS.values())).values()
+    earlier_copy = Photo.objects.filter(content_hash=OuterRef("content_hash"), pk__lt=OuterRef("pk")).exclude(
+        content_hash=""
+    )
+    return (
+        Photo.objects.filter(content_type__in=content_types)
+        .exclude(Exists(earlier_copy))
+        .only(*PHOTO_FIELDS, "content_type", "object_id")
+    )
+
+
+def api_url(obj=None):
+    if obj is None:
+        return reverse("catalog:site_gallery_api")
+    return reverse("catalog:gallery_api", args=[OWNER_KINDS[type(obj)], obj.slug])
+
+
+def page_size(value, default=PAGE_SIZE):
+    try:
+        return max(1, min(int(value), MAX_PAGE_SIZE))
+    except (TypeError, ValueError):
+        return default
+
+
+def next_url(base_url, page, limit=None):
+    if not page.has_next():
+        return None
+    query = f"cursor={page.next_cursor}"
+    if limit:
+        query += f"&limit={limit}"
+    return f"{base_url}?{query}"
+
+
+def first_page(obj=None, per_page=FIRST_PAGE):
+    """
+    {"photos": [...], "next_url": ...} for the server-rendered part of obj's
+    gallery (the site-wide one without obj); templates hand next_url to
+    gallery-loader.js.
+    """
+    if obj is None:
+        paginator = KeysetPaginator(site_photos(), per_page, SITE_ORDERING)
+    else:
+        paginator = KeysetPaginator(owner_photos(obj), per_page, OWNER_ORDERING)
+    page = paginator.page()
+    return {"photos": page.object_list, "next_url": next_url(api_url(obj), page, PAGE_SIZE)}
+
+
+def photo_payload(photo):
+    """What gallery-loader.js needs to draw a photo like {% photo_picture %} does."""
+    renditions = {}
+    for name, _width in RENDITIONS:
+        entry = (photo.renditions or {}).get(name)
+        if entry:
+            renditions[name] = {
+                "width": entry["width"],
+                "height": entry["height"],
+                "url": photo.rendition_url(name),
+            }
+    return {
+        "id": photo.pk,
+        "caption": photo.caption,
+        "width": photo.width,
+        "height": photo.height,
+        "url": photo.image_url,
+        "renditions": renditions,
+        "srcset": photo.srcset("jpeg"),
+        "webp_srcset": photo.srcset("webp"),
+    }
@@ -0,0 +1,148 @@
+# -----------------------------------------------------------------------------
+# catalog/ingest.py  (normalize uploaded originals before they are stored)
+# -----------------------------------------------------------------------------
+# Camera originals arrive at 8-20 MB with full EXIF (including GPS). Before
+# an image is stored we bake in the EXIF orientation, drop metadata (the ICC
+# profile is kept so colours don't shift), cap the longest edge and
+# re-encode: JPEG at JPEG_QUALITY, or optimized PNG when there is
+# transparency. Byte counts before/after go to NormalizedImage.
+#
+# Used by Photo.save() / the share_banner_image fields on upload, and by the
+# normalize_images command for media stored before this existed.
+import io
+import logging
+import posixpath
+from dataclasses import dataclass
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+MAX_EDGE = 3200
+JPEG_QUALITY = 85
+
+
+@dataclass
+class NormalizedUpload:
+    name: str
+    content: ContentFile | None  # None: already normalized, keep the file as-is
+    original_bytes: int
+    stored_bytes: int
+    width: int
+    height: int
+
+
+def _has_alpha(img):
+    return img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+
+
+def normalize_image(field_file):
+    """
+    NormalizedUpload for the file behind `field_file` (an upload or a stored
+    object), or None when it can't be decoded. A metadata-free, upright JPEG
+    within MAX_EDGE is left byte-for-byte alone (`content` is None).
+    """
+    if field_file._committed:
+        with field_file.storage.open(field_file.name, "rb") as stored:
+            raw = stored.read()
+    else:
+        # Don't close the upload: a temporary upload file is deleted on close.
+        upload = field_file.file
+        upload.seek(0)
+        raw = upload.read()
+        upload.seek(0)
+    try:
+        with Image.open(io.BytesIO(raw)) as img:
+            if getattr(img, "is_animated", False):
+                return None
+            exif = img.getexif()
+            has_metadata = bool(exif) or any(key in img.info for key in ("exif", "xmp", "XML:com.adobe.xmp", "comment"))
+            too_big = max(img.size) > MAX_EDGE
+            if img.format == "JPEG" and not has_metadata and not too_big:
+                return NormalizedUpload(
+                    name=field_file.name,
+                    content=None,
+                    original_bytes=len(raw),
+                    stored_bytes=len(raw),
+                    width=img.width,
+                    height=img.height,
+                )
+
+            icc_profile = img.info.get("icc_profile")
+            out = ImageOps.exif_transpose(img)
+            if too_big:
+                out.thumbnail((MAX_EDGE, MAX_EDGE), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+            buf = io.BytesIO()
+            if _has_alpha(out):
+                fmt, ext, options = "PNG", ".png", {"optimize": True}
+                out = out.convert("RGBA") if out.mode != "RGBA" else out
+            else:
+                fmt, ext = "JPEG", ".jpg"
+                options = {"quality": JPEG_QUALITY, "optimize": True, "progressive": True}
+                out = out.convert("RGB") if out.mode != "RGB" else out
+            if icc_profile:
+                options["icc_profile"] = icc_profile
+            # No exif= argument: Pillow writes no EXIF/XMP unless asked to.
+            out.save(buf, fmt, **options)
+            width, height = out.size
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        logger.exception("Could not normalize %s", field_file.name)
+        return None
+
+    stem, _ext = posixpath.splitext(posixpath.basename(field_file.name))
+    data = buf.getvalue()
+    return NormalizedUpload(
+        name=f"{stem}{ext}",
+        content=ContentFile(data),
+        original_bytes=len(raw),
+        stored_bytes=len(data),
+        width=width,
+        height=height,
+    )
+
+
+def store_normalized(field_file, record=True):
+    """
+    Normalize `field_file` and store the result through the field (so
+    upload_to applies), recording the byte counts. Files that need no work
+    are stored/kept as-is but still recorded. Returns the NormalizedImage row
+    (unsaved with record=False, for callers that bulk_create them), or None
+    if the file isn't a readable image. A stored object that gets replaced
+    is not deleted here.
+    """
+    from .models import NormalizedImage  # models imports this module
+
+    result = normalize_image(field_file)
+    original_name = field_file.name
+    if result is None or result.content is None:
+        if not field_file._committed:
+            field_file.save(field_file.name, field_file.file, save=False)
+        if result is None:
+            return None
+    else:
+        field_file.save(result.name, result.content, save=False)
+    values = {
+        "original_name": original_name,
+        "original_bytes": result.original_bytes,
+        "stored_bytes": result.stored_bytes,
+        "width": result.width,
+        "height": result.height,
+    }
+    if not record:
+        return NormalizedImage(name=field_file.name, **values)
+    normalized, _created = NormalizedImage.objects.update_or_create(name=field_file.name, defaults=values)
+    return normalized
+
+
+def save_normalized_records(records):
+    """bulk_create the unsaved rows from store_normalized(record=False)."""
+    from .models import NormalizedImage
+
+    NormalizedImage.objects.bulk_create(
+        [r for r in records if r is not None],
+        update_conflicts=True,
+        unique_fields=["name"],
+        update_fields=["original_name", "original_bytes", "stored_bytes", "width", "height", "updated"],
+    )
@@ -0,0 +1,42 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# catalog/management/commands/build_og_cards.py
+# ──────────────────────────────────────────────────────────────────────────────
+# Backfill link-preview cards (catalog/og_cards.py) for objects saved before
+# cards existed, or redraw all of them with --force. Cards are only drawn
+# for what changed, so re-running is cheap. Pages showing a new card are
+# purged afterwards.
+from django.core.management.base import BaseCommand
+
+from catalog.models import AvailableHome, CombinedClientSharePage, Community, FloorPlan
+from catalog.og_cards import refresh_og_card
+from catalog.signals import rows_updated
+from core import page_cache
+
+
+class Command(BaseCommand):
+    help = "Render Open Graph cards for communities, plans, homes and combined share pages"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Redraw cards that are already current")
+        parser.add_argument("--shared-only", action="store_true", help="Only objects with sharing enabled")
+
+    def handle(self, *args, **opts):
+        for model in (Community, FloorPlan, AvailableHome, CombinedClientSharePage):
+            qs = model.objects.order_by("pk")
+            if opts["shared_only"]:
+                qs = qs.filter(share_enabled=True)
+            if model is CombinedClientSharePage:
+                qs = qs.select_related("home__cover_photo")
+            else:
+                qs = qs.select_related("cover_photo")
+
+            drawn = []
+            for obj in qs.iterator(chunk_size=200):
+                if refresh_og_card(obj, force=opts["force"]):
+                    drawn.append(obj.pk)
+            if model is CombinedClientSharePage:
+                page_cache.bump(*(f"combined:{pk}" for pk in drawn))
+            elif drawn:
+                rows_updated(model, drawn)
+            self.stdout.write(f"{model.__name__}: {len(drawn)} cards drawn.")
+        self.stdout.write(self.style.SUCCESS("Done."))
@@ -0,0 +1,69 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# catalog/management/commands/build_photo_renditions.py
+# ──────────────────────────────────────────────────────────────────────────────
+# Backfill Photo.renditions for photos uploaded before renditions existed (or
+# rebuild all of them with --all after changing RENDITIONS/FORMATS). Decoding
+# and resizing are CPU-bound, so photos are spread over a process pool.
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from catalog.models import Photo
+from catalog.renditions import build_renditions
+from catalog.signals import photos_updated
+
+
+def _init_worker():
+    # Needed under the "spawn" start method; a no-op for forked workers.
+    import django
+
+    django.setup()
+
+
+def _render(pk):
+    photo = Photo.objects.filter(pk=pk).first()
+    if photo is None or not photo.image:
+        return pk, False
+    renditions = build_renditions(photo.image)
+    if not renditions:
+        return pk, False
+    # update(): no post_save, so `updated` and the signals are left alone.
+    Photo.objects.filter(pk=pk).update(renditions=renditions)
+    return pk, True
+
+
+class Command(BaseCommand):
+    help = "Build resized WebP/JPEG renditions for existing photos"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Rebuild photos that already have renditions")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+        parser.add_argument("--chunk-size", type=int, default=8, help="Photos handed to a worker at a time")
+
+    def handle(self, *args, **opts):
+        qs = Photo.objects.exclude(image="")
+        if not opts["all"]:
+            qs = qs.filter(renditions={})
+        pks = list(qs.order_by("pk").values_list("pk", flat=True))
+        if not pks:
+            self.stdout.write("Nothing to do.")
+            return
+
+        # Forked workers must not share the parent's DB connection.
+        connections.close_all()
+        built = failed = 0
+        with ProcessPoolExecutor(max_workers=max(1, opts["workers"]), initializer=_init_worker) as pool:
+            for pk, ok in pool.map(_render, pks, chunksize=max(1, opts["chunk_size"])):
+                if ok:
+                    built += 1
+                else:
+                    failed += 1
+                    self.stderr.write(f"Photo {pk}: no renditions built")
+                if (built + failed) % 100 == 0:
+                    self.stdout.write(f"{built + failed}/{len(pks)}")
+
+        # Cards store the cover's "card" rendition URL; point them at the new files.
+        photos_updated(pks)
+        self.stdout.write(self.style.SUCCESS(f"Built renditions for {built} photo(s); {failed} failed."))
@@ -0,0 +1,113 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# catalog/management/commands/normalize_images.py
+# ──────────────────────────────────────────────────────────────────────────────
+# Run catalog/ingest.py over images stored before upload-time normalization
+# existed: Photo.image and every share_banner_image. Rows are walked in pk
+# batches; files already listed in NormalizedImage are skipped unless --all.
+#
+# Dedup (catalog/dedup.py) lets several rows share one stored file. A shared
+# file is normalized once and every row pointing at it, across the targets
+# with the same field, moves to the new name together.
+from django.core.management.base import BaseCommand
+
+from catalog.dedup import release
+from catalog.ingest import normalize_image, store_normalized
+from catalog.models import AvailableHome, CombinedClientSharePage, Community, FloorPlan, NormalizedImage, Photo
+from catalog.signals import photos_updated, rows_updated
+
+TARGETS = (
+    (Photo, "image"),
+    (Community, "share_banner_image"),
+    (FloorPlan, "share_banner_image"),
+    (AvailableHome, "share_banner_image"),
+    (CombinedClientSharePage, "share_banner_image"),
+)
+
+
+class Command(BaseCommand):
+    help = "Normalize stored photos and share banners (orientation, metadata, size, quality)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--all", action="store_true", help="Include files already normalized")
+        parser.add_argument("--dry-run", action="store_true", help="Report savings without writing anything")
+        parser.add_argument(
+            "--delete-originals",
+            action="store_true",
+            help="Delete each replaced file once no row points at it (shared files are kept)",
+        )
+
+    def handle(self, *args, **opts):
+        total_before = total_after = 0
+        # {old name: new name} for files already normalized this run; rows
+        # loaded before their file moved are skipped.
+        self.renamed = {}
+        changed = {model: [] for model, _field_name in TARGETS}
+        for model, field_name in TARGETS:
+            qs = model.objects.exclude(**{field_name: ""}).exclude(**{f"{field_name}__isnull": True})
+            if not opts["all"]:
+                qs = qs.exclude(**{f"{field_name}__in": NormalizedImage.objects.values("name")})
+            columns = ["pk", field_name] + (["renditions"] if model is Photo else [])
+            last_pk = 0
+            while True:
+                batch = list(qs.filter(pk__gt=last_pk).order_by("pk").only(*columns)[: opts["batch_size"]])
+                if not batch:
+                    break
+                last_pk = batch[-1].pk
+                for obj in batch:
+                    before, after = self._normalize(model, field_name, obj, opts, changed)
+                    if after is not None:
+                        total_before += before
+                        total_after += after
+                self.stdout.write(
+                    f"{model.__name__}.{field_name}: through pk {last_pk}, {len(changed[model])} rows updated"
+                )
+
+        if not opts["dry_run"]:
+            for model, pks in changed.items():
+                if pks and model is Photo:
+                    photos_updated(pks)
+                elif pks:
+                    rows_updated(model, pks)
+
+        verb = "Would save" if opts["dry_run"] else "Saved"
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} {total_before - total_after:,} bytes ({total_before:,} -> {total_after:,}).")
+        )
+
+    def _normalize(self, model, field_name, obj, opts, changed):
+        field_file = getattr(obj, field_name)
+        old_name = field_file.name
+        if old_name in self.renamed:
+            return 0, None
+        try:
+            if opts["dry_run"]:
+                result = normalize_image(field_file)
+                if result is None or result.content is None:
+                    return 0, None
+                return result.original_bytes, result.stored_bytes
+            record = store_normalized(field_file)
+        except Exception as exc:
+            self.stderr.write(f"{model.__name__} {obj.pk}: {old_name}: {exc}")
+            return 0, None
+        if record is None or field_file.name == old_name:
+            # Unreadable, or already normalized (now recorded, so skipped next run).
+            return 0, None
+
+        # update(): keep `updated` and the save() side effects out of a bulk job.
+        self.renamed[old_name] = field_file.name
+        fields = {field_name: field_file.name}
+        old_renditions = None
+        if model is Photo:
+            old_renditions = obj.renditions
+            obj.process_image()
+            fields.update(width=obj.width, height=obj.height, renditions=obj.renditions)
+        for target, target_field in TARGETS:
+            if target_field != field_name:
+                continue
+            sharing = target.objects.filter(**{field_name: old_name})
+            changed[target].extend(sharing.values_list("pk", flat=True))
+            sharing.update(**fields)
+        if opts["delete_originals"]:
+            release(field_file.storage, old_name, old_renditions)
+        return record.original_bytes, record.stored_bytes
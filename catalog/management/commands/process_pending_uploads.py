@@ -0,0 +1,94 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# catalog/management/commands/process_pending_uploads.py
+# ──────────────────────────────────────────────────────────────────────────────
+# Finish photos the portal stored straight from the browser (direct uploads,
+# Photo.pending). Hashing, dedup, normalizing and renditions all read the
+# object back from the bucket, so the request only records the key and this
+# does the rest; pages show the raw original until then.
+#
+# It also draws link-preview cards (catalog/og_cards.py) for rows that have
+# none: the portal's inventory import upserts with bulk_create, which sends
+# no post_save, and blanks og_card_key on every row it writes.
+#
+# Run from cron every minute, or as a worker process with --loop. Run one at
+# a time (e.g. under flock): two runs could pick up the same row.
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+
+from catalog.models import AvailableHome, Community, FloorPlan, Photo
+from catalog.og_cards import refresh_og_cards
+from catalog.signals import rows_updated
+
+logger = logging.getLogger(__name__)
+
+CARD_MODELS = (Community, FloorPlan, AvailableHome)
+
+
+class Command(BaseCommand):
+    help = "Finish direct photo uploads and draw missing link-preview cards"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=20, help="Rows loaded per query")
+        parser.add_argument("--loop", action="store_true", help="Keep running; sleep when nothing is pending")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds to sleep when idle (--loop)")
+
+    def handle(self, *args, **opts):
+        batch_size = max(1, opts["batch_size"])
+        totals = [0, 0, 0]
+        try:
+            while True:
+                counts = (*self.finish_photos(batch_size), self.draw_cards(batch_size))
+                totals = [total + count for total, count in zip(totals, counts)]
+                if not opts["loop"]:
+                    break
+                done, _failed, cards = counts
+                # Failures alone don't count as work: they'd be retried in a tight loop.
+                if not done and not cards:
+                    time.sleep(opts["interval"])
+        except KeyboardInterrupt:
+            pass
+        done, failed, cards = totals
+        self.stdout.write(self.style.SUCCESS(f"Done: {done} photos processed, {failed} failed, {cards} cards drawn."))
+
+    def finish_photos(self, batch_size):
+        """One pass over the pending photos; one that fails waits for the next pass."""
+        done = failed = last = 0
+        while True:
+            photos = list(Photo.objects.filter(pending=True, pk__gt=last).order_by("pk")[:batch_size])
+            if not photos:
+                return done, failed
+            for photo in photos:
+                last = photo.pk
+                try:
+                    photo.finish_upload()
+                except Exception:
+                    logger.exception("Could not process pending photo id=%s (%s)", photo.pk, photo.image.name)
+                    failed += 1
+                else:
+                    done += 1
+            self.stdout.write(f"Photos: processed {done}, failed {failed}.")
+
+    def draw_cards(self, batch_size):
+        """Cards for rows with a blank og_card_key; refresh_og_cards() logs its own failures."""
+        drawn = 0
+        for model in CARD_MODELS:
+            last = 0
+            while True:
+                qs = model.objects.filter(og_card_key="", pk__gt=last).select_related("cover_photo")
+                objs = list(qs.order_by("pk")[:batch_size])
+                if not objs:
+                    break
+                last = objs[-1].pk
+                for obj in objs:
+                    # Also redraws the combined share pages built on a home.
+                    refresh_og_cards(obj)
+                done = [obj.pk for obj in objs if obj.og_card_key]
+                if done:
+                    # Purged pages re-render with the new og:image.
+                    rows_updated(model, done)
+                    drawn += len(done)
+        if drawn:
+            self.stdout.write(f"Cards: drew {drawn}.")
+        return drawn
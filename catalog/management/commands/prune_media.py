@@ -0,0 +1,168 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# catalog/management/commands/prune_media.py
+# ──────────────────────────────────────────────────────────────────────────────
+# Delete stored media that no row points at any more: files of deleted photos
+# and cascaded owners, replaced share banners, originals swapped out by
+# normalize_images, renditions of old uploads, and direct uploads that were
+# never claimed by a form.
+#
+# Every FileField/ImageField in the project (plus the paths in
+# Photo.renditions) is read into one set of names, then storage is listed
+# under the fields' upload_to prefixes and anything not in the set and older
+# than --min-age-hours is deleted. Listings are streamed (S3 pages of 1000,
+# os.walk on disk) and S3 deletes go out as DeleteObjects batches of 1000.
+import os
+import posixpath
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from catalog.dedup import file_fields
+from catalog.models import Photo
+
+# DeleteObjects accepts at most 1000 keys per request.
+DELETE_BATCH = 1000
+
+
+def referenced_names():
+    """Every stored name a row still points at."""
+    names = set()
+    for model, field in file_fields():
+        qs = model._base_manager.exclude(**{field.name: ""}).exclude(**{f"{field.name}__isnull": True})
+        names.update(qs.values_list(field.name, flat=True).iterator(chunk_size=2000))
+    for renditions in Photo._base_manager.values_list("renditions", flat=True).iterator(chunk_size=2000):
+        for entry in (renditions or {}).values():
+            names.update(value for value in entry.values() if isinstance(value, str))
+    return names
+
+
+def storage_prefixes():
+    """Top-level folders the project writes media under."""
+    prefixes = {"renditions/"}
+    for _model, field in file_fields():
+        if isinstance(field.upload_to, str) and field.upload_to:
+            # Stop before any strftime placeholder, e.g. "photos/%Y/".
+            head = field.upload_to.split("%", 1)[0]
+            prefixes.add(head if head.endswith("/") else posixpath.dirname(head) + "/")
+        elif getattr(field.upload_to, "prefix", None):
+            # core.upload_paths callables.
+            prefixes.add(field.upload_to.prefix)
+    # Drop prefixes nested inside another one so nothing is listed twice.
+    return sorted(p for p in prefixes if p != "/" and not any(p != q and p.startswith(q) for q in prefixes))
+
+
+def _is_s3(storage):
+    return hasattr(storage, "bucket_name") and hasattr(storage, "connection")
+
+
+def _s3_key(storage, name):
+    location = getattr(storage, "location", "")
+    return posixpath.join(location, name) if location else name
+
+
+def iter_stored(storage, prefix):
+    """Yield (name, modified, size) for every object under `prefix`."""
+    if _is_s3(storage):
+        location = getattr(storage, "location", "")
+        strip = len(location) + 1 if location else 0
+        paginator = storage.connection.meta.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=storage.bucket_name, Prefix=_s3_key(storage, prefix)):
+            for obj in page.get("Contents", ()):
+                yield obj["Key"][strip:], obj["LastModified"], obj["Size"]
+        return
+
+    root = storage.path(prefix)
+    base = storage.path("")
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            name = os.path.relpath(path, base).replace(os.sep, "/")
+            yield name, datetime.fromtimestamp(stat.st_mtime, tz=dt_timezone.utc), stat.st_size
+
+
+class Deleter:
+    """Buffers names and deletes them DELETE_BATCH at a time on S3."""
+
+    def __init__(self, storage, stderr):
+        self.storage = storage
+        self.stderr = stderr
+        self.pending = []
+        self.deleted = 0
+
+    def add(self, name):
+        self.pending.append(name)
+        if len(self.pending) >= DELETE_BATCH:
+            self.flush()
+
+    def flush(self):
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        if not _is_s3(self.storage):
+            for name in batch:
+                self.storage.delete(name)
+            self.deleted += len(batch)
+            return
+        response = self.storage.connection.meta.client.delete_objects(
+            Bucket=self.storage.bucket_name,
+            Delete={"Objects": [{"Key": _s3_key(self.storage, name)} for name in batch], "Quiet": True},
+        )
+        errors = response.get("Errors", [])
+        for error in errors:
+            self.stderr.write(f"{error.get('Key')}: {error.get('Code')} {error.get('Message')}")
+        self.deleted += len(batch) - len(errors)
+
+
+class Command(BaseCommand):
+    help = "Delete stored media files that no database row references"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-age-hours",
+            type=float,
+            default=24,
+            help="Only delete files at least this old (protects uploads still in flight)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="List orphans without deleting anything")
+        parser.add_argument("--prefix", action="append", help="Only scan this prefix (repeatable)")
+        parser.add_argument("--verbose-names", action="store_true", help="Print every orphan found")
+
+    def handle(self, *args, **opts):
+        storage = default_storage
+        for model, field in file_fields():
+            if field.storage is not storage:
+                self.stderr.write(f"{model.__name__}.{field.name} uses another storage; not scanned.")
+
+        # Referenced names are read before listing, so a file saved mid-run is
+        # newer than the cutoff and never a candidate.
+        referenced = referenced_names()
+        cutoff = timezone.now() - timedelta(hours=opts["min_age_hours"])
+        prefixes = opts["prefix"] or storage_prefixes()
+        self.stdout.write(f"{len(referenced):,} referenced files; scanning {', '.join(prefixes)}")
+
+        deleter = Deleter(storage, self.stderr)
+        scanned = orphans = orphan_bytes = 0
+        for prefix in prefixes:
+            for name, modified, size in iter_stored(storage, prefix):
+                scanned += 1
+                if name in referenced or modified > cutoff:
+                    continue
+                orphans += 1
+                orphan_bytes += size
+                if opts["verbose_names"]:
+                    self.stdout.write(f"  {name}")
+                if not opts["dry_run"]:
+                    deleter.add(name)
+        deleter.flush()
+
+        if opts["dry_run"]:
+            summary = f"Would delete {orphans:,} of {scanned:,} files ({orphan_bytes:,} bytes)."
+        else:
+            summary = f"Deleted {deleter.deleted:,} of {scanned:,} files ({orphan_bytes:,} bytes)."
+        self.stdout.write(self.style.SUCCESS(summary))
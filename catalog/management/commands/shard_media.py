@@ -0,0 +1,158 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# catalog/management/commands/shard_media.py
+# ──────────────────────────────────────────────────────────────────────────────
+# Move files stored before the sharded upload_to callables (core/upload_paths.py)
+# into their shard folders: Photo.image (and its renditions) by content hash,
+# ClientFile.file by upload month.
+#
+# Resumable: rows already in a shard folder are skipped, so an interrupted run
+# just starts again (or pass --after PK). Each file is linked (local disk) or
+# copied to its new name first, the batch's rows are rewritten in one
+# transaction, and only then is the old name released, so a crash at any
+# point leaves every row pointing at a file that exists. Photos missing a
+# content hash get one on the way (which also lets dedup match them).
+import os
+import posixpath
+import shutil
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from catalog.dedup import content_hash, file_fields, release
+from catalog.models import Photo
+from catalog.signals import photos_updated
+from core.upload_paths import DateShardedPath, HashShardedPath
+
+
+def _local_path(storage, name):
+    try:
+        return storage.path(name)
+    except NotImplementedError:
+        return None
+
+
+def copy_stored(storage, old, target):
+    """
+    Store the bytes of `old` under `target` (or the next free name), without
+    touching `old`. Hard-links on local disk. Returns the new name, or None
+    if `old` is missing.
+    """
+    src = _local_path(storage, old)
+    if src is not None:
+        if not os.path.isfile(src):
+            return None
+        name = storage.get_available_name(target)
+        dst = storage.path(name)
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+        return name
+    if not storage.exists(old):
+        return None
+    with storage.open(old, "rb") as f:
+        return storage.save(target, f)
+
+
+class Command(BaseCommand):
+    help = "Move stored photos and client files into their sharded upload folders"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument("--after", type=int, default=0, help="Resume after this primary key")
+        parser.add_argument("--dry-run", action="store_true", help="Count files that would move")
+
+    def handle(self, *args, **opts):
+        for model, field in file_fields():
+            if isinstance(field.upload_to, (HashShardedPath, DateShardedPath)):
+                self._shard(model, field, opts)
+
+    def _shard(self, model, field, opts):
+        upload_to = field.upload_to
+        storage = field.storage
+        is_photo = model is Photo
+        columns = ["pk", field.name]
+        if is_photo:
+            columns += ["renditions", "content_hash"]
+        if isinstance(upload_to, DateShardedPath) and upload_to.date_field:
+            columns.append(upload_to.date_field)
+        qs = model._base_manager.exclude(**{field.name: ""}).order_by("pk").only(*columns)
+
+        # Names moved this run: rows sharing a deduplicated file move together.
+        moved = {}
+        total = missing = 0
+        last_pk = opts["after"]
+        while True:
+            batch = list(qs.filter(pk__gt=last_pk)[: opts["batch_size"]])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            pending = [obj for obj in batch if not upload_to.is_sharded(getattr(obj, field.name).name)]
+            if opts["dry_run"]:
+                total += len(pending)
+                continue
+
+            changed, released = [], []
+            for obj in pending:
+                old = getattr(obj, field.name).name
+                if old not in moved:
+                    moved[old] = self._move(storage, upload_to, obj, old, is_photo)
+                if moved[old] is None:
+                    missing += 1
+                    continue
+                new_name, new_renditions, digest = moved[old]
+                released.append((old, obj.renditions if is_photo else None))
+                setattr(obj, field.name, new_name)
+                if is_photo:
+                    obj.renditions, obj.content_hash = new_renditions, digest
+                changed.append(obj)
+
+            update_fields = [field.name] + (["renditions", "content_hash"] if is_photo else [])
+            with transaction.atomic():
+                model._base_manager.bulk_update(changed, update_fields)
+                for old, renditions in released:
+                    release(storage, old, renditions)
+            if is_photo and changed:
+                photos_updated([obj.pk for obj in changed])
+            total += len(changed)
+            self.stdout.write(f"{model.__name__}.{field.name}: through pk {last_pk}, {total} moved")
+
+        verb = "Would move" if opts["dry_run"] else "Moved"
+        note = f" ({missing} missing files left as they were)" if missing else ""
+        self.stdout.write(self.style.SUCCESS(f"{model.__name__}.{field.name}: {verb} {total} files{note}."))
+
+    def _move(self, storage, upload_to, obj, old, is_photo):
+        """(new name, renditions, content hash) once copied, or None if `old` is gone."""
+        digest = getattr(obj, "content_hash", "")
+        if is_photo and not digest:
+            try:
+                digest = obj.content_hash = content_hash(obj.image)
+            except (FileNotFoundError, OSError):
+                self.stderr.write(f"Missing: {old}")
+                return None
+        new_name = copy_stored(storage, old, upload_to(obj, posixpath.basename(old)))
+        if new_name is None:
+            self.stderr.write(f"Missing: {old}")
+            return None
+
+        renditions = {}
+        if is_photo:
+            # Renditions live under their original's name; follow it, keeping
+            # the digest folder they were built in (see catalog/renditions.py).
+            copies = {}
+            for key, entry in (obj.renditions or {}).items():
+                renditions[key] = dict(entry)
+                for fmt, path in entry.items():
+                    if not isinstance(path, str):
+                        continue
+                    if path not in copies:
+                        folder, filename = posixpath.split(path)
+                        target = posixpath.join("renditions", new_name, posixpath.basename(folder), filename)
+                        copies[path] = copy_stored(storage, path, target)
+                    if copies[path] is None:
+                        # Rendition file gone; rendition_url() falls back to the original.
+                        del renditions[key][fmt]
+                    else:
+                        renditions[key][fmt] = copies[path]
+        return new_name, renditions, digest
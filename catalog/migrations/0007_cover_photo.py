@@ -0,0 +1,110 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_cover_photos(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Photo = apps.get_model("catalog", "Photo")
+
+    for model_name in ("community", "floorplan", "availablehome"):
+        Model = apps.get_model("catalog", model_name)
+        content_type = ContentType.objects.filter(app_label="catalog", model=model_name).first()
+        if content_type is None:
+            continue
+        for obj in Model.objects.all().only("pk"):
+            photo = (
+                Photo.objects.filter(content_type=content_type, object_id=obj.pk)
+                .order_by("sort_order", "id")
+                .first()
+            )
+            if photo is None:
+                continue
+            try:
+                url = photo.image.url
+            except Exception:
+                url = ""
+            Model.objects.filter(pk=obj.pk).update(cover_photo=photo, cover_photo_url=url[:500])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0006_combinedclientsharepage"),
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="availablehome",
+            name="cover_photo",
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to="catalog.photo"),
+        ),
+        migrations.AddField(
+            model_name="availablehome",
+            name="cover_photo_height",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="availablehome",
+            name="cover_photo_url",
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name="availablehome",
+            name="cover_photo_width",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="community",
+            name="cover_photo",
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to="catalog.photo"),
+        ),
+        migrations.AddField(
+            model_name="community",
+            name="cover_photo_height",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="community",
+            name="cover_photo_url",
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name="community",
+            name="cover_photo_width",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="floorplan",
+            name="cover_photo",
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to="catalog.photo"),
+        ),
+        migrations.AddField(
+            model_name="floorplan",
+            name="cover_photo_height",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="floorplan",
+            name="cover_photo_url",
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name="floorplan",
+            name="cover_photo_width",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="photo",
+            name="height",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="photo",
+            name="width",
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(populate_cover_photos, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,133 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copies of catalog/search.py as it stood when this migration was
+# written, so later edits to that module don't change what it does.
+DOCUMENT_TABLE = "catalog_searchdocument"
+FTS_TABLE = "catalog_searchdocument_fts"
+
+INDEX_SQL = {
+    "postgresql": [
+        f"""
+        ALTER TABLE {DOCUMENT_TABLE} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(body, '')), 'B')
+        ) STORED
+        """,
+        f"CREATE INDEX catalog_searchdoc_vector_gin ON {DOCUMENT_TABLE} USING gin (search_vector)",
+    ],
+    "sqlite": [
+        f"""
+        CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+            title, body, content='{DOCUMENT_TABLE}', content_rowid='id', tokenize='porter unicode61'
+        )
+        """,
+        f"""
+        CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {DOCUMENT_TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body);
+        END
+        """,
+        f"""
+        CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {DOCUMENT_TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+        END
+        """,
+        f"""
+        CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON {DOCUMENT_TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+            INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body);
+        END
+        """,
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+    ],
+}
+
+DROP_SQL = {
+    "postgresql": [
+        "DROP INDEX IF EXISTS catalog_searchdoc_vector_gin",
+        f"ALTER TABLE {DOCUMENT_TABLE} DROP COLUMN IF EXISTS search_vector",
+    ],
+    "sqlite": [
+        f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+        f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+        f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+        f"DROP TABLE IF EXISTS {FTS_TABLE}",
+    ],
+}
+
+
+def document_text(obj):
+    title = " ".join(p for p in [getattr(obj, "name", ""), getattr(obj, "address_1", "")] if p)
+    parts = [
+        getattr(obj, "tagline", ""),
+        getattr(obj, "address_2", ""),
+        getattr(obj, "city", ""),
+        getattr(obj, "state", ""),
+        getattr(obj, "postal_code", ""),
+        getattr(obj, "description", ""),
+    ]
+    for section in getattr(obj, "info_sections", None) or []:
+        if not isinstance(section, dict):
+            continue
+        parts.append(section.get("header", ""))
+        parts.append(section.get("subheader", ""))
+        for item in section.get("items", None) or []:
+            if isinstance(item, dict):
+                parts.append(item.get("key", ""))
+                parts.append(item.get("value", ""))
+    body = "\n".join(str(p) for p in parts if p)
+    return title[:400], body
+
+
+def create_search_index(apps, schema_editor):
+    for statement in INDEX_SQL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    for statement in DROP_SQL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def populate_search_documents(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    SearchDocument = apps.get_model("catalog", "SearchDocument")
+
+    for model_name in ("community", "floorplan", "availablehome"):
+        Model = apps.get_model("catalog", model_name)
+        content_type, _ = ContentType.objects.get_or_create(app_label="catalog", model=model_name)
+        docs = []
+        for obj in Model.objects.all():
+            title, body = document_text(obj)
+            docs.append(SearchDocument(content_type=content_type, object_id=obj.pk, title=title, body=body))
+        SearchDocument.objects.bulk_create(docs, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0007_cover_photo"),
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                ("object_id", models.PositiveIntegerField()),
+                ("title", models.CharField(blank=True, max_length=400)),
+                ("body", models.TextField(blank=True)),
+                ("content_type", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="contenttypes.contenttype")),
+            ],
+            options={
+                "constraints": [models.UniqueConstraint(fields=("content_type", "object_id"), name="catalog_searchdoc_unique_object")],
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0008_search_document"),
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="photo",
+            index=models.Index(fields=["content_type", "object_id", "updated"], name="catalog_photo_owner_idx"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0009_photo_owner_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="photo",
+            name="renditions",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0010_photo_renditions"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NormalizedImage",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                ("name", models.CharField(max_length=500, unique=True)),
+                ("original_name", models.CharField(blank=True, max_length=500)),
+                ("original_bytes", models.PositiveBigIntegerField()),
+                ("stored_bytes", models.PositiveBigIntegerField()),
+                ("width", models.PositiveIntegerField()),
+                ("height", models.PositiveIntegerField()),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0011_normalized_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="availablehome",
+            name="share_banner_hash",
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="combinedclientsharepage",
+            name="share_banner_hash",
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="community",
+            name="share_banner_hash",
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="floorplan",
+            name="share_banner_hash",
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="photo",
+            name="content_hash",
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:54
+
+import core.upload_paths
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0012_content_hash"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="photo",
+            name="image",
+            field=models.ImageField(upload_to=core.upload_paths.HashShardedPath("photos/")),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0013_sharded_upload_paths"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="availablehome",
+            name="og_card",
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to="og_cards/"),
+        ),
+        migrations.AddField(
+            model_name="availablehome",
+            name="og_card_key",
+            field=models.CharField(blank=True, editable=False, max_length=40),
+        ),
+        migrations.AddField(
+            model_name="combinedclientsharepage",
+            name="og_card",
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to="og_cards/"),
+        ),
+        migrations.AddField(
+            model_name="combinedclientsharepage",
+            name="og_card_key",
+            field=models.CharField(blank=True, editable=False, max_length=40),
+        ),
+        migrations.AddField(
+            model_name="community",
+            name="og_card",
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to="og_cards/"),
+        ),
+        migrations.AddField(
+            model_name="community",
+            name="og_card_key",
+            field=models.CharField(blank=True, editable=False, max_length=40),
+        ),
+        migrations.AddField(
+            model_name="floorplan",
+            name="og_card",
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to="og_cards/"),
+        ),
+        migrations.AddField(
+            model_name="floorplan",
+            name="og_card_key",
+            field=models.CharField(blank=True, editable=False, max_length=40),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0014_og_cards"),
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="photo",
+            index=models.Index(fields=["content_type", "object_id", "sort_order", "id"], name="catalog_photo_gallery_idx"),
+        ),
+    ]
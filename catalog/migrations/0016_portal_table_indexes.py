@@ -0,0 +1,41 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0015_photo_gallery_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="availablehome",
+            index=models.Index(fields=["created", "id"], name="catalog_home_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="availablehome",
+            index=models.Index(fields=["address_1", "id"], name="catalog_home_address_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="availablehome",
+            index=models.Index(fields=["status", "id"], name="catalog_home_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="availablehome",
+            index=models.Index(fields=["price", "id"], name="catalog_home_price_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="combinedclientsharepage",
+            index=models.Index(fields=["title", "id"], name="catalog_combined_title_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="community",
+            index=models.Index(fields=["name", "id"], name="catalog_community_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="floorplan",
+            index=models.Index(fields=["name", "id"], name="catalog_floorplan_name_idx"),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:38
+
+import catalog.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0016_portal_table_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="availablehome",
+            name="og_card",
+            field=models.ImageField(blank=True, editable=False, null=True, storage=catalog.models.og_card_storage, upload_to="og_cards/"),
+        ),
+        migrations.AlterField(
+            model_name="combinedclientsharepage",
+            name="og_card",
+            field=models.ImageField(blank=True, editable=False, null=True, storage=catalog.models.og_card_storage, upload_to="og_cards/"),
+        ),
+        migrations.AlterField(
+            model_name="community",
+            name="og_card",
+            field=models.ImageField(blank=True, editable=False, null=True, storage=catalog.models.og_card_storage, upload_to="og_cards/"),
+        ),
+        migrations.AlterField(
+            model_name="floorplan",
+            name="og_card",
+            field=models.ImageField(blank=True, editable=False, null=True, storage=catalog.models.og_card_storage, upload_to="og_cards/"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0017_og_card_storage"),
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="photo",
+            name="pending",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="photo",
+            index=models.Index(condition=models.Q(("pending", True)), fields=["id"], name="catalog_photo_pending_idx"),
+        ),
+    ]
@@ -1,6 +1,8 @@
 # -----------------------------------------------------------------------------
 # catalog/models.py  (FULL FILE — adds is_featured & featured_rank on 3 models)
 # -----------------------------------------------------------------------------
+from django.conf import settings
+from django.core.files.storage import default_storage, storages
 from django.db import models
 from django.urls import reverse
 from django.utils.text import slugify
@@ -9,6 +11,14 @@ from django.contrib.contenttypes.models import ContentType
 import logging
 import uuid
 
+from core.storage_urls import file_url, is_placeholder, storage_url
+from core.upload_paths import HashShardedPath
+
+from .dedup import content_hash, photo_twins, release, store_share_banner
+from .ingest import store_normalized
+from .renditions import RENDITIONS, build_renditions
+from .templatetags.formatting import comma0
+
 logger = logging.getLogger(__name__)
 
 class TimeStamped(models.Model):
@@ -26,23 +36,230 @@ class Photo(TimeStamped):
     content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
     object_id = models.PositiveIntegerField()
     content_object = GenericForeignKey("content_type", "object_id")
-    image = models.ImageField(upload_to="photos/")
+    image = models.ImageField(upload_to=HashShardedPath("photos/"))
+    # Filled in on upload. Not wired to ImageField.width_field/height_field
+    # because that re-reads every file with empty dimensions on model init.
+    width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    # Resized WebP/JPEG variants; see catalog/renditions.py for the layout.
+    renditions = models.JSONField(default=dict, blank=True, editable=False)
+    # SHA-256 of the uploaded bytes; equal uploads share one stored file (catalog/dedup.py).
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True, editable=False)
+    # A direct upload whose hashing, normalizing and renditions haven't run
+    # yet (process_pending_uploads); pages show the raw original meanwhile.
+    pending = models.BooleanField(default=False, editable=False)
     caption = models.CharField(max_length=200, blank=True)
     sort_order = models.PositiveIntegerField(default=0)
     class Meta: # type: ignore
         ordering = ("sort_order", "id")
+        indexes = [
+            # Owner lookups: photo prefetches and the detail-page validators.
+            models.Index(fields=["content_type", "object_id", "updated"], name="catalog_photo_owner_idx"),
+            # Gallery pages: keyset seeks in (sort_order, id) order per owner.
+            models.Index(fields=["content_type", "object_id", "sort_order", "id"], name="catalog_photo_gallery_idx"),
+            # process_pending_uploads' queue.
+            models.Index(fields=["id"], condition=models.Q(pending=True), name="catalog_photo_pending_idx"),
+        ]
     def __str__(self):
         return self.caption or f"Photo #{self.pk}"
 
-    @property
-    def image_url(self):
-        if not self.image:
-            return ""
+    def save(self, *args, **kwargs):
+        if self.image and not self.image._committed:
+            # Normalize and store the original now (FileField.pre_save would
+            # store it anyway) so the renditions are on the row before
+            # post_save refreshes covers.
+            if not self.reuse_stored_image():
+                self.ingest_image()
+        return super().save(*args, **kwargs)
+
+    def reuse_stored_image(self):
+        """
+        Hash `image`; if a photo already stores the same bytes, point at its
+        file, dimensions and renditions instead. Returns True if reused.
+        """
+        self.content_hash = content_hash(self.image)
+        twin = photo_twins([self.content_hash]).get(self.content_hash)
+        if twin is None:
+            return False
+        self.share_image_of(twin)
+        return True
+
+    def share_image_of(self, twin):
+        self.image = twin.image.name
+        self.width, self.height = twin.width, twin.height
+        self.renditions = twin.renditions
+        self.content_hash = twin.content_hash
+
+    def ingest_image(self, record=True):
+        """
+        Normalize and store `image`, then fill in dimensions and renditions.
+        Returns the NormalizedImage (unsaved with record=False).
+        """
+        normalized = store_normalized(self.image, record=record)
+        self.process_image()
+        return normalized
+
+    def adopt_upload(self, name, record=True):
+        """
+        Point `image` at an object the browser uploaded straight to storage
+        and ingest it. The raw object is released once it has been replaced,
+        so a key another row still holds (a reclaimed token) is kept.
+        """
+        self.image = name
+        normalized = self.ingest_image(record=record)
+        if self.image.name != name:
+            release(self.image.storage, name)
+        return normalized
+
+    def finish_upload(self):
+        """
+        Process a pending direct upload: reuse a stored copy of the same bytes
+        or normalize it and build renditions, then save just those fields (a
+        caption edited meanwhile is kept). post_save refreshes the owner's
+        cover and pages; a replaced raw object is released.
+        """
+        if not self.reuse_stored_image():
+            self.adopt_upload(self.image.name)
+        self.pending = False
+        self.save(update_fields=["image", "width", "height", "renditions", "content_hash", "pending", "updated"])
+
+    def process_image(self):
+        """
+        Fill in dimensions and renditions for the stored image. For new
+        uploads the file is still in memory, so this is cheap.
+        """
         try:
-            return self.image.url
+            self.width, self.height = self.image.width, self.image.height
         except Exception:
-            logger.exception("Failed to build image URL for photo id=%s", self.pk)
-            return ""
+            logger.warning("Could not read dimensions for photo id=%s", self.pk)
+            self.width = self.height = None
+        self.renditions = build_renditions(self.image)
+
+    def rendition_url(self, name, fmt="jpeg"):
+        """URL of a named rendition, falling back to the original image."""
+        entry = self.renditions.get(name) if self.renditions else None
+        if not entry or not entry.get(fmt):
+            return self.image_url
+        return storage_url(self.image.storage, entry[fmt])
+
+    @property
+    def thumb_url(self):
+        return self.rendition_url("thumb")
+
+    @property
+    def full_url(self):
+        return self.rendition_url("full")
+
+    def srcset(self, fmt="jpeg"):
+        """"url 600w, url 1200w, ..." over the distinct renditions, or ""."""
+        seen = {}
+        for name, _width in RENDITIONS:
+            entry = (self.renditions or {}).get(name)
+            if entry and entry.get(fmt) and entry["width"] not in seen:
+                seen[entry["width"]] = self.rendition_url(name, fmt)
+        return ", ".join(f"{url} {width}w" for width, url in seen.items())
+
+    @property
+    def image_url(self):
+        # Cached and circuit-broken: see core/storage_urls.py.
+        return file_url(self.image)
+
+class CoverPhotoMixin(models.Model):
+    """
+    Denormalized first photo so cards can render without touching `photos`.
+    Kept current by the Photo signals in catalog/signals.py.
+    """
+    cover_photo = models.ForeignKey(
+        Photo, null=True, blank=True, on_delete=models.SET_NULL, related_name="+", editable=False
+    )
+    cover_photo_url = models.CharField(max_length=500, blank=True, editable=False)
+    cover_photo_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    cover_photo_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    @property
+    def cover_image_url(self):
+        # Signed storage URLs expire, so only the unsigned URL is safe to serve from the row.
+        if self.cover_photo_id and getattr(settings, "AWS_QUERYSTRING_AUTH", False):
+            return self.cover_photo.rendition_url("card")
+        if not self.cover_photo_url and self.cover_photo_id:
+            # Storage was failing when the cover was refreshed.
+            return self.cover_photo.rendition_url("card")
+        return self.cover_photo_url
+
+    def refresh_cover_photo(self):
+        photo = Photo.objects.filter(
+            content_type=ContentType.objects.get_for_model(self),
+            object_id=self.pk,
+        ).order_by("sort_order", "id").first()
+        cover_url = photo.rendition_url("card") if photo else ""
+        fields = {
+            "cover_photo": photo,
+            # Never persist the outage placeholder.
+            "cover_photo_url": "" if is_placeholder(cover_url) else cover_url,
+            "cover_photo_width": photo.width if photo else None,
+            "cover_photo_height": photo.height if photo else None,
+        }
+        # update() keeps this out of save(), so slugs and `updated` are left alone.
+        type(self).objects.filter(pk=self.pk).update(**fields)
+        for name, value in fields.items():
+            setattr(self, name, value)
+        from .og_cards import refresh_og_cards  # og_cards is imported by signals, after models
+
+        refresh_og_cards(self)
+
+
+def _home_facts(beds, baths, sq_ft=""):
+    """ "3 bd · 2.5 ba · 1,850 sq ft", skipping blanks."""
+    parts = []
+    if beds:
+        parts.append(f"{beds} bd")
+    if baths:
+        parts.append(f"{baths.normalize():f} ba")
+    if sq_ft:
+        parts.append(f"{sq_ft} sq ft")
+    return " · ".join(parts)
+
+
+def og_card_storage():
+    """
+    STORAGES["og_cards"] when configured, else the default storage. Crawlers
+    fetch og:image long after the page rendered, so on S3 with signed URLs
+    cards need a storage whose URLs don't expire (see production settings).
+    """
+    if "og_cards" in storages.backends:
+        return storages["og_cards"]
+    return default_storage
+
+
+class OgCardMixin(models.Model):
+    """
+    Pre-composed 1200x630 link-preview image (catalog/og_cards.py). Models
+    provide og_card_lines() (title, subtitle, details) and og_card_source().
+    """
+    og_card = models.ImageField(
+        upload_to="og_cards/", storage=og_card_storage, blank=True, null=True, editable=False
+    )
+    og_card_key = models.CharField(max_length=40, blank=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    @property
+    def og_card_url(self):
+        return file_url(self.og_card)
+
+    def og_card_source(self):
+        """(storage, name) of the card background: the share banner, else the cover photo."""
+        if self.share_banner_image:
+            return self.share_banner_image.storage, self.share_banner_image.name
+        photo = getattr(self, "cover_photo", None)
+        if photo is None or not photo.image:
+            return None
+        hero = (photo.renditions or {}).get("hero", {}).get("jpeg")
+        return photo.image.storage, hero or photo.image.name
 
 class CommunityStatus(models.TextChoices):
     ACTIVE = "active", "Active"
@@ -50,7 +267,7 @@ class CommunityStatus(models.TextChoices):
     CLOSING = "closing", "Closing Out"
     SOLD_OUT = "sold_out", "Sold Out"
 
-class Community(TimeStamped):
+class Community(CoverPhotoMixin, OgCardMixin, TimeStamped):
     slug = models.SlugField(max_length=160, unique=True)
     name = models.CharField(max_length=160)
     tagline = models.CharField(max_length=200, blank=True)
@@ -60,6 +277,7 @@ class Community(TimeStamped):
     description = models.TextField(blank=True)
     info_sections = models.JSONField(default=list, blank=True)
     share_banner_image = models.ImageField(upload_to="communities/share_banners/", blank=True, null=True)
+    share_banner_hash = models.CharField(max_length=64, blank=True, db_index=True, editable=False)
     share_enabled = models.BooleanField(default=False)
     share_token = models.UUIDField(default=uuid.uuid4, unique=True, editable=False, db_index=True)
     amenities = models.ManyToManyField(Amenity, blank=True, related_name="communities")
@@ -72,6 +290,10 @@ class Community(TimeStamped):
 
     class Meta: # type: ignore
         ordering = ("name",)
+        indexes = [
+            # Keyset pages in (name, id) order: public and portal lists.
+            models.Index(fields=["name", "id"], name="catalog_community_name_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -79,6 +301,8 @@ class Community(TimeStamped):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.name)[:150]
+        if self.share_banner_image and not self.share_banner_image._committed:
+            store_share_banner(self)
         return super().save(*args, **kwargs)
 
     def get_absolute_url(self):
@@ -87,7 +311,12 @@ class Community(TimeStamped):
     def get_share_url(self):
         return reverse("catalog:community_share", args=[self.slug, str(self.share_token)])
 
-class FloorPlan(TimeStamped):
+    def og_card_lines(self):
+        place = ", ".join(p for p in [self.city, self.state] if p)
+        status = "" if self.status == CommunityStatus.ACTIVE else self.get_status_display()
+        return self.name, self.tagline or place, " · ".join(p for p in [place if self.tagline else "", status] if p)
+
+class FloorPlan(CoverPhotoMixin, OgCardMixin, TimeStamped):
     slug = models.SlugField(max_length=160, unique=True)
     name = models.CharField(max_length=160)
     beds = models.PositiveSmallIntegerField(default=0)
@@ -99,6 +328,7 @@ class FloorPlan(TimeStamped):
     share_enabled = models.BooleanField(default=False)
     share_token = models.UUIDField(default=uuid.uuid4, unique=True, editable=False, db_index=True)
     share_banner_image = models.ImageField(upload_to="plans/share_banners/", blank=True, null=True)
+    share_banner_hash = models.CharField(max_length=64, blank=True, db_index=True, editable=False)
     photos = GenericRelation(Photo, related_query_name="plan")
     # FEATURE FLAGS
     is_featured = models.BooleanField(default=False, db_index=True)
@@ -106,6 +336,9 @@ class FloorPlan(TimeStamped):
 
     class Meta: # type: ignore
         ordering = ("name",)
+        indexes = [
+            models.Index(fields=["name", "id"], name="catalog_floorplan_name_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -113,6 +346,8 @@ class FloorPlan(TimeStamped):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.name)[:150]
+        if self.share_banner_image and not self.share_banner_image._committed:
+            store_share_banner(self)
         return super().save(*args, **kwargs)
 
     def get_absolute_url(self):
@@ -121,6 +356,11 @@ class FloorPlan(TimeStamped):
     def get_share_url(self):
         return reverse("catalog:plan_share", args=[self.slug, str(self.share_token)])
 
+    def og_card_lines(self):
+        sizes = [comma0(n) for n in (self.sq_ft_min, self.sq_ft_max) if n]
+        sq_ft = "–".join(dict.fromkeys(sizes))
+        return self.name, "Floor plan", _home_facts(self.beds, self.baths, sq_ft)
+
 class HomeStatus(models.TextChoices):
     COMING = "coming", "Coming Soon"
     UC = "uc", "Under Construction"
@@ -128,7 +368,7 @@ class HomeStatus(models.TextChoices):
     PENDING = "pending", "Pending"
     SOLD = "sold", "Sold"
 
-class AvailableHome(TimeStamped):
+class AvailableHome(CoverPhotoMixin, OgCardMixin, TimeStamped):
     community = models.ForeignKey(Community, on_delete=models.CASCADE, related_name="homes")
     plan = models.ForeignKey(FloorPlan, on_delete=models.SET_NULL, related_name="homes", null=True, blank=True)
     slug = models.SlugField(max_length=160, unique=True)
@@ -147,6 +387,7 @@ class AvailableHome(TimeStamped):
     share_enabled = models.BooleanField(default=False)
     share_token = models.UUIDField(default=uuid.uuid4, unique=True, editable=False, db_index=True)
     share_banner_image = models.ImageField(upload_to="homes/share_banners/", blank=True, null=True)
+    share_banner_hash = models.CharField(max_length=64, blank=True, db_index=True, editable=False)
     photos = GenericRelation(Photo, related_query_name="home")
     # FEATURE FLAGS
     is_featured = models.BooleanField(default=False, db_index=True)
@@ -154,6 +395,14 @@ class AvailableHome(TimeStamped):
 
     class Meta: # type: ignore
         ordering = ("-created",)
+        indexes = [
+            # Public and portal lists page newest first on (created, id); the
+            # others back the portal table's sortable columns.
+            models.Index(fields=["created", "id"], name="catalog_home_created_idx"),
+            models.Index(fields=["address_1", "id"], name="catalog_home_address_idx"),
+            models.Index(fields=["status", "id"], name="catalog_home_status_idx"),
+            models.Index(fields=["price", "id"], name="catalog_home_price_idx"),
+        ]
 
     def __str__(self):
         return self.full_address or self.slug
@@ -170,6 +419,8 @@ class AvailableHome(TimeStamped):
         if not self.slug:
             base = self.full_address or f"home-{self.pk or ''}"
             self.slug = slugify(base)[:150]
+        if self.share_banner_image and not self.share_banner_image._committed:
+            store_share_banner(self)
         return super().save(*args, **kwargs)
 
     def get_absolute_url(self):
@@ -178,6 +429,10 @@ class AvailableHome(TimeStamped):
     def get_share_url(self):
         return reverse("catalog:home_share", args=[self.slug, str(self.share_token)])
 
+    def og_card_lines(self):
+        price = f"${comma0(self.price)}" if self.price else self.get_status_display()
+        return price, self.full_address, _home_facts(self.beds, self.baths, comma0(self.sq_ft))
+
 
 class CombinedShareSection(models.TextChoices):
     HOME = "home", "Available Home"
@@ -185,11 +440,12 @@ class CombinedShareSection(models.TextChoices):
     COMMUNITY = "community", "Community"
 
 
-class CombinedClientSharePage(TimeStamped):
+class CombinedClientSharePage(OgCardMixin, TimeStamped):
     slug = models.SlugField(max_length=160, unique=True)
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     share_banner_image = models.ImageField(upload_to="combined_shares/share_banners/", blank=True, null=True)
+    share_banner_hash = models.CharField(max_length=64, blank=True, db_index=True, editable=False)
     share_enabled = models.BooleanField(default=False)
     share_token = models.UUIDField(default=uuid.uuid4, unique=True, editable=False, db_index=True)
 
@@ -215,6 +471,9 @@ class CombinedClientSharePage(TimeStamped):
 
     class Meta:  # type: ignore
         ordering = ("title",)
+        indexes = [
+            models.Index(fields=["title", "id"], name="catalog_combined_title_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -222,16 +481,66 @@ class CombinedClientSharePage(TimeStamped):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)[:150]
+        if self.share_banner_image and not self.share_banner_image._committed:
+            store_share_banner(self)
         return super().save(*args, **kwargs)
 
     def get_share_url(self):
         return reverse("catalog:combined_share", args=[self.slug, str(self.share_token)])
 
+    def og_card_lines(self):
+        home = self.home
+        price = f"${comma0(home.price)}" if home.price else ""
+        facts = _home_facts(home.beds, home.baths, comma0(home.sq_ft))
+        return self.title, home.full_address, " · ".join(p for p in [price, facts] if p)
+
+    def og_card_source(self):
+        # No cover of its own: fall back to the home's.
+        return super().og_card_source() or self.home.og_card_source()
+
     @property
     def ordered_section_keys(self):
         return [self.section_one, self.section_two, self.section_three]
 
 
+class SearchDocument(TimeStamped):
+    """
+    Flattened search text for one catalog object. The backend-specific index
+    (tsvector + GIN on Postgres, FTS5 shadow table on SQLite) is created in
+    migration 0008 and queried through catalog/search.py.
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    content_object = GenericForeignKey("content_type", "object_id")
+    title = models.CharField(max_length=400, blank=True)
+    body = models.TextField(blank=True)
+
+    class Meta:  # type: ignore
+        constraints = [
+            models.UniqueConstraint(fields=["content_type", "object_id"], name="catalog_searchdoc_unique_object"),
+        ]
+
+    def __str__(self):
+        return self.title or f"Search document #{self.pk}"
+
+
+class NormalizedImage(TimeStamped):
+    """One row per image normalized by catalog/ingest.py, with the bytes saved."""
+    name = models.CharField(max_length=500, unique=True)
+    original_name = models.CharField(max_length=500, blank=True)
+    original_bytes = models.PositiveBigIntegerField()
+    stored_bytes = models.PositiveBigIntegerField()
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def bytes_saved(self):
+        return self.original_bytes - self.stored_bytes
+
+
 class LeadSource(models.TextChoices):
     GLOBAL = "site", "Website"
     PLAN = "plan", "Plan Page"
@@ -0,0 +1,172 @@
+# -----------------------------------------------------------------------------
+# catalog/og_cards.py  (1200x630 Open Graph cards for shared pages)
+# -----------------------------------------------------------------------------
+# Link previews (iMessage, Facebook, Slack, LinkedIn) crop whatever og:image
+# they are given, and a bare photo says nothing about the listing. Each
+# shareable object gets a pre-composed card instead: its share banner (or
+# cover photo) cropped to 1200x630 with the title and key facts drawn over
+# a dark band along the bottom.
+#
+# Cards are rendered when the object is saved or its cover photo changes,
+# stored with the other media under og_cards/, and written back with
+# update(). og_card_key is a hash of everything drawn on the card, so
+# re-saving an object without changing what the card shows costs one hash
+# and no rendering.
+import hashlib
+import io
+import logging
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+from .dedup import release
+
+logger = logging.getLogger(__name__)
+
+CARD_SIZE = (1200, 630)
+# Bump when the layout changes so every card is redrawn on its next save.
+CARD_VERSION = 1
+MARGIN = 56
+BACKGROUND = (31, 41, 55)
+BRAND = "Heritage Realty & Custom Homes"
+FONTS = {
+    "bold": ("DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf", "Arial Bold.ttf"),
+    "regular": ("DejaVuSans.ttf", "LiberationSans-Regular.ttf", "Arial.ttf"),
+}
+
+_fonts = {}
+
+
+def _font(weight, size):
+    """A TrueType font of `size` px; OG_CARD_FONTS = {"bold": path, ...} overrides the search."""
+    key = (weight, size)
+    if key not in _fonts:
+        configured = getattr(settings, "OG_CARD_FONTS", {}).get(weight)
+        for name in ((configured,) if configured else ()) + FONTS[weight]:
+            try:
+                _fonts[key] = ImageFont.truetype(name, size)
+                break
+            except OSError:
+                continue
+        else:
+            _fonts[key] = ImageFont.load_default(size=size)
+    return _fonts[key]
+
+
+def _fit_text(draw, text, font, width):
+    """`text`, shortened with an ellipsis until it fits in `width` px."""
+    if draw.textlength(text, font=font) <= width:
+        return text
+    while text and draw.textlength(text + "…", font=font) > width:
+        text = text[:-1]
+    return text.rstrip() + "…"
+
+
+def _background(source):
+    """The (storage, name) image cropped to CARD_SIZE, or a plain panel."""
+    if source:
+        storage, name = source
+        try:
+            with storage.open(name, "rb") as f:
+                img = Image.open(f)
+                img.draft("RGB", CARD_SIZE)
+                img = ImageOps.exif_transpose(img).convert("RGB")
+                return ImageOps.fit(img, CARD_SIZE, Image.Resampling.LANCZOS)
+        except Exception:
+            logger.warning("Could not read %s for an OG card; using a plain background", name)
+    return Image.new("RGB", CARD_SIZE, BACKGROUND)
+
+
+def _shade(img):
+    """Darken the top edge (brand) and the bottom ~55% (text) so white text reads on any photo."""
+    height = CARD_SIZE[1]
+    mask = Image.new("L", (1, height))
+    band_top = int(height * 0.45)
+    for y in range(height):
+        if y < 90:
+            alpha = int(110 * (1 - y / 90))
+        elif y >= band_top:
+            alpha = int(215 * ((y - band_top) / (height - band_top)) ** 0.8)
+        else:
+            alpha = 0
+        mask.putpixel((0, y), alpha)
+    black = Image.new("RGB", CARD_SIZE, (0, 0, 0))
+    return Image.composite(black, img, mask.resize(CARD_SIZE))
+
+
+def render_card(source, title, subtitle="", details=""):
+    """JPEG bytes of a card over `source`, a (storage, name) pair or None."""
+    img = _shade(_background(source))
+    draw = ImageDraw.Draw(img)
+    width = CARD_SIZE[0] - 2 * MARGIN
+    white, muted = (255, 255, 255), (226, 232, 240)
+
+    draw.text((MARGIN, 36), BRAND.upper(), font=_font("bold", 22), fill=muted)
+
+    # Laid out from the bottom up so missing lines leave no gaps.
+    y = CARD_SIZE[1] - MARGIN
+    for text, font, fill in (
+        (details, _font("regular", 32), muted),
+        (subtitle, _font("regular", 36), white),
+        (title, _font("bold", 60), white),
+    ):
+        if not text:
+            continue
+        text = _fit_text(draw, text, font, width)
+        _left, top, _right, bottom = font.getbbox(text)
+        y -= bottom
+        draw.text((MARGIN, y), text, font=font, fill=fill)
+        y -= 18 - top
+
+    buf = io.BytesIO()
+    img.save(buf, "JPEG", quality=85, optimize=True, progressive=True)
+    return buf.getvalue()
+
+
+def card_key(source, lines):
+    """Hash of everything a card shows; unchanged key means the stored card is current."""
+    parts = [str(CARD_VERSION), source[1] if source else ""] + [line or "" for line in lines]
+    return hashlib.sha1("\x1f".join(parts).encode()).hexdigest()
+
+
+def refresh_og_card(obj, force=False):
+    """
+    Render and store obj's card if what it shows has changed (or `force`).
+    Returns True if a new card was written. Never raises: a failed render
+    leaves the old card in place.
+    """
+    if obj.pk is None:
+        return False
+    try:
+        source = obj.og_card_source()
+        lines = obj.og_card_lines()
+        key = card_key(source, lines)
+        if not force and key == obj.og_card_key and obj.og_card:
+            return False
+        data = render_card(source, *lines)
+    except Exception:
+        logger.exception("Could not render the OG card for %s id=%s", type(obj).__name__, obj.pk)
+        return False
+
+    field = obj.og_card.field
+    old = obj.og_card.name
+    filename = field.generate_filename(obj, f"{obj._meta.model_name}-{obj.pk}-{key[:12]}.jpg")
+    name = field.storage.save(filename, ContentFile(data))
+    # update() keeps this out of save(), so the card never re-triggers itself.
+    type(obj)._base_manager.filter(pk=obj.pk).update(og_card=name, og_card_key=key)
+    obj.og_card, obj.og_card_key = name, key
+    if old and old != name:
+        release(field.storage, old)
+    return True
+
+
+def refresh_og_cards(obj):
+    """refresh_og_card() for obj and the combined share pages that draw on it."""
+    from .models import AvailableHome  # models imports this module lazily
+
+    refresh_og_card(obj)
+    if isinstance(obj, AvailableHome):
+        for page in obj.combined_share_pages.all():
+            page.home = obj
+            refresh_og_card(page)
@@ -0,0 +1,107 @@
+# -----------------------------------------------------------------------------
+# catalog/renditions.py  (fixed-width WebP/JPEG variants of Photo.image)
+# -----------------------------------------------------------------------------
+# Built once when a photo is uploaded (Photo.save) and stored under
+# renditions/<original name>/<digest>/, where the digest covers the original's
+# bytes and the settings below. A folder's files therefore never change (they
+# are served as immutable), and a.jpg and a.png don't share one. Photo.renditions
+# records what was written:
+#
+#   {"card": {"width": 600, "height": 450,
+#             "webp": "renditions/photos/x.jpg/1f0c...-9a2b.../card.webp",
+#             "jpeg": "renditions/photos/x.jpg/1f0c...-9a2b.../card.jpg"}, ...}
+#
+# Originals narrower than a rendition are never upscaled; that rendition
+# reuses the largest file actually written.
+import hashlib
+import io
+import logging
+import posixpath
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+# (name, target width in px), smallest first.
+RENDITIONS = (
+    ("thumb", 160),
+    ("card", 600),
+    ("hero", 1200),
+    ("full", 2000),
+)
+
+# (key, Pillow format, extension, save options)
+FORMATS = (
+    ("webp", "WEBP", "webp", {"quality": 80, "method": 4}),
+    ("jpeg", "JPEG", "jpg", {"quality": 82, "optimize": True, "progressive": True}),
+)
+
+
+# Changes whenever RENDITIONS or FORMATS do, so a rebuild after editing them
+# writes new paths instead of replacing immutable files.
+SPEC_VERSION = hashlib.sha256(repr((RENDITIONS, FORMATS)).encode()).hexdigest()[:8]
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def rendition_dir(name, digest):
+    """Folder for the renditions of `name` whose bytes hash to `digest` (SHA-256 hex)."""
+    return posixpath.join("renditions", name, f"{digest[:16]}-{SPEC_VERSION}")
+
+
+def _digest(field_file):
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: field_file.read(CHUNK_SIZE), b""):
+        digest.update(chunk)
+    field_file.seek(0)
+    return digest.hexdigest()
+
+
+def _encode(img, fmt, options):
+    if fmt == "JPEG" and img.mode != "RGB":
+        img = img.convert("RGB")
+    elif fmt == "WEBP" and img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "transparency" in img.info or img.mode in ("LA", "PA") else "RGB")
+    buf = io.BytesIO()
+    img.save(buf, fmt, **options)
+    return buf.getvalue()
+
+
+def build_renditions(field_file):
+    """
+    Write every rendition of a stored image and return the renditions dict.
+    Returns {} (and logs) if the file can't be decoded, so callers fall back
+    to the original.
+    """
+    storage = field_file.storage
+    try:
+        field_file.open("rb")
+        folder = rendition_dir(field_file.name, _digest(field_file))
+        with Image.open(field_file) as source:
+            source = ImageOps.exif_transpose(source)
+            renditions = {}
+            written = {}
+            for name, target in RENDITIONS:
+                width = min(target, source.width)
+                if width not in written:
+                    height = max(1, round(source.height * width / source.width))
+                    resized = source if width == source.width else source.resize(
+                        (width, height), Image.Resampling.LANCZOS, reducing_gap=3.0
+                    )
+                    entry = {"width": width, "height": height}
+                    for key, fmt, ext, options in FORMATS:
+                        path = posixpath.join(folder, f"{name}.{ext}")
+                        # Same bytes, same settings: a file already there is this one.
+                        if not storage.exists(path):
+                            path = storage.save(path, ContentFile(_encode(resized, fmt, options)))
+                        entry[key] = path
+                    written[width] = entry
+                renditions[name] = written[width]
+            return renditions
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        logger.exception("Could not build renditions for %s", field_file.name)
+        return {}
+    finally:
+        field_file.close()
+
@@ -0,0 +1,180 @@
+# -----------------------------------------------------------------------------
+# catalog/search.py  (ranked full-text search for the public list views)
+# -----------------------------------------------------------------------------
+# Every Community / FloorPlan / AvailableHome has a SearchDocument row that is
+# rewritten on save. Postgres indexes it through a generated tsvector column
+# with a GIN index; SQLite through an external-content FTS5 table kept in sync
+# by triggers. Other backends fall back to the caller's icontains filter.
+import re
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.db.models.expressions import RawSQL
+
+DOCUMENT_TABLE = "catalog_searchdocument"
+FTS_TABLE = "catalog_searchdocument_fts"
+
+POSTGRES_INDEX_SQL = [
+    f"""
+    ALTER TABLE {DOCUMENT_TABLE} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(body, '')), 'B')
+    ) STORED
+    """,
+    f"CREATE INDEX catalog_searchdoc_vector_gin ON {DOCUMENT_TABLE} USING gin (search_vector)",
+]
+POSTGRES_DROP_SQL = [
+    "DROP INDEX IF EXISTS catalog_searchdoc_vector_gin",
+    f"ALTER TABLE {DOCUMENT_TABLE} DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_INDEX_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, body, content='{DOCUMENT_TABLE}', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {DOCUMENT_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {DOCUMENT_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON {DOCUMENT_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+SQLITE_DROP_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+INDEX_SQL = {"postgresql": POSTGRES_INDEX_SQL, "sqlite": SQLITE_INDEX_SQL}
+DROP_SQL = {"postgresql": POSTGRES_DROP_SQL, "sqlite": SQLITE_DROP_SQL}
+
+
+def document_text(obj):
+    """
+    Return (title, body) for a catalog object. Only reads concrete fields;
+    migration 0008 keeps its own copy for the backfill.
+    """
+    title = " ".join(p for p in [getattr(obj, "name", ""), getattr(obj, "address_1", "")] if p)
+    parts = [
+        getattr(obj, "tagline", ""),
+        getattr(obj, "address_2", ""),
+        getattr(obj, "city", ""),
+        getattr(obj, "state", ""),
+        getattr(obj, "postal_code", ""),
+        getattr(obj, "description", ""),
+    ]
+    for section in getattr(obj, "info_sections", None) or []:
+        if not isinstance(section, dict):
+            continue
+        parts.append(section.get("header", ""))
+        parts.append(section.get("subheader", ""))
+        for item in section.get("items", None) or []:
+            if isinstance(item, dict):
+                parts.append(item.get("key", ""))
+                parts.append(item.get("value", ""))
+    body = "\n".join(str(p) for p in parts if p)
+    return title[:400], body
+
+
+def index_object(obj):
+    from .models import SearchDocument
+
+    title, body = document_text(obj)
+    SearchDocument.objects.update_or_create(
+        content_type=ContentType.objects.get_for_model(obj),
+        object_id=obj.pk,
+        defaults={"title": title, "body": body},
+    )
+
+
+def index_objects(objs):
+    """index_object() for many objects of one model in a single upsert (bulk imports)."""
+    from .models import SearchDocument
+
+    if not objs:
+        return
+    content_type = ContentType.objects.get_for_model(objs[0])
+    docs = []
+    for obj in objs:
+        title, body = document_text(obj)
+        docs.append(SearchDocument(content_type=content_type, object_id=obj.pk, title=title, body=body))
+    SearchDocument.objects.bulk_create(
+        docs,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id"],
+        update_fields=["title", "body", "updated"],
+    )
+
+
+def unindex_object(obj):
+    from .models import SearchDocument
+
+    SearchDocument.objects.filter(
+        content_type=ContentType.objects.get_for_model(obj), object_id=obj.pk
+    ).delete()
+
+
+def _fts5_query(q):
+    # Quote every token so user input can't inject FTS5 operators; the last
+    # token gets a prefix match so "harb" finds "Harborview".
+    tokens = re.findall(r"\w+", q)
+    if not tokens:
+        return ""
+    quoted = ['"%s"' % t.replace('"', '""') for t in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def search_queryset(qs, q, fallback):
+    """
+    Restrict `qs` to objects matching `q`, annotate `search_rank` and order by
+    it (best first). `fallback` is the Q used on backends without an index.
+    """
+    q = (q or "").strip()
+    if not q:
+        return qs
+    vendor = connection.vendor
+    ct_id = ContentType.objects.get_for_model(qs.model).pk
+    outer_pk = "%s.%s" % (
+        connection.ops.quote_name(qs.model._meta.db_table),
+        connection.ops.quote_name(qs.model._meta.pk.column),
+    )
+
+    if vendor == "postgresql":
+        tsquery = "websearch_to_tsquery('english', %s)"
+        match = RawSQL(
+            f"SELECT object_id FROM {DOCUMENT_TABLE} WHERE content_type_id = %s AND search_vector @@ {tsquery}",
+            (ct_id, q),
+        )
+        rank = RawSQL(
+            f"SELECT ts_rank(search_vector, {tsquery}) FROM {DOCUMENT_TABLE} "
+            f"WHERE content_type_id = %s AND object_id = {outer_pk}",
+            (q, ct_id),
+        )
+    elif vendor == "sqlite":
+        fts_q = _fts5_query(q)
+        if not fts_q:
+            return qs.none()
+        join = f"FROM {FTS_TABLE} JOIN {DOCUMENT_TABLE} d ON d.id = {FTS_TABLE}.rowid WHERE {FTS_TABLE} MATCH %s AND d.content_type_id = %s"
+        match = RawSQL(f"SELECT d.object_id {join}", (fts_q, ct_id))
+        # bm25() is lower-is-better; negate it so both backends sort descending.
+        rank = RawSQL(f"SELECT -bm25({FTS_TABLE}, 10.0, 1.0) {join} AND d.object_id = {outer_pk}", (fts_q, ct_id))
+    else:
+        return qs.filter(fallback)
+
+    ordering = list(qs.query.order_by or qs.model._meta.ordering)
+    return qs.filter(pk__in=match).annotate(search_rank=rank).order_by("-search_rank", *ordering)
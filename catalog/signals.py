@@ -0,0 +1,219 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core import page_cache
+
+from .dedup import release
+from .facets import invalidate_home_facets
+from .featured import invalidate_featured
+from .models import Amenity, AvailableHome, CombinedClientSharePage, Community, CoverPhotoMixin, FloorPlan, Photo
+from .og_cards import refresh_og_cards
+from .search import index_object, unindex_object
+
+
+def _refresh_owner_cover(photo):
+    model = photo.content_type.model_class()
+    if model is None or not issubclass(model, CoverPhotoMixin):
+        return
+    owner = model.objects.filter(pk=photo.object_id).first()
+    if owner is not None:
+        owner.refresh_cover_photo()
+
+
+# Page-cache tags per catalog model: (object tag prefix, list tag).
+PAGE_TAGS = {
+    Community: ("community", "communities:list"),
+    FloorPlan: ("plan", "plans:list"),
+    AvailableHome: ("home", "homes:list"),
+}
+
+
+def _purge_pages(model, pk):
+    prefix, list_tag = PAGE_TAGS[model]
+    page_cache.bump(f"{prefix}:{pk}", list_tag)
+
+
+# Registered ahead of the page purges below, so purged pages re-render with
+# the new card URL.
+@receiver(post_save, sender=Community)
+@receiver(post_save, sender=FloorPlan)
+@receiver(post_save, sender=AvailableHome)
+@receiver(post_save, sender=CombinedClientSharePage)
+def og_card_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_og_cards(instance)
+
+
+@receiver(post_save, sender=Photo)
+def photo_saved(sender, instance, **kwargs):
+    # Covers adds and sort_order edits from the portal views and the admin PhotoInline.
+    _refresh_owner_cover(instance)
+    _photo_pages_changed(instance)
+
+
+@receiver(post_delete, sender=Photo)
+def photo_deleted(sender, instance, **kwargs):
+    _refresh_owner_cover(instance)
+    _photo_pages_changed(instance)
+
+
+def _photo_pages_changed(photo):
+    model = photo.content_type.model_class()
+    if model in PAGE_TAGS:
+        _purge_pages(model, photo.object_id)
+        # Cover images appear on the homepage cards.
+        invalidate_featured()
+
+
+@receiver(post_save, sender=Community)
+@receiver(post_save, sender=FloorPlan)
+@receiver(post_save, sender=AvailableHome)
+def catalog_object_saved(sender, instance, **kwargs):
+    index_object(instance)
+
+
+@receiver(post_delete, sender=Community)
+@receiver(post_delete, sender=FloorPlan)
+@receiver(post_delete, sender=AvailableHome)
+def catalog_object_deleted(sender, instance, **kwargs):
+    unindex_object(instance)
+
+
+@receiver(post_save, sender=AvailableHome)
+@receiver(post_delete, sender=AvailableHome)
+@receiver(post_save, sender=Community)
+@receiver(post_delete, sender=Community)
+def home_inventory_changed(sender, **kwargs):
+    # Community names and slugs appear in the homes facet bar too.
+    invalidate_home_facets()
+
+
+@receiver(post_save, sender=Community)
+@receiver(post_delete, sender=Community)
+@receiver(post_save, sender=FloorPlan)
+@receiver(post_delete, sender=FloorPlan)
+@receiver(post_save, sender=AvailableHome)
+@receiver(post_delete, sender=AvailableHome)
+def catalog_pages_changed(sender, instance, **kwargs):
+    _purge_pages(sender, instance.pk)
+    invalidate_featured()
+
+
+@receiver(m2m_changed, sender=Community.amenities.through)
+@receiver(m2m_changed, sender=Community.available_plans.through)
+def community_relations_changed(sender, instance, action, **kwargs):
+    if action.startswith("post_"):
+        # Plan pages and cards list their communities too.
+        page_cache.bump("communities:list", "plans:list")
+        invalidate_featured()
+        if isinstance(instance, Community):
+            page_cache.bump(f"community:{instance.pk}")
+
+
+@receiver(post_save, sender=Amenity)
+@receiver(post_delete, sender=Amenity)
+def amenity_changed(sender, **kwargs):
+    page_cache.bump("amenities")
+
+
+@receiver(post_save, sender=CombinedClientSharePage)
+@receiver(post_delete, sender=CombinedClientSharePage)
+def combined_share_changed(sender, instance, **kwargs):
+    page_cache.bump(f"combined:{instance.pk}")
+
+
+# Stored files per model. Files can be shared (catalog/dedup.py), so a
+# replaced or deleted one goes through release(), which keeps it while any
+# other row still names it.
+STORED_FILES = {
+    Photo: "image",
+    Community: "share_banner_image",
+    FloorPlan: "share_banner_image",
+    AvailableHome: "share_banner_image",
+    CombinedClientSharePage: "share_banner_image",
+}
+
+
+def _stored_file(model, instance):
+    """(name, renditions) of the file field as the row holds it."""
+    field_name = STORED_FILES[model]
+    name = getattr(instance, field_name)
+    return (name.name if name else ""), getattr(instance, "renditions", None)
+
+
+@receiver(pre_save, sender=Photo)
+@receiver(pre_save, sender=Community)
+@receiver(pre_save, sender=FloorPlan)
+@receiver(pre_save, sender=AvailableHome)
+@receiver(pre_save, sender=CombinedClientSharePage)
+def remember_stored_file(sender, instance, raw=False, **kwargs):
+    if raw or instance.pk is None:
+        return
+    fields = [STORED_FILES[sender]] + (["renditions"] if sender is Photo else [])
+    instance._stored_file_before = sender._base_manager.filter(pk=instance.pk).values_list(*fields).first()
+
+
+@receiver(post_save, sender=Photo)
+@receiver(post_save, sender=Community)
+@receiver(post_save, sender=FloorPlan)
+@receiver(post_save, sender=AvailableHome)
+@receiver(post_save, sender=CombinedClientSharePage)
+def release_replaced_file(sender, instance, **kwargs):
+    before = getattr(instance, "_stored_file_before", None)
+    instance._stored_file_before = None
+    if before and before[0] and before[0] != _stored_file(sender, instance)[0]:
+        field = sender._meta.get_field(STORED_FILES[sender])
+        release(field.storage, before[0], before[1] if len(before) > 1 else None)
+
+
+@receiver(post_delete, sender=Photo)
+@receiver(post_delete, sender=Community)
+@receiver(post_delete, sender=FloorPlan)
+@receiver(post_delete, sender=AvailableHome)
+@receiver(post_delete, sender=CombinedClientSharePage)
+def release_deleted_file(sender, instance, **kwargs):
+    name, renditions = _stored_file(sender, instance)
+    release(sender._meta.get_field(STORED_FILES[sender]).storage, name, renditions)
+
+
+@receiver(post_delete, sender=Community)
+@receiver(post_delete, sender=FloorPlan)
+@receiver(post_delete, sender=AvailableHome)
+@receiver(post_delete, sender=CombinedClientSharePage)
+def release_og_card(sender, instance, **kwargs):
+    if instance.og_card:
+        release(instance.og_card.storage, instance.og_card.name)
+
+
+def rows_updated(model, pks):
+    """
+    Run the page/slate/facet invalidation that post_save would have for
+    rows changed with queryset.update() (e.g. the admin featured actions).
+    """
+    for pk in pks:
+        _purge_pages(model, pk)
+    invalidate_featured()
+    if model in (AvailableHome, Community):
+        invalidate_home_facets()
+
+
+def photos_updated(pks):
+    """
+    Refresh owner covers and purge pages for photos whose file, dimensions
+    or renditions were changed with queryset.update() (the media commands).
+    """
+    owners = defaultdict(set)
+    for start in range(0, len(pks), 500):
+        rows = Photo.objects.filter(pk__in=pks[start:start + 500]).values_list("content_type", "object_id")
+        for content_type_id, object_id in rows:
+            owners[content_type_id].add(object_id)
+    for content_type_id, object_ids in owners.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model is None or not issubclass(model, CoverPhotoMixin):
+            continue
+        for owner in model.objects.filter(pk__in=object_ids).iterator():
+            owner.refresh_cover_photo()
+        rows_updated(model, object_ids)
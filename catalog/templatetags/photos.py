@@ -0,0 +1,57 @@
+from django import template
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+
+from core.storage_urls import file_url
+
+register = template.Library()
+
+
+@register.filter
+def media_url(field_file):
+    """{{ obj.share_banner_image|media_url }}: cached URL (core/storage_urls.py) instead of .url."""
+    return file_url(field_file)
+
+
+@register.simple_tag(takes_context=True)
+def absolute_url(context, url):
+    """{% absolute_url obj.og_card_url %}: crawlers need a full URL; storage URLs on S3 already are."""
+    request = context.get("request")
+    if not url or "://" in url or request is None:
+        return url
+    return request.build_absolute_uri(url)
+
+
+@register.simple_tag
+def photo_picture(photo, sizes="100vw", rendition="hero", **attrs):
+    """
+    <picture> with WebP and JPEG srcsets for a Photo's renditions.
+    `rendition` picks the fallback `src`; extra kwargs become <img> attributes.
+    Example: {% photo_picture photo sizes="(min-width: 992px) 33vw, 100vw" rendition="card" class="img-fluid" %}
+    """
+    attrs.setdefault("alt", photo.caption)
+    attrs.setdefault("loading", "lazy")
+    attrs.setdefault("decoding", "async")
+    entry = (photo.renditions or {}).get(rendition)
+    if entry:
+        attrs.setdefault("width", entry["width"])
+        attrs.setdefault("height", entry["height"])
+    elif photo.width and photo.height:
+        attrs.setdefault("width", photo.width)
+        attrs.setdefault("height", photo.height)
+
+    jpeg_srcset = photo.srcset("jpeg")
+    if not jpeg_srcset:
+        return format_html("<img src=\"{}\"{}>", photo.image_url, flatatt(attrs))
+    return format_html(
+        "<picture>"
+        "<source type=\"image/webp\" srcset=\"{}\" sizes=\"{}\">"
+        "<img src=\"{}\" srcset=\"{}\" sizes=\"{}\"{}>"
+        "</picture>",
+        photo.srcset("webp"),
+        sizes,
+        photo.rendition_url(rendition),
+        jpeg_srcset,
+        sizes,
+        flatatt(attrs),
+    )
@@ -6,6 +6,7 @@ from .views.community import CommunityListView, CommunityDetailView, CommunitySh
 from .views.plan import PlanListView, PlanDetailView, PlanShareView
 from .views.home import HomeListView, HomeDetailView, HomeShareView
 from .views.client_share import CombinedClientShareView
+from .views.gallery import GalleryApiView, SiteGalleryApiView
 
 app_name = "catalog"
 urlpatterns = [
@@ -18,5 +19,7 @@ urlpatterns = [
     path("homes/", HomeListView.as_view(), name="home_list"),
     path("homes/<slug:slug>/share/<uuid:token>/", HomeShareView.as_view(), name="home_share"),
     path("homes/<slug:slug>/", HomeDetailView.as_view(), name="home_detail"),
+    path("api/gallery/", SiteGalleryApiView.as_view(), name="site_gallery_api"),
+    path("api/gallery/<str:kind>/<slug:slug>/", GalleryApiView.as_view(), name="gallery_api"),
     path("client-share/<slug:slug>/share/<uuid:token>/", CombinedClientShareView.as_view(), name="combined_share"),
 ]
@@ -1,13 +1,31 @@
 from django.http import Http404
 from django.views.generic import DetailView
 
+from core.page_cache import PageCacheMixin
+
+from ..gallery import first_page
 from ..models import CombinedClientSharePage
+from .conditional import ConditionalGetMixin
+from .loaders import combined_share_queryset
 
 
-class CombinedClientShareView(DetailView):
+class CombinedClientShareView(ConditionalGetMixin, PageCacheMixin, DetailView):
     model = CombinedClientSharePage
     template_name = "catalog/combined_share.html"
     slug_field = "slug"
+    validator_fields = ("share_enabled", "share_token", "home", "plan", "community")
+
+    def get_queryset(self):
+        return combined_share_queryset()
+
+    def get_page_cache_tags(self):
+        page = self.object
+        return [
+            f"combined:{page.pk}",
+            f"home:{page.home_id}",
+            f"plan:{page.plan_id}",
+            f"community:{page.community_id}",
+        ]
 
     def get_object(self, queryset=None):
         obj = super().get_object(queryset=queryset)
@@ -37,4 +55,6 @@ class CombinedClientShareView(DetailView):
             },
         }
         ctx["ordered_sections"] = [section_map[key] for key in page.ordered_section_keys if key in section_map]
+        for section in ctx["ordered_sections"]:
+            section["gallery"] = first_page(section["object"])
         return ctx
@@ -4,15 +4,23 @@
 from django.views.generic import ListView, DetailView
 from django.db.models import Q
 from django.http import Http404
+from core.page_cache import PageCacheMixin
+from core.pagination import KeysetPaginationMixin
 from ..models import Community, CommunityStatus
+from ..search import search_queryset
+from .conditional import ConditionalGetMixin
+from .gallery import GalleryMixin
+from .loaders import community_detail_queryset, share_queryset
 
-class CommunityListView(ListView):
+class CommunityListView(PageCacheMixin, KeysetPaginationMixin, ListView):
     model = Community
     template_name = "catalog/community_list.html"
+    page_cache_tags = ("site", "communities:list")
     paginate_by = 12
+    keyset_ordering = ("name", "id")
 
     def get_queryset(self):
-        qs = super().get_queryset().select_related()
+        qs = super().get_queryset().select_related("cover_photo")
         status = self.request.GET.get("status")
         city = self.request.GET.get("city")
         q = self.request.GET.get("q")
@@ -21,7 +29,7 @@ class CommunityListView(ListView):
         if city:
             qs = qs.filter(city__icontains=city)
         if q:
-            qs = qs.filter(Q(name__icontains=q) | Q(description__icontains=q))
+            qs = search_queryset(qs, q, Q(name__icontains=q) | Q(description__icontains=q))
         return qs
 
     def get_context_data(self, **kwargs):
@@ -29,16 +37,30 @@ class CommunityListView(ListView):
         ctx["status_choices"] = CommunityStatus.choices
         return ctx
 
-class CommunityDetailView(DetailView):
+class CommunityDetailView(ConditionalGetMixin, PageCacheMixin, GalleryMixin, DetailView):
     model = Community
     template_name = "catalog/community_detail.html"
     slug_field = "slug"
 
+    def get_queryset(self):
+        return community_detail_queryset()
+
+    def get_page_cache_tags(self):
+        # Lists the community's homes and plans as well.
+        return ["site", f"community:{self.object.pk}", "amenities", "homes:list", "plans:list"]
+
 
-class CommunityShareView(DetailView):
+class CommunityShareView(ConditionalGetMixin, PageCacheMixin, GalleryMixin, DetailView):
     model = Community
     template_name = "catalog/community_share.html"
     slug_field = "slug"
+    validator_fields = ("share_enabled", "share_token")
+
+    def get_queryset(self):
+        return share_queryset(Community)
+
+    def get_page_cache_tags(self):
+        return [f"community:{self.object.pk}"]
 
     def get_object(self, queryset=None):
         obj = super().get_object(queryset=queryset)
@@ -0,0 +1,52 @@
+# -----------------------------------------------------------------------------
+# catalog/views/conditional.py  (ETag / Last-Modified for detail + share views)
+# -----------------------------------------------------------------------------
+# The validator is built from a one-row lookup (validator_queryset) before
+# the full loader runs: the object's `updated`, its newest photo's `updated`
+# and the page-cache tag generations (which cover SiteSettings/Announcement,
+# related lists and photo deletes). A matching If-None-Match or
+# If-Modified-Since is answered with 304 without rendering the template.
+#
+# Not used when the photo storage signs its URLs (AWS_QUERYSTRING_AUTH): a
+# 304 would keep the browser on HTML whose signatures have expired.
+import hashlib
+
+from django.core.files.storage import default_storage
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from core.page_cache import tag_versions
+from core.storage_urls import signs_urls
+
+from .loaders import validator_queryset
+
+
+class ConditionalGetMixin:
+    # Extra fields get_object()/get_page_cache_tags() read on the light row.
+    validator_fields = ()
+
+    def get_validators(self):
+        # get_object() applies the slug lookup and, for share views, the
+        # token check, so invalid links still 404 before any 304.
+        self.object = self.get_object(queryset=validator_queryset(self.model, *self.validator_fields))
+        tags = sorted(set(self.get_page_cache_tags()) | {"site"})
+        versions = tag_versions(tags)
+        stamps = [self.object.updated, self.object.photos_updated]
+        raw = "|".join([str(self.object.pk), *map(str, stamps), *(f"{tag}={versions[tag]}" for tag in tags)])
+        etag = quote_etag(hashlib.md5(raw.encode()).hexdigest())
+        last_modified = max(
+            [stamp.timestamp() for stamp in stamps if stamp is not None]
+            + [version / 1e9 for version in versions.values()]
+        )
+        return etag, int(last_modified)
+
+    def get(self, request, *args, **kwargs):
+        if signs_urls(default_storage):
+            return super().get(request, *args, **kwargs)
+        etag, last_modified = self.get_validators()
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        return response
@@ -0,0 +1,69 @@
+# -----------------------------------------------------------------------------
+# catalog/views/gallery.py  (gallery JSON API + first-page context)
+# -----------------------------------------------------------------------------
+from django.http import Http404, JsonResponse
+from django.views import View
+
+from core.pagination import KeysetPaginator
+
+from ..gallery import (
+    OWNER_ORDERING,
+    OWNERS,
+    SITE_ORDERING,
+    api_url,
+    first_page,
+    next_url,
+    owner_photos,
+    page_size,
+    photo_payload,
+    site_photos,
+)
+
+
+class GalleryMixin:
+    """Detail/share view mixin: adds `gallery` (first page of the object's photos)."""
+
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        ctx["gallery"] = first_page(self.object)
+        return ctx
+
+
+class GalleryApiView(View):
+    """GET one page of photos; cached by PageCacheMiddleware like the pages themselves."""
+
+    ordering = OWNER_ORDERING
+
+    def get_queryset(self):
+        model, prefix = OWNERS.get(self.kwargs["kind"], (None, None))
+        if model is None:
+            raise Http404("Unknown gallery.")
+        self.owner = model.objects.filter(slug=self.kwargs["slug"]).only("pk", "slug").first()
+        if self.owner is None:
+            raise Http404("Gallery not found.")
+        self.request.page_cache_tags = [f"{prefix}:{self.owner.pk}"]
+        return owner_photos(self.owner)
+
+    def get_base_url(self):
+        return api_url(self.owner)
+
+    def get(self, request, *args, **kwargs):
+        qs = self.get_queryset()
+        limit = page_size(request.GET.get("limit"))
+        page = KeysetPaginator(qs, limit, self.ordering).page(request.GET.get("cursor"))
+        return JsonResponse({
+            "results": [photo_payload(photo) for photo in page],
+            "next": next_url(self.get_base_url(), page, limit),
+        })
+
+
+class SiteGalleryApiView(GalleryApiView):
+    ordering = SITE_ORDERING
+
+    def get_queryset(self):
+        # Photo saves bump their owner's list tag (catalog/signals.py).
+        self.request.page_cache_tags = ["communities:list", "plans:list", "homes:list"]
+        return site_photos()
+
+    def get_base_url(self):
+        return api_url()
@@ -2,52 +2,59 @@
 # catalog/views/home.py  (for reference)
 # -----------------------------------------------------------------------------
 from django.views.generic import ListView, DetailView
-from django.db.models import Q
 from django.http import Http404
+from core.page_cache import PageCacheMixin
+from core.pagination import KeysetPaginationMixin
+from ..facets import apply_home_filters, home_facets, home_filter_state
 from ..models import AvailableHome, HomeStatus
+from .conditional import ConditionalGetMixin
+from .gallery import GalleryMixin
+from .loaders import home_detail_queryset, share_queryset
 
-class HomeListView(ListView):
+class HomeListView(PageCacheMixin, KeysetPaginationMixin, ListView):
     model = AvailableHome
     template_name = "catalog/home_list.html"
+    page_cache_tags = ("site", "homes:list", "communities:list", "plans:list")
     paginate_by = 12
+    keyset_ordering = ("-created", "-id")
+    keyset_estimate_total = True
 
     def get_queryset(self):
-        qs = super().get_queryset().select_related("community", "plan")
-        status = self.request.GET.get("status")
-        beds = self.request.GET.get("beds")
-        max_price = self.request.GET.get("max_price")
-        city = self.request.GET.get("city")
-        q = self.request.GET.get("q")
-        if status in dict(HomeStatus.choices):
-            qs = qs.filter(status=status)
-        if beds and beds.isdigit():
-            qs = qs.filter(beds__gte=int(beds))
-        if max_price:
-            try:
-                qs = qs.filter(price__lte=float(max_price))
-            except ValueError:
-                pass
-        if city:
-            qs = qs.filter(city__icontains=city)
-        if q:
-            qs = qs.filter(Q(address_1__icontains=q) | Q(description__icontains=q))
-        return qs
+        self.filter_state = home_filter_state(self.request.GET)
+        # Cards read cover_photo for its signed URL when AWS_QUERYSTRING_AUTH is on.
+        qs = super().get_queryset().select_related("community", "plan", "cover_photo")
+        return apply_home_filters(qs, self.filter_state)
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         ctx["status_choices"] = HomeStatus.choices
+        ctx["filters"] = self.filter_state
+        ctx["facets"] = home_facets(AvailableHome.objects.all(), self.filter_state)
         return ctx
 
-class HomeDetailView(DetailView):
+class HomeDetailView(ConditionalGetMixin, PageCacheMixin, DetailView):
     model = AvailableHome
     template_name = "catalog/home_detail.html"
     slug_field = "slug"
 
+    def get_queryset(self):
+        return home_detail_queryset()
+
+    def get_page_cache_tags(self):
+        return ["site", f"home:{self.object.pk}", "communities:list", "plans:list"]
+
 
-class HomeShareView(DetailView):
+class HomeShareView(ConditionalGetMixin, PageCacheMixin, GalleryMixin, DetailView):
     model = AvailableHome
     template_name = "catalog/home_share.html"
     slug_field = "slug"
+    validator_fields = ("share_enabled", "share_token")
+
+    def get_queryset(self):
+        return share_queryset(AvailableHome)
+
+    def get_page_cache_tags(self):
+        return [f"home:{self.object.pk}"]
 
     def get_object(self, queryset=None):
         obj = super().get_object(queryset=queryset)
@@ -0,0 +1,62 @@
+# -----------------------------------------------------------------------------
+# catalog/views/loaders.py  (batched querysets for detail + share views)
+# -----------------------------------------------------------------------------
+# Each loader returns a queryset that fetches the object together with every
+# collection its template touches, so a detail page costs the same number of
+# queries no matter how many photos, homes or plans hang off it. Counts come
+# from annotations; templates read `home_count` etc. instead of `.count`.
+# Photo galleries are paged separately (catalog/gallery.py), so pages with a
+# gallery don't prefetch photos at all; plan and home pages only show their
+# first photo and read it from the denormalized cover_photo.
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, OuterRef, Prefetch, Subquery
+
+from ..models import AvailableHome, CombinedClientSharePage, Community, FloorPlan, Photo
+
+
+def community_detail_queryset():
+    return (
+        Community.objects.annotate(
+            home_count=Count("homes", distinct=True),
+            plan_count=Count("available_plans", distinct=True),
+        )
+        .prefetch_related(
+            "amenities",
+            Prefetch("available_plans", queryset=FloorPlan.objects.order_by("name")),
+            Prefetch("homes", queryset=AvailableHome.objects.order_by("-created")),
+        )
+    )
+
+
+def plan_detail_queryset():
+    return (
+        FloorPlan.objects.annotate(community_count=Count("available_in", distinct=True))
+        .select_related("cover_photo")
+        .prefetch_related(Prefetch("available_in", queryset=Community.objects.order_by("name")))
+    )
+
+
+def home_detail_queryset():
+    return AvailableHome.objects.select_related("community", "plan", "cover_photo")
+
+
+def share_queryset(model):
+    # Single-object share pages only render the object's fields and its gallery.
+    return model.objects.all()
+
+
+def combined_share_queryset():
+    return CombinedClientSharePage.objects.select_related("home", "plan", "community")
+
+
+def validator_queryset(model, *fields):
+    """
+    Just enough to build ETag/Last-Modified: `updated`, the newest photo
+    `updated` (as `photos_updated`) and any extra `fields`, in one query.
+    """
+    newest_photo = (
+        Photo.objects.filter(content_type=ContentType.objects.get_for_model(model), object_id=OuterRef("pk"))
+        .order_by("-updated")
+        .values("updated")[:1]
+    )
+    return model.objects.only("updated", *fields).annotate(photos_updated=Subquery(newest_photo))
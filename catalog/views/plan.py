@@ -2,17 +2,31 @@
 # catalog/views/plan.py  (for reference)
 # -----------------------------------------------------------------------------
 from django.views.generic import ListView, DetailView
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.http import Http404
+from core.page_cache import PageCacheMixin
+from core.pagination import KeysetPaginationMixin
 from ..models import FloorPlan
+from ..search import search_queryset
+from .conditional import ConditionalGetMixin
+from .gallery import GalleryMixin
+from .loaders import plan_detail_queryset, share_queryset
 
-class PlanListView(ListView):
+class PlanListView(PageCacheMixin, KeysetPaginationMixin, ListView):
     model = FloorPlan
     template_name = "catalog/plan_list.html"
+    page_cache_tags = ("site", "plans:list", "communities:list")
     paginate_by = 12
+    keyset_ordering = ("name", "id")
 
     def get_queryset(self):
-        qs = super().get_queryset()
+        # Cards show the community count; annotate it rather than COUNT per card.
+        qs = (
+            super().get_queryset()
+            .select_related("cover_photo")
+            .annotate(community_count=Count("available_in", distinct=True))
+            .order_by("name")
+        )
         beds = self.request.GET.get("beds")
         min_sqft = self.request.GET.get("min_sqft")
         max_sqft = self.request.GET.get("max_sqft")
@@ -24,19 +38,32 @@ class PlanListView(ListView):
         if max_sqft and max_sqft.isdigit():
             qs = qs.filter(sq_ft_max__lte=int(max_sqft))
         if q:
-            qs = qs.filter(Q(name__icontains=q) | Q(description__icontains=q))
+            qs = search_queryset(qs, q, Q(name__icontains=q) | Q(description__icontains=q))
         return qs
 
-class PlanDetailView(DetailView):
+class PlanDetailView(ConditionalGetMixin, PageCacheMixin, DetailView):
     model = FloorPlan
     template_name = "catalog/plan_detail.html"
     slug_field = "slug"
 
+    def get_queryset(self):
+        return plan_detail_queryset()
+
+    def get_page_cache_tags(self):
+        return ["site", f"plan:{self.object.pk}", "communities:list"]
+
 
-class PlanShareView(DetailView):
+class PlanShareView(ConditionalGetMixin, PageCacheMixin, GalleryMixin, DetailView):
     model = FloorPlan
     template_name = "catalog/plan_share.html"
     slug_field = "slug"
+    validator_fields = ("share_enabled", "share_token")
+
+    def get_queryset(self):
+        return share_queryset(FloorPlan)
+
+    def get_page_cache_tags(self):
+        return [f"plan:{self.object.pk}"]
 
     def get_object(self, queryset=None):
         obj = super().get_object(queryset=queryset)
@@ -0,0 +1,40 @@
+# -----------------------------------------------------------------------------
+# core/generations.py  (cheap cross-worker invalidation counters)
+# -----------------------------------------------------------------------------
+# Per-process caches (module globals, LocMemCache) are not shared between
+# gunicorn workers. Each cache instead remembers the generation it was built
+# at; writers bump the generation, and readers compare with one os.stat() —
+# no DB or network round-trip. The stamp is a file's mtime in
+# GENERATION_STAMP_DIR, so every worker on the host sees a bump immediately.
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+
+def _stamp_path(name):
+    root = getattr(settings, "GENERATION_STAMP_DIR", None) or Path(tempfile.gettempdir()) / "heritage-rch-generations"
+    # Names may be tags such as "community:12"; keep them filesystem-safe.
+    return Path(root) / (re.sub(r"[^A-Za-z0-9_.-]", "_", name) + ".stamp")
+
+
+def current(name):
+    """Current generation for `name` (0 until the first bump)."""
+    try:
+        return os.stat(_stamp_path(name)).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def bump(name):
+    """Invalidate every per-process cache keyed on `name`."""
+    path = _stamp_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch(exist_ok=True)
+    # Never move backwards, even if two bumps land in the same clock tick.
+    stamp = max(time.time_ns(), current(name) + 1)
+    os.utime(path, ns=(stamp, stamp))
+    return stamp
@@ -0,0 +1,149 @@
+# -----------------------------------------------------------------------------
+# core/media.py  (serve MEDIA_ROOT in production when USE_S3 is off)
+# -----------------------------------------------------------------------------
+# django.views.static.serve (what core/urls.py falls back to) reads the file
+# in Python with no caching headers and no range support, after the whole
+# middleware stack has run. MediaFileMiddleware answers MEDIA_URL requests
+# near the top of the stack instead:
+#
+# - Cache-Control: stored names never change (uploads get unique names,
+#   renditions live under their original's name), so everything is
+#   far-future + immutable except MEDIA_PRIVATE_PREFIXES (client files).
+# - ETag/Last-Modified from the file's size and mtime, with 304s.
+# - Single byte ranges (206/416) and If-Range.
+# - MEDIA_SENDFILE_HEADER = "X-Accel-Redirect" (nginx, with an internal
+#   location at MEDIA_ACCEL_REDIRECT_PREFIX aliased to MEDIA_ROOT) or
+#   "X-Sendfile" (Apache/lighttpd): the front server sends the bytes and
+#   handles ranges itself, so no worker is tied up.
+# - Otherwise full responses are a FileResponse, which gunicorn hands to
+#   os.sendfile() through wsgi.file_wrapper.
+#
+# Images are already compressed, so nothing is precompressed.
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+PRIVATE = "private, max-age=3600"
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+CHUNK_SIZE = 64 * 1024
+
+
+def _byte_range(header, size):
+    """
+    (start, end) inclusive for a single "bytes=" range, None to send the whole
+    file (no/unsupported header), or False when it can't be satisfied.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match or not size:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def _read_range(path, start, length):
+    with open(path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+class MediaFileMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = settings.MEDIA_URL if settings.MEDIA_URL.startswith("/") else None
+        self.root = str(settings.MEDIA_ROOT)
+        self.private_prefixes = tuple(getattr(settings, "MEDIA_PRIVATE_PREFIXES", ("client_files/",)))
+        self.sendfile_header = getattr(settings, "MEDIA_SENDFILE_HEADER", None)
+        self.accel_prefix = getattr(settings, "MEDIA_ACCEL_REDIRECT_PREFIX", "/protected-media/")
+
+    def __call__(self, request):
+        if self.prefix and request.path.startswith(self.prefix) and request.method in ("GET", "HEAD"):
+            return self.serve(request, request.path[len(self.prefix):])
+        return self.get_response(request)
+
+    def serve(self, request, name):
+        try:
+            path = safe_join(self.root, name)
+            stat = os.stat(path)
+        except (SuspiciousFileOperation, ValueError, OSError):
+            raise Http404("Media file not found.")
+        if not os.path.isfile(path):
+            raise Http404("Media file not found.")
+
+        etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+        last_modified = int(stat.st_mtime)
+        headers = {
+            "ETag": etag,
+            "Last-Modified": http_date(last_modified),
+            "Cache-Control": PRIVATE if name.startswith(self.private_prefixes) else IMMUTABLE,
+            "Accept-Ranges": "bytes",
+        }
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if isinstance(not_modified, HttpResponseNotModified):
+            for header, value in headers.items():
+                not_modified[header] = value
+            return not_modified
+
+        content_type, encoding = mimetypes.guess_type(path)
+        content_type = content_type or "application/octet-stream"
+
+        if self.sendfile_header:
+            response = HttpResponse(content_type=content_type)
+            if self.sendfile_header.lower() == "x-accel-redirect":
+                response["X-Accel-Redirect"] = quote(self.accel_prefix.rstrip("/") + "/" + name)
+            else:
+                response[self.sendfile_header] = path
+        else:
+            response = self._local_response(request, path, stat.st_size, etag, last_modified, content_type)
+
+        for header, value in headers.items():
+            response[header] = value
+        if encoding:
+            response["Content-Encoding"] = encoding
+        return response
+
+    def _local_response(self, request, path, size, etag, last_modified, content_type):
+        byte_range = None
+        if_range = request.headers.get("If-Range")
+        if not if_range or if_range == etag or parse_http_date_safe(if_range) == last_modified:
+            byte_range = _byte_range(request.headers.get("Range", ""), size)
+
+        if byte_range is False:
+            response = HttpResponse(status=416, content_type=content_type)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+        if request.method == "HEAD":
+            response = HttpResponse(content_type=content_type)
+            response["Content-Length"] = size
+            return response
+        if byte_range is None:
+            return FileResponse(open(path, "rb"), content_type=content_type)
+
+        start, end = byte_range
+        length = end - start + 1
+        response = StreamingHttpResponse(_read_range(path, start, length), status=206, content_type=content_type)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = length
+        return response
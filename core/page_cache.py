@@ -0,0 +1,184 @@
+# -----------------------------------------------------------------------------
+# core/page_cache.py  (tagged full-page cache for anonymous GET requests)
+# -----------------------------------------------------------------------------
+# Views opt in with PageCacheMixin and declare dependency tags such as
+# "community:12" or "homes:list". A stored page remembers the generation of
+# each tag (core.generations); model signals bump tags on save/delete, so a
+# page is served from cache only while none of its dependencies has changed.
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from core import generations, storage_urls
+
+# Query params that never change what a page renders.
+IGNORED_PARAMS = {"fbclid", "gclid", "msclkid", "mc_cid", "mc_eid"}
+COUNTERS = ("hit", "miss", "stale", "store")
+
+
+def _cache():
+    return caches[getattr(settings, "PAGE_CACHE_ALIAS", "default")]
+
+
+def _enabled():
+    return getattr(settings, "PAGE_CACHE_ENABLED", False)
+
+
+def bump(*tags):
+    """
+    Invalidate every cached page that depends on any of `tags`, once the
+    current transaction commits (at once outside one). Bumping earlier would
+    let a page rendered before the commit, from the old rows, be stored
+    under the new generation.
+    """
+
+    def bump_tags():
+        for tag in tags:
+            generations.bump(f"page:{tag}")
+
+    transaction.on_commit(bump_tags)
+
+
+def tag_versions(tags):
+    """{tag: generation}; generations are bump times in ns (0 = never bumped)."""
+    return {tag: generations.current(f"page:{tag}") for tag in tags}
+
+
+def normalized_query(request):
+    params = sorted(
+        (key, value)
+        for key, values in request.GET.lists()
+        for value in values
+        if value != "" and key not in IGNORED_PARAMS and not key.startswith("utm_")
+    )
+    return urlencode(params)
+
+
+def cache_key(request):
+    raw = "|".join([request.scheme, request.get_host(), request.path, normalized_query(request)])
+    return "page-cache:" + hashlib.md5(raw.encode()).hexdigest()
+
+
+def _count(name):
+    cache = _cache()
+    key = f"page-cache:count:{name}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, None)
+        cache.incr(key)
+
+
+def stats():
+    """Hit/miss/stale/store counters (per cache backend, so per process for locmem)."""
+    cache = _cache()
+    values = cache.get_many([f"page-cache:count:{name}" for name in COUNTERS])
+    return {name: values.get(f"page-cache:count:{name}", 0) for name in COUNTERS}
+
+
+def _cacheable_request(request):
+    if request.method not in ("GET", "HEAD"):
+        return False
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return False
+    # A pending flash message must be rendered (and consumed) for this visitor.
+    return len(get_messages(request)) == 0
+
+
+def _cacheable_response(request, response):
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not response.has_header("Set-Cookie")
+        and "private" not in response.get("Cache-Control", "")
+        and "no-store" not in response.get("Cache-Control", "")
+        # {% csrf_token %} ties the body to this visitor's cookie.
+        and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+        # Set when the body embeds a storage placeholder or a signed URL.
+        and not getattr(request, "_page_cache_skip", False)
+    )
+
+
+class PageCacheMiddleware:
+    """
+    Serve and store pages for views that set `request.page_cache_tags`
+    (via PageCacheMixin). Place after AuthenticationMiddleware and
+    MessageMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not _enabled() or not _cacheable_request(request):
+            return self.get_response(request)
+
+        key = cache_key(request)
+        entry = _cache().get(key)
+        if entry is not None:
+            if tag_versions(entry["tags"]) == entry["tags"]:
+                _count("hit")
+                response = HttpResponse(entry["content"], status=entry["status"])
+                for header, value in entry["headers"]:
+                    response[header] = value
+                response["X-Page-Cache"] = "HIT"
+                # Stored detail pages carry ETag/Last-Modified; honour them here too.
+                return get_conditional_response(
+                    request,
+                    etag=response.get("ETag"),
+                    last_modified=parse_http_date_safe(response.get("Last-Modified", "")),
+                    response=response,
+                )
+            _count("stale")
+
+        started = time.time_ns()
+        with storage_urls.track_volatile() as urls:
+            response = self.get_response(request)
+        if urls.volatile:
+            request._page_cache_skip = True
+        tags = getattr(request, "page_cache_tags", None)
+        if not tags:
+            return response
+        _count("miss")
+        versions = tag_versions(tags)
+        # A tag bumped after rendering began may have changed data this page
+        # already read; storing it would serve that stale copy until the next
+        # bump, so leave it for the next request to render and store.
+        if _cacheable_response(request, response) and max(versions.values()) < started:
+            entry = {
+                "status": response.status_code,
+                "content": response.content,
+                "headers": [(h, v) for h, v in response.items() if h.lower() != "set-cookie"],
+                "tags": versions,
+            }
+            _cache().set(key, entry, getattr(settings, "PAGE_CACHE_TIMEOUT", 60 * 60))
+            _count("store")
+        response["X-Page-Cache"] = "MISS"
+        return response
+
+
+class PageCacheMixin:
+    """
+    View mixin that opts a view into PageCacheMiddleware. Set
+    `page_cache_tags`, or override get_page_cache_tags() when the tags depend
+    on the loaded object.
+    """
+
+    page_cache_tags = ()
+
+    def get_page_cache_tags(self):
+        return list(self.page_cache_tags)
+
+    def render_to_response(self, context, **response_kwargs):
+        self.request.page_cache_tags = self.get_page_cache_tags()
+        return super().render_to_response(context, **response_kwargs)
@@ -0,0 +1,171 @@
+# -----------------------------------------------------------------------------
+# core/pagination.py  (opt-in keyset / cursor pagination for list views)
+# -----------------------------------------------------------------------------
+# Offset pagination runs COUNT(*) on every request and gets slower with each
+# OFFSET. In keyset mode a page is "the next N rows after this cursor", which
+# is one indexed range scan whatever the depth. Enable with KEYSET_PAGINATION.
+import base64
+import json
+import logging
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Q
+from django.http import Http404
+
+logger = logging.getLogger(__name__)
+
+
+def encode_cursor(values):
+    raw = json.dumps(values, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise Http404("Invalid cursor.")
+    if not isinstance(values, list):
+        raise Http404("Invalid cursor.")
+    return values
+
+
+def estimate_count(queryset):
+    """
+    Planner row estimate for `queryset` (Postgres only), or None. Good enough
+    for "about 240 homes" without paying for an exact COUNT(*).
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.query.sql_with_params()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception:
+        logger.warning("Row estimate failed for %s", queryset.model.__name__)
+        return None
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor, paginator):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.paginator = paginator
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return False
+
+    def has_other_pages(self):
+        return self.has_next()
+
+
+class KeysetPaginator:
+    """
+    `ordering` is a tuple of field names in Django order_by syntax whose last
+    entry is unique (normally "id" / "-id"), e.g. ("-created", "-id").
+    """
+
+    def __init__(self, queryset, per_page, ordering):
+        self.queryset = queryset.order_by(*ordering)
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self.fields = [f.lstrip("-") for f in self.ordering]
+
+    def _model_field(self, path):
+        model = self.queryset.model
+        *relations, name = path.split("__")
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        return model._meta.get_field(name)
+
+    def _cursor_values(self, cursor):
+        """
+        The cursor's values, each converted by its ordering field. Cursors
+        come from the query string, so anything that isn't one non-null value
+        of the right type per field is a 404 rather than a database error.
+        """
+        values = decode_cursor(cursor)
+        if len(values) != len(self.fields) or any(value is None for value in values):
+            raise Http404("Invalid cursor.")
+        try:
+            return [self._model_field(f).to_python(v) for f, v in zip(self.fields, values)]
+        except (ValidationError, TypeError, ValueError):
+            raise Http404("Invalid cursor.")
+
+    def _after(self, values):
+        # Lexicographic "row comes after cursor": (a > x) OR (a = x AND b > y) ...
+        condition = Q()
+        for i, name in enumerate(self.ordering):
+            field = self.fields[i]
+            op = "lt" if name.startswith("-") else "gt"
+            step = Q(**{f"{field}__{op}": values[i]})
+            for prev_field, prev_value in zip(self.fields[:i], values[:i]):
+                step &= Q(**{prev_field: prev_value})
+            condition |= step
+        return condition
+
+    def page(self, cursor=None):
+        qs = self.queryset
+        if cursor:
+            qs = qs.filter(self._after(self._cursor_values(cursor)))
+        rows = list(qs[: self.per_page + 1])
+        next_cursor = None
+        if len(rows) > self.per_page:
+            rows = rows[: self.per_page]
+            last = rows[-1]
+            next_cursor = encode_cursor([getattr(last, f) for f in self.fields])
+        return KeysetPage(rows, next_cursor, self)
+
+    def estimated_total(self):
+        return estimate_count(self.queryset)
+
+
+class KeysetPaginationMixin:
+    """
+    ListView mixin. Views set `keyset_ordering`; keyset mode is used when the
+    KEYSET_PAGINATION setting is on, otherwise the normal offset paginator.
+    `?page=N` is ignored in keyset mode so crawlers can't force deep OFFSETs.
+    Search results (`?q=`) keep offset pages because they are ordered by rank.
+    """
+
+    keyset_ordering = None
+    keyset_estimate_total = False
+    cursor_param = "cursor"
+
+    def use_keyset_pagination(self):
+        return bool(
+            getattr(settings, "KEYSET_PAGINATION", False)
+            and self.keyset_ordering
+            and not self.request.GET.get("q")
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.use_keyset_pagination():
+            return super().paginate_queryset(queryset, page_size)
+        paginator = KeysetPaginator(queryset, page_size, self.keyset_ordering)
+        page = paginator.page(self.request.GET.get(self.cursor_param))
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        ctx["keyset_pagination"] = isinstance(ctx.get("paginator"), KeysetPaginator)
+        if ctx["keyset_pagination"] and self.keyset_estimate_total:
+            ctx["estimated_total"] = ctx["paginator"].estimated_total()
+        return ctx
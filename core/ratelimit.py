@@ -0,0 +1,101 @@
+# -----------------------------------------------------------------------------
+# core/ratelimit.py  (token buckets + event counters in the cache backend)
+# -----------------------------------------------------------------------------
+# A bucket holds up to `capacity` tokens and refills at capacity/per_seconds
+# tokens a second; each admitted request takes one. It is stored as two
+# cache keys rather than a (tokens, timestamp) pair, so the hot path is an
+# atomic incr() instead of a read-modify-write:
+#
+#   start  a reference time
+#   used   tokens taken since `start` (cache.incr)
+#
+# A request is admitted while used <= capacity + (now - start) * rate. When
+# a bucket has been idle long enough to hold more than `capacity`, `start`
+# is moved forward so it can't bank an unlimited burst. Refused requests
+# hand their token back (decr).
+#
+# RATE_LIMIT_CACHE_ALIAS picks the cache. With the default per-process
+# locmem cache every worker keeps its own buckets; point it at a shared
+# cache (Redis, database) for exact site-wide limits.
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+def _cache():
+    return caches[getattr(settings, "RATE_LIMIT_CACHE_ALIAS", "default")]
+
+
+def client_ip(request):
+    """
+    The caller's address. Behind RATE_LIMIT_PROXY_COUNT trusted proxies the
+    last one's X-Forwarded-For entry is used; the rest of that header is
+    client-controlled.
+    """
+    proxies = getattr(settings, "RATE_LIMIT_PROXY_COUNT", 0)
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR", "")
+    if proxies and forwarded:
+        hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+        if hops:
+            return hops[-min(proxies, len(hops))]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+class TokenBucket:
+    def __init__(self, name, capacity, per_seconds):
+        self.name = name
+        self.capacity = capacity
+        self.rate = capacity / per_seconds
+        # Long enough that an expired bucket could only have refilled anyway.
+        self.ttl = int(per_seconds * 2) + 60
+
+    def _keys(self, key):
+        prefix = f"ratelimit:{self.name}:{key}"
+        return f"{prefix}:start", f"{prefix}:used"
+
+    def take(self, key=""):
+        """(admitted, seconds until a token is free) for one request."""
+        cache = _cache()
+        start_key, used_key = self._keys(key)
+        now = time.time()
+        if cache.add(start_key, now, self.ttl):
+            cache.set(used_key, 0, self.ttl)
+        start = cache.get(start_key, now)
+        try:
+            used = cache.incr(used_key)
+        except ValueError:
+            cache.add(used_key, 0, self.ttl)
+            used = cache.incr(used_key)
+
+        allowed = self.capacity + (now - start) * self.rate
+        if used > allowed:
+            self.give_back(key)
+            return False, max(1, int((used - allowed) / self.rate) + 1)
+        if allowed - used > self.capacity - 1:
+            # Idle bucket overflowed: rebase so exactly capacity - 1 tokens remain.
+            cache.set(start_key, now - (used - 1) / self.rate, self.ttl)
+        return True, 0
+
+    def give_back(self, key=""):
+        try:
+            _cache().decr(self._keys(key)[1])
+        except ValueError:
+            pass
+
+
+def record(event):
+    """Bump a named counter (e.g. "lead:accepted")."""
+    cache = _cache()
+    key = f"ratelimit:count:{event}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, None)
+        cache.incr(key)
+
+
+def counters(*events):
+    """{event: count} (per cache backend, so per process for locmem)."""
+    values = _cache().get_many([f"ratelimit:count:{event}" for event in events])
+    return {event: values.get(f"ratelimit:count:{event}", 0) for event in events}
@@ -23,6 +23,7 @@ INSTALLED_APPS = [
     "catalog",
     "pages",
     "employee_portal",
+    "outbox",
 ]
 
 MIDDLEWARE = [
@@ -32,6 +33,7 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "core.page_cache.PageCacheMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
@@ -82,4 +84,40 @@ LOGIN_REDIRECT_URL = "/employee-portal/"
 LOGOUT_REDIRECT_URL = "/"
 
 # Placeholder database; each env file overrides as needed
-DATABASES = {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": BASE_DIR / "db.sqlite3"}}
\ No newline at end of file
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",
+        "OPTIONS": {"transaction_mode": "IMMEDIATE"},
+    }
+}
+
+
+# List views: "1" switches the catalog and portal lists to cursor pagination
+# (no COUNT(*), no OFFSET; "load more" links instead of page numbers).
+KEYSET_PAGINATION = os.getenv("KEYSET_PAGINATION", "0").strip().lower() in {"1", "true", "yes", "on"}
+
+# Directory for core.generations stamp files (cross-worker cache invalidation).
+# Must be shared by every worker process on the host; defaults to the temp dir.
+GENERATION_STAMP_DIR = os.getenv("GENERATION_STAMP_DIR") or None
+
+# Full-page cache for anonymous visitors (core.page_cache). Pages are purged
+# by dependency tags when models change; the timeout is only a backstop.
+PAGE_CACHE_ENABLED = os.getenv("PAGE_CACHE", "1").strip().lower() in {"1", "true", "yes", "on"}
+PAGE_CACHE_TIMEOUT = int(os.getenv("PAGE_CACHE_TIMEOUT", str(60 * 60)))
+
+# Outgoing mail is written to the outbox table in the request's transaction
+# and delivered by `manage.py drain_outbox` (cron or a --loop worker) through
+# OUTBOX_DELIVERY_BACKEND, with retries; see outbox/delivery.py.
+EMAIL_BACKEND = "outbox.backends.OutboxBackend"
+OUTBOX_DELIVERY_BACKEND = os.getenv("OUTBOX_DELIVERY_BACKEND", "django.core.mail.backends.smtp.EmailBackend")
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "8"))
+
+# Contact form abuse limits (core/ratelimit.py): (requests, per seconds) per
+# client IP and for the whole site, plus the quickest a person can plausibly
+# fill the form in. RATE_LIMIT_PROXY_COUNT is how many trusted proxies add
+# to X-Forwarded-For in front of Django (0 = use REMOTE_ADDR).
+LEAD_RATE_LIMIT_PER_IP = (int(os.getenv("LEAD_RATE_LIMIT_PER_IP", "5")), 60 * 60)
+LEAD_RATE_LIMIT_GLOBAL = (int(os.getenv("LEAD_RATE_LIMIT_GLOBAL", "60")), 60 * 60)
+LEAD_MIN_SUBMIT_SECONDS = int(os.getenv("LEAD_MIN_SUBMIT_SECONDS", "3"))
+RATE_LIMIT_PROXY_COUNT = int(os.getenv("RATE_LIMIT_PROXY_COUNT", "0"))
@@ -11,8 +11,14 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Take the write lock at BEGIN: a read transaction that later writes
+        # (drain_outbox claiming rows) otherwise fails with "database is
+        # locked" when another process writes first.
+        "OPTIONS": {"transaction_mode": "IMMEDIATE"},
     }
 }
 
-# Email to console in dev
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
\ No newline at end of file
+# Email goes through the outbox; `manage.py drain_outbox` prints it to the console
+OUTBOX_DELIVERY_BACKEND = "django.core.mail.backends.console.EmailBackend"
+# Template edits should show up on reload
+PAGE_CACHE_ENABLED = False
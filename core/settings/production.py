@@ -57,11 +57,31 @@ if USE_S3:
     AWS_DEFAULT_ACL = None
     AWS_S3_FILE_OVERWRITE = False
     AWS_QUERYSTRING_AUTH = env_bool("AWS_QUERYSTRING_AUTH", False)
+    # "path" for MinIO/moto-style local stand-ins; unset means boto3's default.
+    AWS_S3_ADDRESSING_STYLE = os.getenv("AWS_S3_ADDRESSING_STYLE") or None
+
+    # Portal photo/client-file uploads go browser -> bucket via presigned POST
+    # (employee_portal/direct_uploads.py). Needs a bucket CORS rule for POST,
+    # and `manage.py process_pending_uploads` (cron or --loop) to finish photos.
+    DIRECT_UPLOADS = env_bool("DIRECT_UPLOADS", True)
 
     # Django 5+ preferred storage config.
     STORAGES = {
         "default": {"BACKEND": "storages.backends.s3.S3Storage"},
         "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+        # Link-preview cards (catalog/og_cards.py) are fetched by crawlers and
+        # cached by chat apps long after the page rendered, so their URLs are
+        # never signed. Objects are written public-read; on a bucket with ACLs
+        # disabled set OG_CARD_S3_ACL="" and allow public GET on og_cards/* in
+        # the bucket policy instead. Cards written before this storage existed
+        # are private; `manage.py build_og_cards --force` rewrites them.
+        "og_cards": {
+            "BACKEND": "storages.backends.s3.S3Storage",
+            "OPTIONS": {
+                "querystring_auth": False,
+                "default_acl": os.getenv("OG_CARD_S3_ACL", "public-read") or None,
+            },
+        },
     }
 
     # Optional explicit media URL when using a CDN/custom domain.
@@ -71,3 +91,23 @@ else:
     # Local disk fallback when S3 is disabled.
     MEDIA_URL = os.getenv("MEDIA_URL", "/media/")
     MEDIA_ROOT = Path(os.getenv("MEDIA_ROOT", str(BASE_DIR / "media")))
+
+    # Media served by core/media.py, right after WhiteNoise: caching headers,
+    # 304s, ranges and sendfile. MEDIA_SENDFILE_HEADER hands the bytes to the
+    # front server instead: "X-Accel-Redirect" (nginx internal location at
+    # MEDIA_ACCEL_REDIRECT_PREFIX aliased to MEDIA_ROOT) or "X-Sendfile".
+    MIDDLEWARE.insert(2, "core.media.MediaFileMiddleware")
+    MEDIA_SENDFILE_HEADER = os.getenv("MEDIA_SENDFILE_HEADER") or None
+    MEDIA_ACCEL_REDIRECT_PREFIX = os.getenv("MEDIA_ACCEL_REDIRECT_PREFIX", "/protected-media/")
+
+# SMTP for the outbox drainer (outbox/delivery.py); requests never connect.
+EMAIL_HOST = os.getenv("EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", "587"))
+EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS = env_bool("EMAIL_USE_TLS", True)
+EMAIL_TIMEOUT = int(os.getenv("EMAIL_TIMEOUT", "30"))
+DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "webmaster@localhost")
+
+# Deployed behind one reverse proxy; the contact form limits by client IP.
+RATE_LIMIT_PROXY_COUNT = int(os.getenv("RATE_LIMIT_PROXY_COUNT", "1"))
@@ -0,0 +1,196 @@
+# -----------------------------------------------------------------------------
+# core/storage_urls.py  (cached, circuit-broken URLs for stored files)
+# -----------------------------------------------------------------------------
+# storage.url() is a SigV4 signature per call when AWS_QUERYSTRING_AUTH is on,
+# and a gallery renders dozens of them. URLs are cached per worker: signed
+# ones until shortly before they expire, unsigned/CDN ones until evicted.
+#
+# When storage is misconfigured every call raises. After FAILURE_THRESHOLD
+# failures in a row the breaker opens: storage is not called for
+# RESET_AFTER seconds and PLACEHOLDER is served instead, then a single trial
+# call decides whether it closes again. Only the first failure of a run is
+# logged with a traceback.
+#
+# stats() returns this worker's counters and breaker state (the portal's
+# health endpoint shows them).
+#
+# Placeholders and signed URLs must not outlive the response that carries
+# them. Inside track_volatile() (PageCacheMiddleware wraps each render in
+# one), emitting either marks the tracker so the page is not stored.
+import contextvars
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.templatetags.static import static
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = 20000
+FAILURE_THRESHOLD = 5
+RESET_AFTER = 30
+# Signed URLs are dropped this long before they expire (capped at a quarter
+# of their lifetime), so a page never embeds one that is about to lapse.
+SIGNED_URL_MARGIN = 300
+COUNTERS = ("hit", "miss", "failure", "short_circuit", "opened")
+
+_lock = threading.Lock()
+_urls = OrderedDict()  # key -> (url, expires at on the monotonic clock, or None)
+_counts = dict.fromkeys(COUNTERS, 0)
+_breaker = {"failures": 0, "open_until": 0.0, "trial": False}
+_tracker = contextvars.ContextVar("storage_urls_tracker", default=None)
+
+
+class _Tracker:
+    volatile = False
+
+
+class track_volatile:
+    """
+    with track_volatile() as tracker: ...; tracker.volatile is then True if a
+    placeholder or an expiring (signed) URL was handed out inside the block.
+    """
+
+    def __enter__(self):
+        self.tracker = _Tracker()
+        self.token = _tracker.set(self.tracker)
+        return self.tracker
+
+    def __exit__(self, *exc_info):
+        _tracker.reset(self.token)
+
+
+def _mark_volatile():
+    tracker = _tracker.get()
+    if tracker is not None:
+        tracker.volatile = True
+
+
+def _placeholder_url():
+    return getattr(settings, "STORAGE_URL_PLACEHOLDER", None) or static("img/photo-placeholder.svg")
+
+
+def placeholder():
+    _mark_volatile()
+    return _placeholder_url()
+
+
+def is_placeholder(url):
+    return url == _placeholder_url()
+
+
+def _key(storage, name):
+    return (type(storage).__name__, getattr(storage, "bucket_name", None), getattr(storage, "location", ""), name)
+
+
+def _lifetime(storage):
+    """Seconds a URL from `storage` may be cached; None for no expiry."""
+    if not getattr(storage, "querystring_auth", False):
+        return None
+    expire = getattr(storage, "querystring_expire", 3600)
+    return max(expire - min(SIGNED_URL_MARGIN, expire / 4), 0)
+
+
+def signs_urls(storage):
+    """Whether URLs from `storage` carry an expiring signature."""
+    return _lifetime(storage) is not None
+
+
+def _count(name):
+    _counts[name] += 1
+
+
+def _allow_call(now):
+    """Closed: always. Open: never, until RESET_AFTER has passed; then one trial call."""
+    if _breaker["failures"] < FAILURE_THRESHOLD:
+        return True
+    if now < _breaker["open_until"] or _breaker["trial"]:
+        return False
+    _breaker["trial"] = True
+    return True
+
+
+def _record_failure(now, name):
+    _count("failure")
+    _breaker["failures"] += 1
+    _breaker["trial"] = False
+    if _breaker["failures"] == 1:
+        logger.exception("Could not build a storage URL for %s", name)
+    else:
+        logger.warning("Could not build a storage URL for %s (%s failures in a row)", name, _breaker["failures"])
+    if _breaker["failures"] >= FAILURE_THRESHOLD:
+        if _breaker["open_until"] <= now:
+            _count("opened")
+            logger.error("Storage URL circuit open for %ss; serving placeholders", RESET_AFTER)
+        _breaker["open_until"] = now + RESET_AFTER
+
+
+def _record_success():
+    if _breaker["failures"] >= FAILURE_THRESHOLD:
+        logger.warning("Storage URL circuit closed")
+    _breaker.update(failures=0, open_until=0.0, trial=False)
+
+
+def storage_url(storage, name):
+    """URL for `name` in `storage`, or placeholder() while storage is failing."""
+    if not name:
+        return ""
+    key = _key(storage, name)
+    now = time.monotonic()
+    with _lock:
+        entry = _urls.get(key)
+        if entry is not None and (entry[1] is None or entry[1] > now):
+            _urls.move_to_end(key)
+            _count("hit")
+            if entry[1] is not None:
+                _mark_volatile()
+            return entry[0]
+        if not _allow_call(now):
+            _count("short_circuit")
+            return placeholder()
+        _count("miss")
+
+    # Signing happens outside the lock; two threads may sign the same name.
+    try:
+        url = storage.url(name)
+    except Exception:
+        with _lock:
+            _record_failure(time.monotonic(), name)
+        return placeholder()
+
+    lifetime = _lifetime(storage)
+    if lifetime is not None:
+        _mark_volatile()
+    with _lock:
+        _record_success()
+        _urls[key] = (url, None if lifetime is None else now + lifetime)
+        _urls.move_to_end(key)
+        while len(_urls) > MAX_ENTRIES:
+            _urls.popitem(last=False)
+    return url
+
+
+def file_url(field_file):
+    """storage_url() for a FieldFile; "" when the field is empty."""
+    if not field_file:
+        return ""
+    return storage_url(field_file.storage, field_file.name)
+
+
+def stats():
+    """This worker's counters, cache size and breaker state."""
+    with _lock:
+        now = time.monotonic()
+        state = "closed"
+        if _breaker["failures"] >= FAILURE_THRESHOLD:
+            state = "open" if now < _breaker["open_until"] else "half-open"
+        return {**_counts, "cached": len(_urls), "consecutive_failures": _breaker["failures"], "circuit": state}
+
+
+def clear():
+    """Forget cached URLs and reset the breaker (tests, settings changes)."""
+    with _lock:
+        _urls.clear()
+        _breaker.update(failures=0, open_until=0.0, trial=False)
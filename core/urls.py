@@ -2,7 +2,7 @@
 # core/urls.py (homepage enabled + catalog + media)
 # ──────────────────────────────────────────────────────────────────────────────
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, reverse_lazy
 from django.conf import settings
 from django.conf.urls.static import static
 from django.views.generic import RedirectView, TemplateView
@@ -26,9 +26,10 @@ urlpatterns = [
     path("accounts/profile/", RedirectView.as_view(url="/employee-portal/", permanent=False)),
     path("employee-portal/login/", auth_views.LoginView.as_view(template_name="employee_portal/login.html"), name="employee_portal_login"),
     path("employee-portal/logout/", auth_views.LogoutView.as_view(next_page="employee_portal:dashboard"), name="employee_portal_logout"),
-    path("employee-portal/password-reset/", auth_views.PasswordResetView.as_view(template_name="employee_portal/password_reset_form.html"), name="employee_portal_password_reset"),
+    # The reset email is queued by the outbox EMAIL_BACKEND and sent by drain_outbox.
+    path("employee-portal/password-reset/", auth_views.PasswordResetView.as_view(template_name="employee_portal/password_reset_form.html", email_template_name="employee_portal/password_reset_email.html", success_url=reverse_lazy("employee_portal_password_reset_done")), name="employee_portal_password_reset"),
     path("employee-portal/password-reset/done/", auth_views.PasswordResetDoneView.as_view(template_name="employee_portal/password_reset_done.html"), name="employee_portal_password_reset_done"),
-    path("employee-portal/reset/<uidb64>/<token>/", auth_views.PasswordResetConfirmView.as_view(template_name="employee_portal/password_reset_confirm.html"), name="employee_portal_password_reset_confirm"),
+    path("employee-portal/reset/<uidb64>/<token>/", auth_views.PasswordResetConfirmView.as_view(template_name="employee_portal/password_reset_confirm.html", success_url=reverse_lazy("employee_portal_password_reset_complete")), name="employee_portal_password_reset_confirm"),
     path("employee-portal/reset/done/", auth_views.PasswordResetCompleteView.as_view(template_name="employee_portal/password_reset_complete.html"), name="employee_portal_password_reset_complete"),
     path("employee-portal/", include(("employee_portal.urls", "employee_portal"), namespace="employee_portal")),
     path("", include(("pages.urls", "pages"), namespace="pages")),
@@ -43,7 +44,8 @@ urlpatterns = [
     path("sitemap.xml", sitemap, {"sitemaps": sitemaps}, name="sitemap"),
 ]
 
-# Serve user-uploaded media in local dev and in basic non-S3 deployments.
+# Serve user-uploaded media in local dev. Non-S3 production deployments answer
+# MEDIA_URL in core.media.MediaFileMiddleware before this is reached.
 # For long-term production, object storage (S3/R2/etc.) is preferred.
 if settings.DEBUG or (not getattr(settings, "USE_S3", False)):
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,142 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# employee_portal/direct_uploads.py  (presigned-POST uploads straight to S3)
+# ──────────────────────────────────────────────────────────────────────────────
+# With USE_S3 on, the portal forms ask presign() for a one-off S3 POST policy,
+# the browser sends the file to the bucket itself, and the form only submits
+# a signed token naming the stored key. Gunicorn workers never hold the
+# upload body. With USE_S3 off (local disk), the forms keep posting the file
+# as multipart, unchanged.
+#
+# Any S3-compatible endpoint works (AWS_S3_ENDPOINT_URL), e.g. MinIO or
+# `moto_server` locally. The bucket needs a CORS rule allowing POST from the
+# site origin.
+import posixpath
+import uuid
+
+from django import forms
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+from django.utils.text import get_valid_filename
+
+from accounts.models import ClientFile
+from catalog.models import Photo
+
+TOKEN_SALT = "employee_portal.direct_uploads"
+POLICY_EXPIRES = 60 * 10
+# The token outlives the policy a little: the form is submitted after the upload.
+TOKEN_MAX_AGE = 60 * 60
+
+# kind -> (model, file field, key prefix, accepted content-type prefix, max bytes)
+TARGETS = {
+    "photo": (Photo, "image", "photos/", "image/", 25 * 1024 * 1024),
+    "client_file": (ClientFile, "file", "client_files/", "", 100 * 1024 * 1024),
+}
+
+
+def enabled():
+    return getattr(settings, "USE_S3", False) and getattr(settings, "DIRECT_UPLOADS", True)
+
+
+def _storage(kind):
+    model, field_name, *_ = TARGETS[kind]
+    return model._meta.get_field(field_name).storage
+
+
+def presign(kind, filename, content_type):
+    """
+    S3 POST policy for one upload: {"url", "fields", "token"}. The browser
+    posts `fields` plus the file to `url`, then submits `token` with the form.
+    """
+    if kind not in TARGETS:
+        raise ValidationError("Unknown upload type.")
+    _model, _field, prefix, accept, max_bytes = TARGETS[kind]
+    content_type = (content_type or "application/octet-stream").strip().lower()
+    if not content_type.startswith(accept):
+        raise ValidationError("That file type can't be uploaded here.")
+    name = get_valid_filename(posixpath.basename(filename or "")) or "upload"
+    # A fresh folder per upload keeps names unique without asking S3 first.
+    key = f"{prefix}{uuid.uuid4().hex}/{name}"
+
+    storage = _storage(kind)
+    location = getattr(storage, "location", "")
+    post = storage.connection.meta.client.generate_presigned_post(
+        Bucket=storage.bucket_name,
+        Key=posixpath.join(location, key) if location else key,
+        Fields={"Content-Type": content_type},
+        Conditions=[{"Content-Type": content_type}, ["content-length-range", 1, max_bytes]],
+        ExpiresIn=POLICY_EXPIRES,
+    )
+    token = signing.dumps({"kind": kind, "key": key}, salt=TOKEN_SALT)
+    return {"url": post["url"], "fields": post["fields"], "token": token}
+
+
+def claim(token, kind):
+    """
+    Storage name for a token issued by presign(); ValidationError if the token
+    is bad, stale, for another kind, or the object never reached the bucket.
+    """
+    try:
+        data = signing.loads(token, salt=TOKEN_SALT, max_age=TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        raise ValidationError("Upload expired. Please choose the file again.")
+    if data.get("kind") != kind:
+        raise ValidationError("Upload does not belong to this form.")
+    if not _storage(kind).exists(data["key"]):
+        raise ValidationError("Upload did not finish. Please try again.")
+    return data["key"]
+
+
+class DirectUploadFormMixin:
+    """
+    ModelForm mixin: adds a hidden `upload_token`. When presign() uploads are
+    enabled the file input is tagged for static/js/direct-upload.js, and a
+    submitted token fills the file field from the bucket key instead of
+    request.FILES.
+    """
+
+    upload_kind = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.direct_upload_key = None
+        self.fields["upload_token"] = forms.CharField(required=False, widget=forms.HiddenInput)
+        self.file_field_name = TARGETS[self.upload_kind][1]
+        if enabled():
+            field = self.fields[self.file_field_name]
+            # Checked in clean(): either a file or a token is enough.
+            field.required = False
+            field.widget.attrs.update({
+                "data-direct-upload": self.upload_kind,
+                "data-presign-url": reverse("employee_portal:direct_upload_presign"),
+            })
+
+    def clean(self):
+        cleaned_data = super().clean()
+        token = cleaned_data.get("upload_token")
+        if token:
+            try:
+                self.direct_upload_key = claim(token, self.upload_kind)
+            except ValidationError as exc:
+                self.add_error(None, exc)
+        elif (
+            self.file_field_name not in self.errors
+            and not cleaned_data.get(self.file_field_name)
+            and not getattr(self.instance, self.file_field_name)
+        ):
+            self.add_error(self.file_field_name, "Please choose a file.")
+        return cleaned_data
+
+    def direct_upload_stored(self, instance):
+        """Hook for per-model work once `instance` points at the uploaded key."""
+
+    def save(self, commit=True):
+        instance = super().save(commit=False)
+        if self.direct_upload_key:
+            setattr(instance, self.file_field_name, self.direct_upload_key)
+            self.direct_upload_stored(instance)
+        if commit:
+            instance.save()
+            self.save_m2m()
+        return instance
@@ -0,0 +1,167 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# employee_portal/exports.py  (streaming CSV / JSON Lines downloads)
+# ──────────────────────────────────────────────────────────────────────────────
+# stream() returns a StreamingHttpResponse fed by a chunked .iterator() over
+# a .values_list() projection: no model instances, no list of rows, so
+# memory stays flat whether a table has fifty rows or fifty thousand. Each
+# dataset applies the same filters as its portal list (filters.py).
+#
+#   /employee-portal/exports/<dataset>.<csv|jsonl>?<list filters>
+import csv
+import json
+from datetime import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from catalog.models import AvailableHome, Community, FloorPlan, Lead
+
+from . import filters
+
+CHUNK_SIZE = 2000
+FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson; charset=utf-8",
+}
+# Spreadsheet apps evaluate cells starting with these; lead names and
+# messages come from the public contact form.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class Dataset:
+    def __init__(self, model, columns, ordering, filter_queryset):
+        self.model = model
+        # (output name, values_list() lookup)
+        self.columns = columns
+        self.ordering = ordering
+        self.filter_queryset = filter_queryset
+
+    @property
+    def names(self):
+        return [name for name, _lookup in self.columns]
+
+    def rows(self, params):
+        qs = self.filter_queryset(self.model.objects.all(), params)
+        qs = qs.order_by(*self.ordering).values_list(*(lookup for _name, lookup in self.columns))
+        return qs.iterator(chunk_size=CHUNK_SIZE)
+
+
+DATASETS = {
+    "leads": Dataset(
+        Lead,
+        (
+            ("id", "id"),
+            ("created", "created"),
+            ("name", "name"),
+            ("email", "email"),
+            ("phone", "phone"),
+            ("source", "source"),
+            ("page_url", "page_url"),
+            ("message", "message"),
+        ),
+        ("-created", "-id"),
+        filters.filter_leads,
+    ),
+    "homes": Dataset(
+        AvailableHome,
+        (
+            ("id", "id"),
+            ("slug", "slug"),
+            ("community", "community__name"),
+            ("plan", "plan__name"),
+            ("address_1", "address_1"),
+            ("address_2", "address_2"),
+            ("city", "city"),
+            ("state", "state"),
+            ("postal_code", "postal_code"),
+            ("beds", "beds"),
+            ("baths", "baths"),
+            ("sq_ft", "sq_ft"),
+            ("price", "price"),
+            ("status", "status"),
+            ("is_featured", "is_featured"),
+            ("share_enabled", "share_enabled"),
+            ("created", "created"),
+            ("updated", "updated"),
+        ),
+        ("-created", "-id"),
+        filters.filter_homes,
+    ),
+    "plans": Dataset(
+        FloorPlan,
+        (
+            ("id", "id"),
+            ("slug", "slug"),
+            ("name", "name"),
+            ("beds", "beds"),
+            ("baths", "baths"),
+            ("sq_ft_min", "sq_ft_min"),
+            ("sq_ft_max", "sq_ft_max"),
+            ("is_featured", "is_featured"),
+            ("share_enabled", "share_enabled"),
+            ("created", "created"),
+            ("updated", "updated"),
+        ),
+        ("name", "id"),
+        filters.filter_plans,
+    ),
+    "communities": Dataset(
+        Community,
+        (
+            ("id", "id"),
+            ("slug", "slug"),
+            ("name", "name"),
+            ("tagline", "tagline"),
+            ("city", "city"),
+            ("state", "state"),
+            ("status", "status"),
+            ("is_featured", "is_featured"),
+            ("share_enabled", "share_enabled"),
+            ("created", "created"),
+            ("updated", "updated"),
+        ),
+        ("name", "id"),
+        filters.filter_communities,
+    ),
+}
+
+
+class _Echo:
+    """csv.writer target that hands each formatted line back instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+def _cell(value):
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="seconds")
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def csv_lines(dataset, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(dataset.names)
+    for row in rows:
+        yield writer.writerow([_cell(value) for value in row])
+
+
+def jsonl_lines(dataset, rows):
+    names = dataset.names
+    for row in rows:
+        yield json.dumps(dict(zip(names, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+def stream(name, fmt, params):
+    """The download response for DATASETS[name]; KeyError for an unknown name or format."""
+    dataset = DATASETS[name]
+    content_type = FORMATS[fmt]
+    lines = csv_lines if fmt == "csv" else jsonl_lines
+    response = StreamingHttpResponse(lines(dataset, dataset.rows(params)), content_type=content_type)
+    filename = f"{name}-{timezone.localdate():%Y%m%d}.{fmt}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    response["Cache-Control"] = "private, no-store"
+    return response
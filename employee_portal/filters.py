@@ -0,0 +1,115 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# employee_portal/filters.py  (GET filters shared by portal lists and exports)
+# ──────────────────────────────────────────────────────────────────────────────
+# Each function narrows a queryset by the request's GET params. The list
+# views and the matching export (exports.py) call the same one, so "Export"
+# on a filtered list downloads exactly the rows on screen, every page of
+# them. Unknown or malformed values are ignored rather than raising.
+from datetime import date
+
+from django.db.models import Q
+
+from accounts.models import CustomUser
+from catalog.models import CommunityStatus, HomeStatus, LeadSource
+
+
+def _text(params, name):
+    return " ".join(params.get(name, "").split())
+
+
+def _int(params, name):
+    # isdigit() alone accepts "²" and other non-ASCII digits int() rejects;
+    # the length cap keeps ids within a 64-bit column.
+    value = params.get(name, "").strip()
+    if value.isascii() and value.isdigit() and len(value) <= 18:
+        return int(value)
+    return None
+
+
+def _date(params, name):
+    try:
+        return date.fromisoformat(params.get(name, "").strip())
+    except ValueError:
+        return None
+
+
+def filter_communities(qs, params):
+    status = params.get("status")
+    if status in dict(CommunityStatus.choices):
+        qs = qs.filter(status=status)
+    q = _text(params, "q")
+    if q:
+        qs = qs.filter(Q(name__icontains=q) | Q(city__icontains=q) | Q(slug__icontains=q))
+    return qs
+
+
+def filter_plans(qs, params):
+    beds = _int(params, "beds")
+    if beds is not None:
+        qs = qs.filter(beds__gte=beds)
+    q = _text(params, "q")
+    if q:
+        qs = qs.filter(Q(name__icontains=q) | Q(slug__icontains=q))
+    return qs
+
+
+def filter_homes(qs, params):
+    status = params.get("status")
+    if status in dict(HomeStatus.choices):
+        qs = qs.filter(status=status)
+    community = _int(params, "community")
+    if community is not None:
+        qs = qs.filter(community_id=community)
+    plan = _int(params, "plan")
+    if plan is not None:
+        qs = qs.filter(plan_id=plan)
+    q = _text(params, "q")
+    if q:
+        qs = qs.filter(
+            Q(address_1__icontains=q)
+            | Q(city__icontains=q)
+            | Q(postal_code__icontains=q)
+            | Q(community__name__icontains=q)
+        )
+    return qs
+
+
+def filter_leads(qs, params):
+    # Mirrors LeadAdmin: list_filter ("source", "created") and its search_fields.
+    source = params.get("source")
+    if source in dict(LeadSource.choices):
+        qs = qs.filter(source=source)
+    since = _date(params, "since")
+    if since:
+        qs = qs.filter(created__date__gte=since)
+    until = _date(params, "until")
+    if until:
+        qs = qs.filter(created__date__lte=until)
+    q = _text(params, "q")
+    if q:
+        qs = qs.filter(
+            Q(name__icontains=q) | Q(email__icontains=q) | Q(phone__icontains=q) | Q(message__icontains=q)
+        )
+    return qs
+
+
+def filter_share_pages(qs, params):
+    q = _text(params, "q")
+    if q:
+        qs = qs.filter(
+            Q(title__icontains=q)
+            | Q(home__address_1__icontains=q)
+            | Q(plan__name__icontains=q)
+            | Q(community__name__icontains=q)
+        )
+    return qs
+
+
+def filter_users(qs, params):
+    role = params.get("role")
+    if role in dict(CustomUser.ROLE_CHOICES):
+        qs = qs.filter(role=role)
+    q = _text(params, "q")
+    if q:
+        qs = qs.filter(Q(email__icontains=q) | Q(first_name__icontains=q) | Q(last_name__icontains=q))
+    return qs
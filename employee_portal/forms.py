@@ -132,3 +132,26 @@ class CombinedClientSharePageForm(forms.ModelForm):
         if len([value for value in order if value]) != len(set([value for value in order if value])):
             raise ValidationError("Section order must contain each section only once.")
         return cleaned_data
+
+
+class InventoryImportForm(forms.Form):
+    KIND_CHOICES = (("homes", "Available homes"), ("plans", "Floor plans"))
+
+    kind = forms.ChoiceField(choices=KIND_CHOICES, label="Import")
+    file = forms.FileField(help_text="CSV or .xlsx with a header row; see the column list below.")
+    community = forms.ModelChoiceField(
+        queryset=Community.objects.all(),
+        required=False,
+        help_text="Homes only: used for rows without a community column.",
+    )
+    dry_run = forms.BooleanField(required=False, label="Check only (don't save)")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        apply_bootstrap_classes(self)
+
+    def clean_file(self):
+        upload = self.cleaned_data["file"]
+        if not upload.name.lower().endswith((".csv", ".xlsx")):
+            raise ValidationError("Upload a .csv or .xlsx file.")
+        return upload
@@ -0,0 +1,337 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# employee_portal/imports.py  (bulk CSV / XLSX upserts of homes and floor plans)
+# ──────────────────────────────────────────────────────────────────────────────
+# Builders send a spreadsheet per community release. import_file() streams
+# its rows, validates them CHUNK_SIZE at a time with the portal forms' rules
+# (an import form per row, minus the FK and slug fields), and upserts each
+# chunk with bulk_create(update_conflicts=True) keyed on slug. Communities,
+# plans and existing slugs are loaded into lookup maps once per file, so
+# validation makes no queries per row.
+#
+# Rows match existing objects by slug: a "slug" column if the sheet has one,
+# else the slug already used by the same home (community + street address)
+# or plan (name), else a new slug from the address / name, suffixed -2, -3...
+# when taken. Re-importing a corrected sheet therefore updates in place.
+#
+# The whole file is one transaction: any row error rolls every row back, and
+# the errors come back with their sheet row numbers.
+#
+# Upserted rows get a blank og_card_key, so process_pending_uploads draws
+# their link-preview cards in the background (bulk_create sends no post_save).
+import csv
+import io
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.utils.text import slugify
+
+from catalog.models import AvailableHome, Community, FloorPlan, HomeStatus
+from catalog.search import index_objects
+from catalog.signals import rows_updated
+
+from .forms import AvailableHomeForm, FloorPlanForm
+
+CHUNK_SIZE = 500
+# Header spellings seen in builder sheets -> field name.
+HEADER_ALIASES = {
+    "address": "address_1",
+    "street": "address_1",
+    "address_line_1": "address_1",
+    "address_line_2": "address_2",
+    "unit": "address_2",
+    "zip": "postal_code",
+    "zip_code": "postal_code",
+    "bedrooms": "beds",
+    "bathrooms": "baths",
+    "sqft": "sq_ft",
+    "square_feet": "sq_ft",
+    "sqft_min": "sq_ft_min",
+    "sqft_max": "sq_ft_max",
+    "floor_plan": "plan",
+    "plan_name": "name",
+}
+NUMERIC_FIELDS = {"beds", "baths", "sq_ft", "sq_ft_min", "sq_ft_max", "price"}
+BOOLEAN_FIELDS = {"share_enabled"}
+FALSE_VALUES = {"", "0", "n", "no", "false", "off"}
+STATUS_LABELS = {label.lower(): value for value, label in HomeStatus.choices}
+
+
+class ImportAborted(Exception):
+    pass
+
+
+class HomeImportForm(AvailableHomeForm):
+    class Meta(AvailableHomeForm.Meta):
+        fields = [
+            "address_1", "address_2", "city", "state", "postal_code", "beds", "baths",
+            "sq_ft", "price", "status", "description", "share_enabled",
+        ]
+
+    def validate_unique(self):
+        # Slugs are assigned per batch in import_file(); other unique fields aren't imported.
+        pass
+
+
+class PlanImportForm(FloorPlanForm):
+    class Meta(FloorPlanForm.Meta):
+        fields = ["name", "beds", "baths", "sq_ft_min", "sq_ft_max", "description", "share_enabled"]
+
+    def validate_unique(self):
+        pass
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    updated: int = 0
+    # [(sheet row number, message)]
+    errors: list = field(default_factory=list)
+    dry_run: bool = False
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+def _header(value):
+    name = slugify(str(value or "")).replace("-", "_")
+    return HEADER_ALIASES.get(name, name)
+
+
+def _csv_rows(file):
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.reader(text)
+        headers = [_header(value) for value in next(reader, [])]
+        for row in reader:
+            yield dict(zip(headers, row))
+    except UnicodeDecodeError:
+        # Excel's plain "CSV" export on Windows is cp1252, not UTF-8.
+        raise ImportAborted("That file isn't UTF-8 text; in Excel, save the sheet as \"CSV UTF-8\" and upload it again.")
+    except csv.Error as exc:
+        raise ImportAborted(f"That file isn't a readable CSV ({exc}); save the sheet as \"CSV UTF-8\" and upload it again.")
+    finally:
+        text.detach()
+
+
+def _xlsx_rows(file):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportAborted("XLSX import needs openpyxl installed; upload a CSV instead.")
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except Exception:
+        raise ImportAborted("That file isn't a readable .xlsx workbook.")
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        headers = [_header(value) for value in next(rows, ())]
+        for row in rows:
+            yield {name: "" if value is None else value for name, value in zip(headers, row)}
+    finally:
+        workbook.close()
+
+
+def read_rows(file, filename):
+    """(sheet row number, {field: raw value}) for each data row; blank rows skipped."""
+    reader = _xlsx_rows if filename.lower().endswith(".xlsx") else _csv_rows
+    for number, row in enumerate(reader(file), start=2):
+        row = {name: str(value).strip() for name, value in row.items() if name}
+        if any(row.values()):
+            yield number, row
+
+
+def _form_data(row):
+    data = dict(row)
+    for name in NUMERIC_FIELDS & data.keys():
+        data[name] = data[name].replace("$", "").replace(",", "")
+    for name in BOOLEAN_FIELDS & data.keys():
+        data[name] = "on" if data[name].lower() not in FALSE_VALUES else ""
+    if "status" in data:
+        status = data["status"].lower()
+        data["status"] = STATUS_LABELS.get(status, status) or HomeStatus.COMING
+    return data
+
+
+def _errors(form):
+    return "; ".join(
+        f"{name}: {' '.join(messages)}" if name != "__all__" else " ".join(messages)
+        for name, messages in form.errors.items()
+    )
+
+
+def _lookup(model, label_field):
+    """{slug or lowercased name/label: pk} for the community/plan reference columns."""
+    lookup = {}
+    for pk, slug, label in model.objects.values_list("pk", "slug", label_field):
+        lookup.setdefault(label.lower(), pk)
+        lookup[slug] = pk
+    return lookup
+
+
+class _Importer:
+    model = None
+    form_class = None
+
+    def __init__(self):
+        self.slugs = {}  # existing slug -> identity
+        self.identities = {}  # identity -> existing slug
+        self.seen = {}  # slug -> sheet row already using it in this file
+
+    def remember(self, slug, identity):
+        self.slugs[slug] = identity
+        self.identities.setdefault(identity, slug)
+
+    def slug_for(self, obj, row):
+        identity = self.identity(obj)
+        slug = row.get("slug") or self.identities.get(identity)
+        if slug:
+            return slugify(slug)[:150]
+        base = slugify(self.slug_source(obj))[:150] or self.model._meta.model_name
+        slug, n = base, 1
+        while slug in self.slugs or slug in self.seen:
+            n += 1
+            slug = f"{base[:150 - len(str(n)) - 1]}-{n}"
+        return slug
+
+    def build(self, number, row):
+        """(unsaved instance, None) or (None, error message)."""
+        form = self.form_class(data=_form_data(row))
+        if not form.is_valid():
+            return None, _errors(form)
+        obj = form.instance
+        error = self.resolve(obj, row)
+        if error:
+            return None, error
+        obj.slug = self.slug_for(obj, row)
+        if obj.slug in self.seen:
+            return None, f"Same {self.model._meta.verbose_name} as row {self.seen[obj.slug]}."
+        self.seen[obj.slug] = number
+        self.identities.setdefault(self.identity(obj), obj.slug)
+        return obj, None
+
+    def resolve(self, obj, row):
+        return None
+
+    def save(self, objs):
+        """Upsert one validated chunk; returns how many rows were new."""
+        existing = sum(1 for obj in objs if obj.slug in self.slugs)
+        for obj in objs:
+            obj.og_card_key = ""
+        self.model.objects.bulk_create(
+            objs,
+            update_conflicts=True,
+            unique_fields=["slug"],
+            update_fields=[*self.form_class._meta.fields, *self.update_extra, "og_card_key", "updated"],
+        )
+        return len(objs) - existing
+
+
+class _HomeImporter(_Importer):
+    model = AvailableHome
+    form_class = HomeImportForm
+    update_extra = ["community", "plan"]
+
+    def __init__(self, community=None):
+        super().__init__()
+        self.community = community
+        self.communities = _lookup(Community, "name")
+        self.plans = _lookup(FloorPlan, "name")
+        for slug, community_id, address in AvailableHome.objects.values_list("slug", "community_id", "address_1"):
+            self.remember(slug, (community_id, address.lower()))
+
+    def identity(self, obj):
+        return obj.community_id, obj.address_1.lower()
+
+    def slug_source(self, obj):
+        return obj.full_address
+
+    def resolve(self, obj, row):
+        ref = row.get("community", "")
+        if ref:
+            obj.community_id = self.communities.get(ref) or self.communities.get(ref.lower())
+            if obj.community_id is None:
+                return f"community: no community named “{ref}”."
+        elif self.community is not None:
+            obj.community_id = self.community.pk
+        else:
+            return "community: This field is required."
+        ref = row.get("plan", "")
+        if ref:
+            obj.plan_id = self.plans.get(ref) or self.plans.get(ref.lower())
+            if obj.plan_id is None:
+                return f"plan: no floor plan named “{ref}”."
+        if not obj.address_1:
+            return "address_1: This field is required."
+        return None
+
+
+class _PlanImporter(_Importer):
+    model = FloorPlan
+    form_class = PlanImportForm
+    update_extra = []
+
+    def __init__(self, community=None):
+        super().__init__()
+        for slug, name in FloorPlan.objects.values_list("slug", "name"):
+            self.remember(slug, name.lower())
+
+    def identity(self, obj):
+        return obj.name.lower()
+
+    def slug_source(self, obj):
+        return obj.name
+
+
+IMPORTERS = {"homes": _HomeImporter, "plans": _PlanImporter}
+
+
+def _chunks(rows):
+    chunk = []
+    for item in rows:
+        chunk.append(item)
+        if len(chunk) == CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_file(kind, file, filename, community=None, dry_run=False):
+    """
+    Upsert every row of `file` as homes or plans (`kind`); `community` is the
+    default for home rows without a community column. Returns ImportResult.
+    """
+    result = ImportResult(dry_run=dry_run)
+    touched = []
+    try:
+        with transaction.atomic():
+            importer = IMPORTERS[kind](community)
+            for chunk in _chunks(read_rows(file, filename)):
+                objs = []
+                for number, row in chunk:
+                    obj, error = importer.build(number, row)
+                    if error:
+                        result.errors.append((number, error))
+                    else:
+                        objs.append(obj)
+                if objs and not result.errors:
+                    created = importer.save(objs)
+                    result.created += created
+                    result.updated += len(objs) - created
+                    touched.extend(obj.slug for obj in objs)
+            if result.errors or dry_run:
+                raise ImportAborted()
+    except ImportAborted as exc:
+        if exc.args:
+            result.errors.append((0, exc.args[0]))
+        if result.errors:
+            result.created = result.updated = 0
+        return result
+
+    # bulk_create sends no post_save: reindex and purge pages here.
+    for start in range(0, len(touched), CHUNK_SIZE):
+        objs = list(importer.model.objects.filter(slug__in=touched[start:start + CHUNK_SIZE]))
+        index_objects(objs)
+        rows_updated(importer.model, [obj.pk for obj in objs])
+    return result
@@ -0,0 +1,46 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# employee_portal/management/commands/import_inventory.py
+# ──────────────────────────────────────────────────────────────────────────────
+# The portal's Import Inventory page for the command line (see
+# employee_portal/imports.py): upsert homes or floor plans from a CSV or
+# .xlsx sheet. Nothing is saved if any row fails; --dry-run only checks.
+# Share images are redrawn afterwards (build_og_cards skips unchanged cards).
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from catalog.models import Community
+from employee_portal import imports
+
+
+class Command(BaseCommand):
+    help = "Create or update available homes or floor plans from a CSV / XLSX file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(imports.IMPORTERS))
+        parser.add_argument("path")
+        parser.add_argument("--community", help="Slug of the community for home rows without a community column")
+        parser.add_argument("--dry-run", action="store_true", help="Validate every row but save nothing")
+
+    def handle(self, *args, **opts):
+        community = None
+        if opts["community"]:
+            community = Community.objects.filter(slug=opts["community"]).first()
+            if community is None:
+                raise CommandError(f"No community with slug {opts['community']!r}.")
+        try:
+            file = open(opts["path"], "rb")
+        except OSError as exc:
+            raise CommandError(str(exc))
+        with file:
+            result = imports.import_file(opts["kind"], file, opts["path"], community=community, dry_run=opts["dry_run"])
+
+        for number, message in result.errors:
+            self.stderr.write(f"row {number}: {message}" if number else message)
+        if not result.ok:
+            raise CommandError(f"{len(result.errors)} row error(s); nothing was imported.")
+        summary = f"{result.created} created, {result.updated} updated."
+        if result.dry_run:
+            self.stdout.write(self.style.SUCCESS(f"Check passed (nothing saved): {summary}"))
+            return
+        call_command("build_og_cards", stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -1,7 +1,29 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 from django import forms
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db.models import Max
+from django.urls import reverse
+
+from catalog.dedup import content_hash, photo_twins
+from catalog.ingest import save_normalized_records
 from catalog.models import Photo
+from catalog.signals import rows_updated
+from employee_portal import direct_uploads
+from employee_portal.direct_uploads import DirectUploadFormMixin
+
+logger = logging.getLogger(__name__)
+
+# Normalizing, rendering and storing one photo is mostly Pillow codec work and
+# storage I/O, both of which release the GIL, so a few threads per request
+# overlap well without forking the gunicorn worker.
+BULK_UPLOAD_WORKERS = 4
+
+class PhotoForm(DirectUploadFormMixin, forms.ModelForm):
+    upload_kind = "photo"
 
-class PhotoForm(forms.ModelForm):
     class Meta:
         model = Photo
         fields = ['image', 'caption', 'sort_order']
@@ -20,3 +42,147 @@ class PhotoForm(forms.ModelForm):
             else:
                 css_class = "form-control"
             widget.attrs["class"] = f"{existing_classes} {css_class}".strip()
+
+    def direct_upload_stored(self, instance):
+        # The upload skipped the worker; hashing, normalizing and renditions
+        # read it back from the bucket, so they run in process_pending_uploads.
+        instance.pending = True
+
+
+class MultipleFileInput(forms.ClearableFileInput):
+    allow_multiple_selected = True
+
+
+class MultipleFileField(forms.FileField):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("widget", MultipleFileInput(attrs={"accept": "image/*", "class": "form-control"}))
+        super().__init__(*args, **kwargs)
+
+    def clean(self, data, initial=None):
+        if isinstance(data, (list, tuple)):
+            return [super(MultipleFileField, self).clean(item, initial) for item in data]
+        return [super().clean(data, initial)] if data else []
+
+
+def _hash(photo):
+    try:
+        return content_hash(photo.image)
+    except Exception:
+        logger.exception("Could not hash %s", photo.image.name)
+        return None
+
+
+def _ingest(photo, upload):
+    """
+    Store and process one uploaded file on a pool thread (no DB access here).
+    Returns (NormalizedImage or None, error message or None).
+    """
+    try:
+        photo.image = upload
+        normalized = photo.ingest_image(record=False)
+    except Exception:
+        logger.exception("Bulk photo upload failed for %s", upload)
+        return None, "Upload failed. Please verify S3 bucket permissions and storage settings."
+    if normalized is None:
+        photo.image.delete(save=False)
+        return None, "Not a readable image."
+    return normalized, None
+
+
+class BulkPhotoUploadForm(forms.Form):
+    """
+    Many photos for one owner at once, from a multi-file input or (with
+    direct uploads on) one `upload_token` per file already in the bucket.
+    """
+
+    max_files = 50
+
+    images = MultipleFileField(required=False, label="Photos")
+    upload_token = forms.Field(required=False, widget=forms.MultipleHiddenInput)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.direct_upload_keys = []
+        if direct_uploads.enabled():
+            self.fields["images"].widget.attrs.update({
+                "data-direct-upload": "photo",
+                "data-presign-url": reverse("employee_portal:direct_upload_presign"),
+            })
+
+    def clean(self):
+        cleaned_data = super().clean()
+        files = cleaned_data.get("images") or []
+        tokens = [token for token in cleaned_data.get("upload_token") or [] if token]
+        if "images" in self.errors:
+            return cleaned_data
+        if not files and not tokens:
+            self.add_error("images", "Please choose at least one photo.")
+        elif len(files) + len(tokens) > self.max_files:
+            self.add_error("images", f"Please upload at most {self.max_files} photos at a time.")
+        else:
+            for token in tokens:
+                try:
+                    self.direct_upload_keys.append(direct_uploads.claim(token, "photo"))
+                except ValidationError as exc:
+                    self.add_error(None, exc)
+        return cleaned_data
+
+    def save(self, owner):
+        """
+        Hash every uploaded file, reuse stored photos with the same bytes,
+        ingest the rest on a thread pool, then insert the rows with one
+        bulk_create after the owner's existing photos. Direct uploads become
+        pending rows for process_pending_uploads. Returns (photos, errors);
+        errors are "filename: message" for skipped files.
+        """
+        files = list(self.cleaned_data["images"])
+        content_type = ContentType.objects.get_for_model(owner)
+        photos = [Photo(content_type=content_type, object_id=owner.pk, image=upload) for upload in files]
+        created, records, errors = [], [], []
+        if files:
+            first = {}
+            with ThreadPoolExecutor(max_workers=min(BULK_UPLOAD_WORKERS, len(files))) as pool:
+                digests = list(pool.map(_hash, photos))
+                for photo, digest in zip(photos, digests):
+                    # Set before storing: Photo.image is sharded by content hash.
+                    photo.content_hash = digest or ""
+                twins = photo_twins(digests)
+                # Only the first file with a given hash is processed, and only if
+                # no stored photo has it yet.
+                todo = [
+                    i
+                    for i, digest in enumerate(digests)
+                    if not digest or (digest not in twins and first.setdefault(digest, i) == i)
+                ]
+                ingested = dict(zip(todo, pool.map(_ingest, [photos[i] for i in todo], [files[i] for i in todo])))
+
+            for i, (photo, upload, digest) in enumerate(zip(photos, files, digests)):
+                if i in ingested:
+                    normalized, error = ingested[i]
+                    records.append(normalized)
+                else:
+                    twin = twins.get(digest) or photos[first[digest]]
+                    error = None if digest in twins else ingested[first[digest]][1]
+                    if not error:
+                        photo.share_image_of(twin)
+                if error:
+                    errors.append(f"{upload.name}: {error}")
+                else:
+                    created.append(photo)
+        created += [
+            Photo(content_type=content_type, object_id=owner.pk, image=key, pending=True)
+            for key in self.direct_upload_keys
+        ]
+        if not created:
+            return created, errors
+
+        last = Photo.objects.filter(content_type=content_type, object_id=owner.pk).aggregate(m=Max("sort_order"))["m"]
+        start = 0 if last is None else last + 1
+        for offset, photo in enumerate(created):
+            photo.sort_order = start + offset
+        save_normalized_records(records)
+        Photo.objects.bulk_create(created)
+        # bulk_create sends no post_save: refresh the cover and purge pages here.
+        owner.refresh_cover_photo()
+        rows_updated(type(owner), [owner.pk])
+        return created, errors
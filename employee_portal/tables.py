@@ -0,0 +1,105 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# employee_portal/tables.py  (sortable, searchable, paged portal list tables)
+# ──────────────────────────────────────────────────────────────────────────────
+# PortalTableMixin turns a ListView into a table: ?sort=<column> or
+# ?sort=-<column> orders it, ?q= and one optional choice filter narrow it
+# (the list's filters.py function, shared with its export), and pages come
+# from KeysetPaginationMixin. Each view names the columns it renders, so
+# select_related()/only() load exactly those and nothing per row.
+#
+# Sorting on a column of this table keyset-paginates on (column, id) when
+# KEYSET_PAGINATION is on; every default sort, and the sortable home and
+# user columns, have a (column, id) index. Columns that are nullable or live
+# on a related table (keyset=False) fall back to offset pages.
+#
+# Templates include employee_portal/_table_toolbar.html and _table_head.html
+# and render their own <tbody>.
+from dataclasses import dataclass
+
+from django.db.models import F
+
+from core.pagination import KeysetPaginationMixin
+
+
+@dataclass(frozen=True)
+class Column:
+    label: str
+    sort: str = ""  # order_by() lookup; blank = not sortable
+    keyset: bool = True
+
+    @property
+    def name(self):
+        return self.sort.replace("__", "-")
+
+
+class PortalTableMixin(KeysetPaginationMixin):
+    paginate_by = 50
+    table_columns = ()
+    # Column lookup to sort by without ?sort=, "-" prefixed for descending.
+    default_sort = "id"
+    # filters.py function (wrap in staticmethod) and the choice filter the
+    # toolbar offers: (GET param, label, choices).
+    table_filter = None
+    table_choice_filter = None
+    table_select_related = ()
+    table_only = ()
+
+    def get_sort(self):
+        """(Column, descending) from ?sort=, else default_sort."""
+        sortable = {column.name: column for column in self.table_columns if column.sort}
+        value = self.request.GET.get("sort", "")
+        column = sortable.get(value.lstrip("-"))
+        if column is None:
+            value = self.default_sort
+            column = next(
+                (c for c in sortable.values() if c.sort == value.lstrip("-")),
+                Column("", value.lstrip("-")),
+            )
+        return column, value.startswith("-")
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.table_select_related:
+            qs = qs.select_related(*self.table_select_related)
+        if self.table_only:
+            qs = qs.only(*self.table_only)
+        if self.table_filter is not None:
+            qs = self.table_filter(qs, self.request.GET)
+
+        self.sort_column, self.sort_descending = self.get_sort()
+        sign = "-" if self.sort_descending else ""
+        ordering = (f"{sign}{self.sort_column.sort}", f"{sign}id")
+        if self.sort_column.keyset:
+            self.keyset_ordering = ordering
+            return qs.order_by(*ordering)
+        # Offset pages; blanks (no price, no plan) go last either way.
+        self.keyset_ordering = None
+        field = F(self.sort_column.sort)
+        first = field.desc(nulls_last=True) if self.sort_descending else field.asc(nulls_last=True)
+        return qs.order_by(first, ordering[1])
+
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        descending = self.sort_descending
+        columns = []
+        for column in self.table_columns:
+            active = bool(column.sort) and column == self.sort_column
+            columns.append({
+                "label": column.label,
+                "sortable": bool(column.sort),
+                "direction": ("descending" if descending else "ascending") if active else "",
+                # A second click on the active column flips it.
+                "sort_param": f"-{column.name}" if active and not descending else column.name,
+            })
+        choice = None
+        if self.table_choice_filter:
+            param, label, choices = self.table_choice_filter
+            choice = {"param": param, "label": label, "choices": choices, "value": self.request.GET.get(param, "")}
+        ctx["table"] = {
+            "columns": columns,
+            "q": self.request.GET.get("q", ""),
+            "sort": self.request.GET.get("sort", ""),
+            "choice_filter": choice,
+            "filtered": bool(self.request.GET.get("q") or (choice and choice["value"])),
+        }
+        return ctx
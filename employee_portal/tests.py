@@ -0,0 +1,177 @@
+import base64
+import json
+import shutil
+import tempfile
+
+import boto3
+from django.core import signing
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from moto import mock_aws
+
+from accounts.models import ClientFile, CustomUser
+from catalog.models import Community, Photo
+from employee_portal import direct_uploads
+
+BUCKET = "heritage-test"
+
+# Anything written to the filesystem storage (e.g. OG cards drawn on save)
+# lands here instead of the project's media/.
+MEDIA_ROOT = tempfile.mkdtemp(prefix="heritage-test-media-")
+
+
+def tearDownModule():
+    shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+
+S3_SETTINGS = {
+    "MEDIA_ROOT": MEDIA_ROOT,
+    "USE_S3": True,
+    "DIRECT_UPLOADS": True,
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_STORAGE_BUCKET_NAME": BUCKET,
+    "AWS_S3_REGION_NAME": "us-east-1",
+    "AWS_DEFAULT_ACL": None,
+    "AWS_S3_FILE_OVERWRITE": False,
+    "AWS_QUERYSTRING_AUTH": False,
+    "STORAGES": {
+        "default": {"BACKEND": "storages.backends.s3.S3Storage"},
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    },
+}
+
+
+@override_settings(**S3_SETTINGS)
+class DirectUploadTestCase(TestCase):
+    def setUp(self):
+        # Started here rather than as a class decorator so subclasses' tests are covered too.
+        aws = mock_aws()
+        aws.start()
+        self.addCleanup(aws.stop)
+        self.s3 = boto3.client("s3", region_name="us-east-1")
+        self.s3.create_bucket(Bucket=BUCKET)
+        self.staff = CustomUser.objects.create_user(
+            email="staff@example.com", first_name="Sam", last_name="Staff", password="pw", role="staff", is_staff=True
+        )
+        self.client.login(email="staff@example.com", password="pw")
+
+    def presign(self, kind="photo", filename="front porch.jpg", content_type="image/jpeg"):
+        return self.client.post(
+            reverse("employee_portal:direct_upload_presign"),
+            {"kind": kind, "filename": filename, "content_type": content_type},
+        )
+
+    def upload(self, token, body=b"bytes"):
+        """Put an object where the browser's POST would have, for the key the token names."""
+        key = signing.loads(token, salt=direct_uploads.TOKEN_SALT)["key"]
+        self.s3.put_object(Bucket=BUCKET, Key=key, Body=body)
+        return key
+
+
+class DirectUploadPresignViewTests(DirectUploadTestCase):
+    def test_policy_fields_and_conditions(self):
+        response = self.presign()
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(set(data), {"url", "fields", "token"})
+        self.assertIn(BUCKET, data["url"])
+
+        fields = data["fields"]
+        key = fields["key"]
+        self.assertTrue(key.startswith("photos/"))
+        self.assertTrue(key.endswith("/front_porch.jpg"))
+        self.assertEqual(fields["Content-Type"], "image/jpeg")
+        self.assertEqual(signing.loads(data["token"], salt=direct_uploads.TOKEN_SALT), {"kind": "photo", "key": key})
+
+        conditions = json.loads(base64.b64decode(fields["policy"]))["conditions"]
+        self.assertIn(["content-length-range", 1, direct_uploads.TARGETS["photo"][4]], conditions)
+        self.assertIn({"Content-Type": "image/jpeg"}, conditions)
+        self.assertIn({"key": key}, conditions)
+        self.assertIn({"bucket": BUCKET}, conditions)
+
+    def test_client_file_policy_uses_its_prefix_and_cap(self):
+        data = self.presign("client_file", "contract.pdf", "application/pdf").json()
+        self.assertTrue(data["fields"]["key"].startswith("client_files/"))
+        conditions = json.loads(base64.b64decode(data["fields"]["policy"]))["conditions"]
+        self.assertIn(["content-length-range", 1, direct_uploads.TARGETS["client_file"][4]], conditions)
+
+    def test_rejects_wrong_content_type(self):
+        response = self.presign(filename="plan.pdf", content_type="application/pdf")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.json())
+
+    def test_rejects_unknown_kind(self):
+        self.assertEqual(self.presign(kind="avatar").status_code, 400)
+
+    @override_settings(DIRECT_UPLOADS=False)
+    def test_disabled(self):
+        self.assertEqual(self.presign().status_code, 404)
+
+    def test_requires_login(self):
+        self.client.logout()
+        self.assertEqual(self.presign().status_code, 302)
+
+
+class ClientFileCreateViewTests(DirectUploadTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client_user = CustomUser.objects.create_user(
+            email="client@example.com", first_name="Cal", last_name="Client", password="pw", role="client"
+        )
+        self.url = reverse("employee_portal:client_file_add", args=[self.client_user.pk])
+
+    def test_accepts_uploaded_key(self):
+        token = self.presign("client_file", "contract.pdf", "application/pdf").json()["token"]
+        key = self.upload(token, b"%PDF-1.4")
+        response = self.client.post(self.url, {"upload_token": token, "description": "Contract"})
+        self.assertRedirects(response, reverse("employee_portal:user_edit", kwargs={"pk": self.client_user.pk}))
+        client_file = ClientFile.objects.get()
+        self.assertEqual(client_file.file.name, key)
+        self.assertEqual(client_file.client, self.client_user)
+        self.assertEqual(client_file.uploaded_by, self.staff)
+
+    def test_rejects_missing_key(self):
+        token = self.presign("client_file", "contract.pdf", "application/pdf").json()["token"]
+        response = self.client.post(self.url, {"upload_token": token})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Upload did not finish")
+        self.assertFalse(ClientFile.objects.exists())
+
+    def test_rejects_token_for_another_kind(self):
+        token = self.presign().json()["token"]
+        self.upload(token)
+        response = self.client.post(self.url, {"upload_token": token})
+        self.assertContains(response, "Upload does not belong to this form")
+        self.assertFalse(ClientFile.objects.exists())
+
+    def test_rejects_forged_token(self):
+        forged = signing.dumps({"kind": "client_file", "key": "client_files/other/secret.pdf"}, salt="other")
+        self.s3.put_object(Bucket=BUCKET, Key="client_files/other/secret.pdf", Body=b"x")
+        response = self.client.post(self.url, {"upload_token": forged})
+        self.assertContains(response, "Upload expired")
+        self.assertFalse(ClientFile.objects.exists())
+
+
+class PhotoDirectUploadTests(DirectUploadTestCase):
+    def test_stores_key_and_leaves_processing_pending(self):
+        community = Community.objects.create(name="Eastwood", city="Attleboro", state="MA")
+        token = self.presign().json()["token"]
+        key = self.upload(token)
+        response = self.client.post(
+            reverse("employee_portal:community_photo_add", args=[community.pk]),
+            {"upload_token": token, "caption": "Porch", "sort_order": 0},
+        )
+        self.assertEqual(response.status_code, 302)
+        photo = Photo.objects.get()
+        self.assertEqual(photo.image.name, key)
+        self.assertTrue(photo.pending)
+        self.assertEqual(photo.renditions, {})
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class PhotoOwnerViewLoginTests(TestCase):
+    def test_anonymous_is_sent_to_login_before_owner_lookup(self):
+        for name in ("community_photo_bulk", "community_photo_reorder"):
+            response = self.client.post(reverse(f"employee_portal:{name}", args=[999]))
+            self.assertEqual(response.status_code, 302, name)
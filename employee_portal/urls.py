@@ -1,5 +1,6 @@
 
 from django.urls import path
+from catalog.models import AvailableHome, Community, FloorPlan
 from . import views
 
 app_name = "employee_portal"
@@ -7,6 +8,8 @@ app_name = "employee_portal"
 urlpatterns = [
     path("", views.DashboardView.as_view(), name="dashboard"),
     path("site-settings/", views.SiteSettingsUpdateView.as_view(), name="site_settings"),
+    path("health/", views.HealthStatsView.as_view(), name="health_stats"),
+    path("exports/<slug:dataset>.<slug:fmt>", views.ExportView.as_view(), name="export"),
     # Community CRUD
     path("communities/", views.CommunityListView.as_view(), name="community_list"),
     path("communities/add/", views.CommunityCreateView.as_view(), name="community_add"),
@@ -15,16 +18,22 @@ urlpatterns = [
     # Community photo management
     path("communities/<int:community_id>/photos/", views.CommunityPhotoListView.as_view(), name="community_photo_list"),
     path("communities/<int:community_id>/photos/add/", views.CommunityPhotoCreateView.as_view(), name="community_photo_add"),
+    path("communities/<int:community_id>/photos/bulk/", views.PhotoBulkUploadView.as_view(owner_model=Community, owner_kwarg="community_id", list_url_name="employee_portal:community_photo_list"), name="community_photo_bulk"),
+    path("communities/<int:community_id>/photos/reorder/", views.PhotoReorderView.as_view(owner_model=Community, owner_kwarg="community_id", list_url_name="employee_portal:community_photo_list"), name="community_photo_reorder"),
     path("communities/<int:community_id>/photos/<int:pk>/edit/", views.CommunityPhotoUpdateView.as_view(), name="community_photo_edit"),
     path("communities/<int:community_id>/photos/<int:pk>/delete/", views.CommunityPhotoDeleteView.as_view(), name="community_photo_delete"),
     # Home photo management
     path("homes/<int:home_id>/photos/", views.HomePhotoListView.as_view(), name="home_photo_list"),
     path("homes/<int:home_id>/photos/add/", views.HomePhotoCreateView.as_view(), name="home_photo_add"),
+    path("homes/<int:home_id>/photos/bulk/", views.PhotoBulkUploadView.as_view(owner_model=AvailableHome, owner_kwarg="home_id", list_url_name="employee_portal:home_photo_list"), name="home_photo_bulk"),
+    path("homes/<int:home_id>/photos/reorder/", views.PhotoReorderView.as_view(owner_model=AvailableHome, owner_kwarg="home_id", list_url_name="employee_portal:home_photo_list"), name="home_photo_reorder"),
     path("homes/<int:home_id>/photos/<int:pk>/edit/", views.HomePhotoUpdateView.as_view(), name="home_photo_edit"),
     path("homes/<int:home_id>/photos/<int:pk>/delete/", views.HomePhotoDeleteView.as_view(), name="home_photo_delete"),
     # Plan photo management
     path("plans/<int:plan_id>/photos/", views.PlanPhotoListView.as_view(), name="plan_photo_list"),
     path("plans/<int:plan_id>/photos/add/", views.PlanPhotoCreateView.as_view(), name="plan_photo_add"),
+    path("plans/<int:plan_id>/photos/bulk/", views.PhotoBulkUploadView.as_view(owner_model=FloorPlan, owner_kwarg="plan_id", list_url_name="employee_portal:plan_photo_list"), name="plan_photo_bulk"),
+    path("plans/<int:plan_id>/photos/reorder/", views.PhotoReorderView.as_view(owner_model=FloorPlan, owner_kwarg="plan_id", list_url_name="employee_portal:plan_photo_list"), name="plan_photo_reorder"),
     path("plans/<int:plan_id>/photos/<int:pk>/edit/", views.PlanPhotoUpdateView.as_view(), name="plan_photo_edit"),
     path("plans/<int:plan_id>/photos/<int:pk>/delete/", views.PlanPhotoDeleteView.as_view(), name="plan_photo_delete"),
     # FloorPlan CRUD
@@ -37,6 +46,7 @@ urlpatterns = [
     path("homes/add/", views.AvailableHomeCreateView.as_view(), name="home_add"),
     path("homes/<int:pk>/edit/", views.AvailableHomeUpdateView.as_view(), name="home_edit"),
     path("homes/<int:pk>/delete/", views.AvailableHomeDeleteView.as_view(), name="home_delete"),
+    path("import/", views.InventoryImportView.as_view(), name="inventory_import"),
     # Combined client share pages
     path("client-share-pages/", views.CombinedClientSharePageListView.as_view(), name="combined_share_list"),
     path("client-share-pages/add/", views.CombinedClientSharePageCreateView.as_view(), name="combined_share_add"),
@@ -47,4 +57,7 @@ urlpatterns = [
     path("users/add/", views.UserCreateView.as_view(), name="user_add"),
     path("users/<int:pk>/edit/", views.UserUpdateView.as_view(), name="user_edit"),
     path("users/<int:pk>/delete/", views.UserDeleteView.as_view(), name="user_delete"),
+    path("users/<int:user_id>/files/add/", views.ClientFileCreateView.as_view(), name="client_file_add"),
+    # Direct-to-S3 upload policies
+    path("uploads/presign/", views.DirectUploadPresignView.as_view(), name="direct_upload_presign"),
 ]
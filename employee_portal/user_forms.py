@@ -1,6 +1,7 @@
 
 from django import forms
-from accounts.models import CustomUser
+from accounts.models import ClientFile, CustomUser
+from employee_portal.direct_uploads import DirectUploadFormMixin
 
 class UserForm(forms.ModelForm):
     password = forms.CharField(widget=forms.PasswordInput, required=False, help_text="Leave blank to keep unchanged.")
@@ -37,3 +38,17 @@ class UserForm(forms.ModelForm):
         if commit:
             user.save()
         return user
+
+
+class ClientFileForm(DirectUploadFormMixin, forms.ModelForm):
+    upload_kind = "client_file"
+
+    class Meta:
+        model = ClientFile
+        fields = ["file", "description"]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for field in self.fields.values():
+            existing_classes = field.widget.attrs.get("class", "").strip()
+            field.widget.attrs["class"] = f"{existing_classes} form-control".strip()
@@ -1,12 +1,34 @@
 # Django imports
 import logging
-from django.contrib.auth.mixins import LoginRequiredMixin
-from django.views.generic import ListView, CreateView, UpdateView, DeleteView
-from django.urls import reverse_lazy, reverse
+
+from django.contrib import messages
+from django.contrib.auth import get_user_model
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404, redirect
+from django.urls import reverse, reverse_lazy
+from django.utils import timezone
+from django.views import View
+from django.views.generic import CreateView, DeleteView, FormView, ListView, TemplateView, UpdateView
+
 # App/model imports
-from catalog.models import AvailableHome, FloorPlan, Photo
-from employee_portal.photo_forms import PhotoForm
+from accounts.models import CustomUser
+from catalog.models import (
+    AvailableHome, CombinedClientSharePage, Community, CommunityStatus, FloorPlan, HomeStatus, Photo
+)
+from catalog.signals import rows_updated
+from core import page_cache, ratelimit, storage_urls
+from outbox import delivery as outbox
+from pages.models import SiteSettings
+
+from . import direct_uploads, exports, imports
+from .filters import filter_communities, filter_homes, filter_plans, filter_share_pages, filter_users
+from .forms import AvailableHomeForm, CombinedClientSharePageForm, CommunityForm, FloorPlanForm, InventoryImportForm
+from .photo_forms import BulkPhotoUploadForm, PhotoForm
+from .tables import Column, PortalTableMixin
+from .user_forms import ClientFileForm, UserForm
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +71,7 @@ class HomePhotoListView(LoginRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         ctx["home"] = self.home
+        ctx["bulk_form"] = BulkPhotoUploadForm()
         return ctx
 class HomePhotoCreateView(PhotoFormErrorMixin, LoginRequiredMixin, CreateView):
     model = Photo
@@ -106,6 +129,7 @@ class PlanPhotoListView(LoginRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         ctx["plan"] = self.plan
+        ctx["bulk_form"] = BulkPhotoUploadForm()
         return ctx
 class PlanPhotoCreateView(PhotoFormErrorMixin, LoginRequiredMixin, CreateView):
     model = Photo
@@ -151,9 +175,6 @@ class PlanPhotoDeleteView(LoginRequiredMixin, DeleteView):
         ctx = super().get_context_data(**kwargs)
         ctx["plan"] = self.plan
         return ctx
-from catalog.models import Photo, Community
-from .photo_forms import PhotoForm
-from django.shortcuts import get_object_or_404, redirect
 # Community Photo Management
 class CommunityPhotoListView(LoginRequiredMixin, ListView):
     model = Photo
@@ -167,6 +188,7 @@ class CommunityPhotoListView(LoginRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         ctx["community"] = self.community
+        ctx["bulk_form"] = BulkPhotoUploadForm()
         return ctx
 
 class CommunityPhotoCreateView(PhotoFormErrorMixin, LoginRequiredMixin, CreateView):
@@ -224,19 +246,94 @@ class CommunityPhotoDeleteView(LoginRequiredMixin, DeleteView):
         ctx = super().get_context_data(**kwargs)
         ctx["community"] = self.community
         return ctx
-from django.contrib.auth.models import User
-from .user_forms import UserForm
-from django.contrib.auth.mixins import UserPassesTestMixin
+
+# Bulk photo upload and drag-to-reorder (all three owner types; configured in urls.py)
+
+class OwnerPhotosMixin:
+    owner_model = None
+    owner_kwarg = None
+    list_url_name = None
+
+    def dispatch(self, request, *args, **kwargs):
+        self.owner = get_object_or_404(self.owner_model, pk=kwargs[self.owner_kwarg])
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_list_url(self):
+        return reverse(self.list_url_name, kwargs={self.owner_kwarg: self.owner.pk})
+
+class PhotoBulkUploadView(LoginRequiredMixin, OwnerPhotosMixin, View):
+    def post(self, request, *args, **kwargs):
+        form = BulkPhotoUploadForm(request.POST, request.FILES)
+        if not form.is_valid():
+            for errors in form.errors.values():
+                for error in errors:
+                    messages.error(request, error)
+            return redirect(self.get_list_url())
+        photos, errors = form.save(self.owner)
+        if photos:
+            messages.success(request, f"Added {len(photos)} photo{'s' if len(photos) != 1 else ''}.")
+        for error in errors:
+            messages.error(request, error)
+        return redirect(self.get_list_url())
+
+class PhotoReorderView(LoginRequiredMixin, OwnerPhotosMixin, View):
+    """POST `order` (photo ids, first to last); saved with a single bulk_update."""
+
+    def post(self, request, *args, **kwargs):
+        try:
+            order = [int(pk) for pk in request.POST.getlist("order")]
+        except ValueError:
+            return JsonResponse({"error": "Invalid photo id."}, status=400)
+        photos = {
+            photo.pk: photo
+            for photo in Photo.objects.filter(
+                content_type=ContentType.objects.get_for_model(self.owner),
+                object_id=self.owner.pk,
+                pk__in=order,
+            ).only("pk", "sort_order")
+        }
+        if len(photos) != len(set(order)):
+            return JsonResponse({"error": "Unknown photo for this listing."}, status=400)
+        now = timezone.now()
+        changed = []
+        for position, pk in enumerate(order):
+            photo = photos[pk]
+            if photo.sort_order != position:
+                photo.sort_order, photo.updated = position, now
+                changed.append(photo)
+        if changed:
+            Photo.objects.bulk_update(changed, ["sort_order", "updated"])
+            # bulk_update sends no post_save: refresh the cover and purge pages here.
+            self.owner.refresh_cover_photo()
+            rows_updated(self.owner_model, [self.owner.pk])
+        return JsonResponse({"order": order, "updated": len(changed)})
+
 # User management views (superuser/staff only)
-class UserListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
-    model = User
+class UserListView(PortalTableMixin, LoginRequiredMixin, UserPassesTestMixin, ListView):
+    model = CustomUser
     template_name = "employee_portal/user_list.html"
-    context_object_name = "users"
+    context_object_name = "accounts"
+    table_columns = (
+        Column("Name", "last_name"),
+        Column("Email", "email"),
+        Column("Role", "role"),
+        Column("Staff", "is_staff"),
+        Column("Superuser"),
+        Column("Active", "is_active"),
+        Column("Joined", "date_joined"),
+    )
+    default_sort = "last_name"
+    table_filter = staticmethod(filter_users)
+    table_choice_filter = ("role", "Role", CustomUser.ROLE_CHOICES)
+    table_only = (
+        "id", "email", "first_name", "last_name", "role", "is_staff", "is_superuser", "is_active", "date_joined",
+    )
+
     def test_func(self):
         return self.request.user.is_superuser or self.request.user.is_staff
 
 class UserCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
-    model = User
+    model = CustomUser
     form_class = UserForm
     template_name = "employee_portal/user_form.html"
     success_url = reverse_lazy("employee_portal:user_list")
@@ -244,7 +341,7 @@ class UserCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
         return self.request.user.is_superuser or self.request.user.is_staff
 
 class UserUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
-    model = User
+    model = CustomUser
     form_class = UserForm
     template_name = "employee_portal/user_form.html"
     success_url = reverse_lazy("employee_portal:user_list")
@@ -252,20 +349,11 @@ class UserUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         return self.request.user.is_superuser or self.request.user.is_staff
 
 class UserDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
-    model = User
+    model = CustomUser
     template_name = "employee_portal/user_confirm_delete.html"
     success_url = reverse_lazy("employee_portal:user_list")
     def test_func(self):
         return self.request.user.is_superuser or self.request.user.is_staff
-from django.contrib.auth.mixins import LoginRequiredMixin
-from django.views.generic import TemplateView, UpdateView
-from pages.models import SiteSettings
-from django.urls import reverse_lazy
-from catalog.models import Community, FloorPlan, AvailableHome, CombinedClientSharePage
-from .forms import CommunityForm, FloorPlanForm, AvailableHomeForm, CombinedClientSharePageForm
-from django.views.generic import (
-    TemplateView, UpdateView, ListView, CreateView, DeleteView
-)
 
 class DashboardView(LoginRequiredMixin, TemplateView):
     template_name = "employee_portal/dashboard.html"
@@ -287,10 +375,15 @@ class SiteSettingsUpdateView(LoginRequiredMixin, UpdateView):
         return SiteSettings.get_solo()
 
 # Community CRUD
-class CommunityListView(LoginRequiredMixin, ListView):
+class CommunityListView(PortalTableMixin, LoginRequiredMixin, ListView):
     model = Community
     template_name = "employee_portal/community_list.html"
     context_object_name = "communities"
+    table_columns = (Column("Name", "name"), Column("City", "city"), Column("Status", "status"))
+    default_sort = "name"
+    table_filter = staticmethod(filter_communities)
+    table_choice_filter = ("status", "Status", CommunityStatus.choices)
+    table_only = ("id", "slug", "name", "city", "status")
 
 class CommunityCreateView(LoginRequiredMixin, CreateView):
     model = Community
@@ -312,10 +405,14 @@ class CommunityDeleteView(LoginRequiredMixin, DeleteView):
     success_url = reverse_lazy("employee_portal:community_list")
 
 # FloorPlan CRUD
-class FloorPlanListView(LoginRequiredMixin, ListView):
+class FloorPlanListView(PortalTableMixin, LoginRequiredMixin, ListView):
     model = FloorPlan
     template_name = "employee_portal/plan_list.html"
     context_object_name = "plans"
+    table_columns = (Column("Name", "name"), Column("Beds", "beds"), Column("Baths", "baths"))
+    default_sort = "name"
+    table_filter = staticmethod(filter_plans)
+    table_only = ("id", "slug", "name", "beds", "baths")
 
 class FloorPlanCreateView(LoginRequiredMixin, CreateView):
     model = FloorPlan
@@ -335,10 +432,26 @@ class FloorPlanDeleteView(LoginRequiredMixin, DeleteView):
     success_url = reverse_lazy("employee_portal:plan_list")
 
 # AvailableHome CRUD
-class AvailableHomeListView(LoginRequiredMixin, ListView):
+class AvailableHomeListView(PortalTableMixin, LoginRequiredMixin, ListView):
     model = AvailableHome
     template_name = "employee_portal/home_list.html"
     context_object_name = "homes"
+    table_columns = (
+        Column("Address", "address_1"),
+        Column("Community", "community__name", keyset=False),
+        Column("Plan", "plan__name", keyset=False),
+        Column("Price", "price", keyset=False),
+        Column("Status", "status"),
+        Column("Added", "created"),
+    )
+    default_sort = "-created"
+    table_filter = staticmethod(filter_homes)
+    table_choice_filter = ("status", "Status", HomeStatus.choices)
+    table_select_related = ("community", "plan")
+    table_only = (
+        "id", "slug", "address_1", "city", "state", "postal_code", "price", "status", "created",
+        "community", "community__name", "plan", "plan__name",
+    )
 
 class AvailableHomeCreateView(LoginRequiredMixin, CreateView):
     model = AvailableHome
@@ -359,10 +472,25 @@ class AvailableHomeDeleteView(LoginRequiredMixin, DeleteView):
 
 
 # Combined Client Share Page CRUD
-class CombinedClientSharePageListView(LoginRequiredMixin, ListView):
+class CombinedClientSharePageListView(PortalTableMixin, LoginRequiredMixin, ListView):
     model = CombinedClientSharePage
     template_name = "employee_portal/combined_share_list.html"
     context_object_name = "pages"
+    table_columns = (
+        Column("Title", "title"),
+        Column("Home", "home__address_1", keyset=False),
+        Column("Plan", "plan__name", keyset=False),
+        Column("Community", "community__name", keyset=False),
+        Column("Enabled", "share_enabled"),
+    )
+    default_sort = "title"
+    table_filter = staticmethod(filter_share_pages)
+    table_select_related = ("home", "plan", "community")
+    table_only = (
+        "id", "slug", "title", "share_enabled",
+        "home", "home__slug", "home__address_1", "home__city", "home__state", "home__postal_code",
+        "plan", "plan__name", "community", "community__name",
+    )
 
 
 class CombinedClientSharePageCreateView(LoginRequiredMixin, CreateView):
@@ -383,3 +511,100 @@ class CombinedClientSharePageDeleteView(LoginRequiredMixin, DeleteView):
     model = CombinedClientSharePage
     template_name = "employee_portal/combined_share_confirm_delete.html"
     success_url = reverse_lazy("employee_portal:combined_share_list")
+
+
+# Direct-to-S3 uploads (see direct_uploads.py) and client files
+
+class DirectUploadPresignView(LoginRequiredMixin, View):
+    def post(self, request, *args, **kwargs):
+        if not direct_uploads.enabled():
+            raise Http404("Direct uploads are disabled.")
+        try:
+            policy = direct_uploads.presign(
+                request.POST.get("kind", ""),
+                request.POST.get("filename", ""),
+                request.POST.get("content_type", ""),
+            )
+        except ValidationError as exc:
+            return JsonResponse({"error": exc.messages[0]}, status=400)
+        return JsonResponse(policy)
+
+class ClientFileCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
+    form_class = ClientFileForm
+    template_name = "employee_portal/client_file_form.html"
+
+    def test_func(self):
+        return self.request.user.is_superuser or self.request.user.is_staff
+
+    def dispatch(self, request, *args, **kwargs):
+        self.client_user = get_object_or_404(get_user_model(), pk=kwargs["user_id"])
+        return super().dispatch(request, *args, **kwargs)
+
+    def form_valid(self, form):
+        form.instance.client = self.client_user
+        form.instance.uploaded_by = self.request.user
+        return super().form_valid(form)
+
+    def get_success_url(self):
+        return reverse("employee_portal:user_edit", kwargs={"pk": self.client_user.pk})
+
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        ctx["client_user"] = self.client_user
+        return ctx
+
+# Per-worker cache/storage counters for monitoring (staff only)
+
+class HealthStatsView(LoginRequiredMixin, UserPassesTestMixin, View):
+    def test_func(self):
+        return self.request.user.is_superuser or self.request.user.is_staff
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse({
+            "page_cache": page_cache.stats(),
+            "storage_urls": storage_urls.stats(),
+            "outbox": outbox.stats(),
+            "leads": ratelimit.counters("lead:accepted", "lead:throttled", "lead:rejected"),
+        })
+
+# Streaming CSV / JSON Lines downloads of the portal lists and leads (staff only)
+
+class ExportView(LoginRequiredMixin, UserPassesTestMixin, View):
+    def test_func(self):
+        return self.request.user.is_superuser or self.request.user.is_staff
+
+    def get(self, request, dataset, fmt):
+        try:
+            return exports.stream(dataset, fmt, request.GET)
+        except KeyError:
+            raise Http404("Unknown export.")
+
+# Bulk CSV / XLSX import of homes and floor plans (see imports.py)
+
+class InventoryImportView(LoginRequiredMixin, FormView):
+    form_class = InventoryImportForm
+    template_name = "employee_portal/inventory_import.html"
+
+    def get_initial(self):
+        return {"kind": self.request.GET.get("kind", "homes")}
+
+    def form_valid(self, form):
+        upload = form.cleaned_data["file"]
+        result = imports.import_file(
+            form.cleaned_data["kind"],
+            upload.file,
+            upload.name,
+            community=form.cleaned_data["community"],
+            dry_run=form.cleaned_data["dry_run"],
+        )
+        if result.ok and not result.dry_run:
+            messages.success(self.request, f"Imported {result.created} new and {result.updated} updated rows.")
+            list_url = "employee_portal:home_list" if form.cleaned_data["kind"] == "homes" else "employee_portal:plan_list"
+            return redirect(list_url)
+        return self.render_to_response(self.get_context_data(form=form, result=result))
+
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        ctx["home_columns"] = ["community", "plan", *imports.HomeImportForm._meta.fields, "slug"]
+        ctx["plan_columns"] = [*imports.PlanImportForm._meta.fields, "slug"]
+        return ctx
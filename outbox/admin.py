@@ -0,0 +1,31 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# outbox/admin.py
+# ──────────────────────────────────────────────────────────────────────────────
+from django.contrib import admin, messages
+from django.utils import timezone
+
+from .models import OutboundEmail, OutboundEmailStatus
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "recipients", "status", "attempts", "created", "next_attempt_at", "sent_at")
+    list_filter = ("status",)
+    search_fields = ("subject", "to", "from_email")
+    date_hierarchy = "created"
+    actions = ["retry_now"]
+    readonly_fields = [field.name for field in OutboundEmail._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.display(description="To")
+    def recipients(self, obj):
+        return ", ".join(obj.to)
+
+    @admin.action(description="Retry now (requeue failed/dead messages)")
+    def retry_now(self, request, queryset):
+        count = queryset.exclude(status=OutboundEmailStatus.SENT).update(
+            status=OutboundEmailStatus.QUEUED, attempts=0, next_attempt_at=timezone.now()
+        )
+        self.message_user(request, f"Requeued {count} message(s).", messages.SUCCESS)
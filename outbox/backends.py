@@ -0,0 +1,77 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# outbox/backends.py
+# ──────────────────────────────────────────────────────────────────────────────
+# EMAIL_BACKEND = "outbox.backends.OutboxBackend": send_mail() and friends
+# write rows instead of talking to SMTP, inside whatever transaction the
+# caller has open, so a request never waits on (or silently loses) mail.
+# `manage.py drain_outbox` delivers them; see outbox/delivery.py.
+import base64
+import logging
+from email.mime.base import MIMEBase
+
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends.base import BaseEmailBackend
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+def to_row(message):
+    """An unsaved OutboundEmail holding everything needed to rebuild `message`."""
+    attachments = []
+    for attachment in message.attachments:
+        if isinstance(attachment, MIMEBase):
+            logger.warning("Dropping a MIMEBase attachment from %r; only (name, content, type) is queued", message.subject)
+            continue
+        filename, content, mimetype = attachment
+        if isinstance(content, str):
+            content = content.encode()
+        attachments.append([filename, base64.b64encode(content).decode(), mimetype])
+    return OutboundEmail(
+        subject=message.subject,
+        from_email=message.from_email or "",
+        to=list(message.to),
+        cc=list(message.cc),
+        bcc=list(message.bcc),
+        reply_to=list(message.reply_to),
+        headers=dict(message.extra_headers),
+        body=message.body,
+        alternatives=[[content, mimetype] for content, mimetype in getattr(message, "alternatives", [])],
+        attachments=attachments,
+    )
+
+
+def to_message(row, connection=None):
+    """The EmailMultiAlternatives stored in `row`."""
+    message = EmailMultiAlternatives(
+        subject=row.subject,
+        body=row.body,
+        from_email=row.from_email or None,
+        to=row.to,
+        cc=row.cc,
+        bcc=row.bcc,
+        reply_to=row.reply_to,
+        headers=row.headers,
+        connection=connection,
+    )
+    for content, mimetype in row.alternatives:
+        message.attach_alternative(content, mimetype)
+    for filename, content, mimetype in row.attachments:
+        message.attach(filename, base64.b64decode(content), mimetype)
+    return message
+
+
+class OutboxBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        rows = [to_row(message) for message in email_messages if message.recipients()]
+        if not rows:
+            return 0
+        try:
+            OutboundEmail.objects.bulk_create(rows)
+        except Exception:
+            if not self.fail_silently:
+                raise
+            logger.exception("Could not queue %s email(s)", len(rows))
+            return 0
+        return len(rows)
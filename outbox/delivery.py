@@ -0,0 +1,155 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# outbox/delivery.py
+# ──────────────────────────────────────────────────────────────────────────────
+# drain() claims a batch of due rows, sends them one by one over a single
+# connection from OUTBOX_DELIVERY_BACKEND (SMTP in production; locmem or
+# console work the same way in tests and dev) and records the outcome:
+#
+# - sent: status "sent", sent_at.
+# - failed: retried after RETRY_BASE * 2**(attempts - 1) seconds (capped at
+#   RETRY_MAX, with jitter), until MAX_ATTEMPTS; then status "dead".
+# - permanently refused (5xx reply, every recipient rejected): "dead" at once.
+#
+# Claiming bumps attempts and pushes next_attempt_at out by LEASE with one
+# conditional UPDATE per row (WHERE still queued and due): a row another
+# drainer leased first updates nothing and is skipped, so several drainers
+# never pick the same row, even on SQLite, which has no row locks. Where the
+# database has SELECT ... FOR UPDATE SKIP LOCKED the candidates are read
+# under it too, so drainers don't contend for the same rows at all (SQLite
+# instead runs the claim in an IMMEDIATE transaction; see settings). Rows of
+# a drainer that died mid-batch come back on their own once the lease runs
+# out. Each row is marked sent as soon as the server accepts it.
+import logging
+import random
+import smtplib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import connection as db_connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .backends import to_message
+from .models import OutboundEmail, OutboundEmailStatus
+
+logger = logging.getLogger(__name__)
+
+LEASE = timedelta(minutes=10)
+RETRY_BASE = 60
+RETRY_MAX = 6 * 60 * 60
+MAX_ATTEMPTS = 8
+
+
+def delivery_backend():
+    return getattr(settings, "OUTBOX_DELIVERY_BACKEND", "django.core.mail.backends.smtp.EmailBackend")
+
+
+def max_attempts():
+    return getattr(settings, "OUTBOX_MAX_ATTEMPTS", MAX_ATTEMPTS)
+
+
+def retry_delay(attempts):
+    delay = min(RETRY_BASE * 2 ** max(attempts - 1, 0), RETRY_MAX)
+    return timedelta(seconds=delay * random.uniform(0.9, 1.1))
+
+
+def is_permanent(exc):
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(exc, smtplib.SMTPResponseException) and 500 <= exc.smtp_code < 600
+
+
+def claim(batch_size, now=None):
+    """Due rows, leased to this drainer."""
+    now = now or timezone.now()
+    lease_until = now + LEASE
+    due = OutboundEmail.objects.filter(status=OutboundEmailStatus.QUEUED, next_attempt_at__lte=now)
+    with transaction.atomic():
+        qs = due
+        if db_connection.features.has_select_for_update_skip_locked:
+            qs = qs.select_for_update(skip_locked=True)
+        rows = []
+        for row in qs.order_by("next_attempt_at", "id")[:batch_size]:
+            # No row updated: another drainer leased it since the SELECT.
+            if due.filter(pk=row.pk).update(attempts=F("attempts") + 1, next_attempt_at=lease_until):
+                row.attempts += 1
+                row.next_attempt_at = lease_until
+                rows.append(row)
+    return rows
+
+
+def _failed(row, exc, now):
+    error = f"{type(exc).__name__}: {exc}"
+    if is_permanent(exc) or row.attempts >= max_attempts():
+        logger.error("Giving up on outbound email id=%s after %s attempt(s): %s", row.pk, row.attempts, error)
+        fields = {"status": OutboundEmailStatus.DEAD}
+    else:
+        logger.warning("Outbound email id=%s failed (attempt %s): %s", row.pk, row.attempts, error)
+        fields = {"next_attempt_at": now + retry_delay(row.attempts)}
+    OutboundEmail.objects.filter(pk=row.pk).update(last_error=error[:2000], **fields)
+    return fields.get("status") == OutboundEmailStatus.DEAD
+
+
+def drain(batch_size=50):
+    """Send one batch. Returns (sent, retrying, dead) counts."""
+    rows = claim(batch_size)
+    if not rows:
+        return 0, 0, 0
+
+    connection = get_connection(delivery_backend(), fail_silently=False)
+    sent, retrying, dead = 0, 0, 0
+    try:
+        connection.open()
+    except Exception as exc:
+        # Server unreachable: every row in the batch waits for its retry.
+        now = timezone.now()
+        for row in rows:
+            dead += _failed(row, exc, now)
+        return 0, len(rows) - dead, dead
+
+    try:
+        for row in rows:
+            try:
+                connection.send_messages([to_message(row, connection)])
+            except Exception as exc:
+                if _failed(row, exc, timezone.now()):
+                    dead += 1
+                else:
+                    retrying += 1
+                # The session may be unusable after an error; start a fresh one.
+                connection.close()
+                try:
+                    connection.open()
+                except Exception:
+                    pass
+            else:
+                # Recorded now, not after the batch: if this drainer dies
+                # later in the batch, the lease must not resend this one.
+                OutboundEmail.objects.filter(pk=row.pk).update(
+                    status=OutboundEmailStatus.SENT, sent_at=timezone.now(), last_error=""
+                )
+                sent += 1
+    finally:
+        connection.close()
+    return sent, retrying, dead
+
+
+def purge_sent(days):
+    """Delete sent rows older than `days`; returns how many."""
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = OutboundEmail.objects.filter(status=OutboundEmailStatus.SENT, sent_at__lt=cutoff).delete()
+    return deleted
+
+
+def stats():
+    """Queue depth for the portal health endpoint."""
+    now = timezone.now()
+    queued = OutboundEmail.objects.filter(status=OutboundEmailStatus.QUEUED)
+    oldest = queued.order_by("created").values_list("created", flat=True).first()
+    return {
+        "queued": queued.count(),
+        "due": queued.filter(next_attempt_at__lte=now).count(),
+        "dead": OutboundEmail.objects.filter(status=OutboundEmailStatus.DEAD).count(),
+        "oldest_queued_seconds": int((now - oldest).total_seconds()) if oldest else 0,
+    }
@@ -0,0 +1,44 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# outbox/management/commands/drain_outbox.py
+# ──────────────────────────────────────────────────────────────────────────────
+# Deliver queued email (outbox/delivery.py). Run from cron, e.g. every
+# minute, or as a worker process with --loop. Safe to run several at once,
+# on any database: rows are leased with a conditional UPDATE (see claim()).
+import time
+
+from django.core.management.base import BaseCommand
+
+from outbox.delivery import drain, purge_sent
+
+
+class Command(BaseCommand):
+    help = "Send queued outbound email with retries and dead-lettering"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50, help="Messages sent per connection")
+        parser.add_argument("--loop", action="store_true", help="Keep draining; sleep when the outbox is empty")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds to sleep when idle (--loop)")
+        parser.add_argument("--purge-sent-days", type=int, default=30, help="Delete sent rows older than this; 0 keeps them")
+
+    def handle(self, *args, **opts):
+        if opts["purge_sent_days"]:
+            purged = purge_sent(opts["purge_sent_days"])
+            if purged:
+                self.stdout.write(f"Purged {purged} old sent messages.")
+
+        totals = [0, 0, 0]
+        try:
+            while True:
+                counts = drain(max(1, opts["batch_size"]))
+                totals = [total + count for total, count in zip(totals, counts)]
+                if any(counts):
+                    sent, retrying, dead = counts
+                    self.stdout.write(f"Sent {sent}, retrying {retrying}, dead {dead}.")
+                    continue
+                if not opts["loop"]:
+                    break
+                time.sleep(opts["interval"])
+        except KeyboardInterrupt:
+            pass
+        sent, retrying, dead = totals
+        self.stdout.write(self.style.SUCCESS(f"Done: {sent} sent, {retrying} to retry, {dead} dead."))
@@ -0,0 +1,49 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# outbox/models.py
+# ──────────────────────────────────────────────────────────────────────────────
+from django.db import models
+from django.utils import timezone
+
+
+class OutboundEmailStatus(models.TextChoices):
+    QUEUED = "queued", "Queued"
+    SENT = "sent", "Sent"
+    DEAD = "dead", "Failed (gave up)"
+
+
+class OutboundEmail(models.Model):
+    """
+    One message written by outbox.backends.OutboxBackend and delivered by
+    `manage.py drain_outbox`. Queued rows are due once next_attempt_at has
+    passed; a drainer that claims a row pushes next_attempt_at out by a lease,
+    so a crashed drainer's rows are simply retried later.
+    """
+    created = models.DateTimeField(auto_now_add=True)
+    status = models.CharField(max_length=10, choices=OutboundEmailStatus.choices, default=OutboundEmailStatus.QUEUED)
+    subject = models.CharField(max_length=998, blank=True)
+    from_email = models.CharField(max_length=320, blank=True)
+    to = models.JSONField(default=list, blank=True)
+    cc = models.JSONField(default=list, blank=True)
+    bcc = models.JSONField(default=list, blank=True)
+    reply_to = models.JSONField(default=list, blank=True)
+    headers = models.JSONField(default=dict, blank=True)
+    body = models.TextField(blank=True)
+    # [[content, mimetype], ...], e.g. the HTML part of a password reset.
+    alternatives = models.JSONField(default=list, blank=True)
+    # [[filename, base64 content, mimetype], ...]
+    attachments = models.JSONField(default=list, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("-created",)
+        verbose_name = "Outbound email"
+        indexes = [
+            # The drainer's "due now" scan.
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_due_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.subject or '(no subject)'} -> {', '.join(self.to)}"
@@ -6,4 +6,7 @@ from django.apps import AppConfig
 class PagesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "pages"
-    verbose_name = "Site Pages"
\ No newline at end of file
+    verbose_name = "Site Pages"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -1,17 +1,17 @@
 # pages/context_processors.py
-from .models import SiteSettings, Announcement
 from django.db.utils import DatabaseError
 
+from .site_cache import get_announcement, get_site_settings
+
 
 def site_settings(request):
   """
   Adds `site_settings` and `announcement` to every template context.
+  Both come from the per-process cache in pages/site_cache.py.
   """
   try:
-      settings_obj = SiteSettings.get_solo()
-      announcement = (
-          Announcement.objects.filter(is_active=True).order_by("-updated").first()
-      )
+      settings_obj = get_site_settings()
+      announcement = get_announcement()
   except DatabaseError:
       settings_obj = None
       announcement = None
@@ -1,16 +1,31 @@
 # ──────────────────────────────────────────────────────────────────────────────
 # pages/forms.py (Lead form)
 # ──────────────────────────────────────────────────────────────────────────────
+import time
+
 from django import forms
+from django.conf import settings
+from django.core import signing
+
+FORM_STAMP_SALT = "pages.LeadForm.started"
+# Signed render times older than this are refused (stale tab or replayed form).
+FORM_STAMP_MAX_AGE = 60 * 60 * 24
+
 
 class LeadForm(forms.Form):
     name = forms.CharField(max_length=160)
     email = forms.EmailField()
     phone = forms.CharField(max_length=40, required=False)
     message = forms.CharField(widget=forms.Textarea, required=False)
+    # Bot traps: `website` is hidden from people, so any value means a bot;
+    # `started` is a signed render time, so a form posted back faster than a
+    # person could fill it in (or never rendered at all) is a bot too.
+    website = forms.CharField(required=False, widget=forms.TextInput(attrs={"tabindex": "-1", "autocomplete": "off"}))
+    started = forms.CharField(required=False, widget=forms.HiddenInput)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.fields["started"].initial = signing.dumps(time.time(), salt=FORM_STAMP_SALT)
         for field in self.fields.values():
             widget = field.widget
             existing_classes = widget.attrs.get("class", "").strip()
@@ -20,3 +35,18 @@ class LeadForm(forms.Form):
             else:
                 css_class = "form-control"
             widget.attrs["class"] = f"{existing_classes} {css_class}".strip()
+
+    def looks_automated(self):
+        """
+        Why this submission looks like a bot ("" if it doesn't). Reads the
+        raw POST so it runs before validation and any database work.
+        """
+        if self.data.get("website"):
+            return "honeypot"
+        try:
+            started = signing.loads(self.data.get("started", ""), salt=FORM_STAMP_SALT, max_age=FORM_STAMP_MAX_AGE)
+        except (signing.BadSignature, TypeError, ValueError):
+            return "missing or stale form stamp"
+        if time.time() - float(started) < getattr(settings, "LEAD_MIN_SUBMIT_SECONDS", 3):
+            return "submitted too fast"
+        return ""
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core import page_cache
+
+from . import site_cache
+from .models import Announcement, SiteSettings
+
+
+@receiver(post_save, sender=SiteSettings)
+@receiver(post_delete, sender=SiteSettings)
+@receiver(post_save, sender=Announcement)
+@receiver(post_delete, sender=Announcement)
+def site_content_changed(sender, **kwargs):
+    site_cache.invalidate()
+    page_cache.bump("site")
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def staff_changed(sender, update_fields=None, **kwargs):
+    # The about/team pages list active staff; logins only touch last_login.
+    if update_fields and set(update_fields) <= {"last_login"}:
+        return
+    page_cache.bump("team")
@@ -0,0 +1,60 @@
+# ──────────────────────────────────────────────────────────────────────────────
+# pages/site_cache.py (in-process cache for SiteSettings + active Announcement)
+# ──────────────────────────────────────────────────────────────────────────────
+# Both rows are read on every template render but change a few times a month.
+# They are loaded once per worker and reloaded only when the "site-settings"
+# generation moves, which pages/signals.py bumps on save/delete.
+import re
+import threading
+
+from django.db.utils import DatabaseError
+
+from core import generations
+
+from .models import Announcement, SiteSettings
+
+GENERATION = "site-settings"
+
+_lock = threading.Lock()
+_state = {"generation": None, "settings": None, "announcement": None, "lead_recipients": ()}
+
+
+def parse_lead_recipients(raw):
+    """Split the admin's comma / semicolon separated address list."""
+    return tuple(part.strip() for part in re.split(r"[,;]", raw or "") if part.strip())
+
+
+def _load():
+    generation = generations.current(GENERATION)
+    if _state["generation"] == generation:
+        return _state
+    with _lock:
+        if _state["generation"] != generation:
+            settings_obj = SiteSettings.get_solo()
+            announcement = Announcement.objects.filter(is_active=True).order_by("-updated").first()
+            _state.update(
+                settings=settings_obj,
+                announcement=announcement,
+                lead_recipients=parse_lead_recipients(settings_obj.lead_recipients if settings_obj else ""),
+                generation=generation,
+            )
+    return _state
+
+
+def get_site_settings():
+    return _load()["settings"]
+
+
+def get_announcement():
+    return _load()["announcement"]
+
+
+def get_lead_recipients():
+    try:
+        return _load()["lead_recipients"]
+    except DatabaseError:
+        return ()
+
+
+def invalidate():
+    generations.bump(GENERATION)
@@ -1,3 +1,30 @@
-from django.test import TestCase
+import re
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from catalog.models import Lead
+
+
+@override_settings(LEAD_MIN_SUBMIT_SECONDS=0)
+class InterestListFormTests(TestCase):
+    def interest_list_form(self):
+        """The upcoming-projects page's form: its action and the hidden fields it renders."""
+        html = self.client.get(reverse("pages:upcoming_projects")).content.decode()
+        form = re.search(r'<form method="post" action="([^"]+)">(.*?)</form>', html, re.S)
+        hidden = dict(re.findall(r'<input type="hidden" name="(\w+)" value="([^"]*)"', form.group(2)))
+        return form.group(1).replace("&#x27;", "'"), hidden
+
+    def test_creates_lead(self):
+        action, hidden = self.interest_list_form()
+        self.assertIn("started", hidden)
+        data = {**hidden, "website": "", "name": "Ida", "email": "ida@example.com", "message": "Keep me posted"}
+        response = self.client.post(action, data)
+        self.assertRedirects(response, reverse("pages:contact"))
+        lead = Lead.objects.get()
+        self.assertEqual((lead.name, lead.email), ("Ida", "ida@example.com"))
+
+    def test_without_stamp_creates_nothing(self):
+        action, _hidden = self.interest_list_form()
+        self.client.post(action, {"name": "Bot", "email": "bot@example.com"})
+        self.assertFalse(Lead.objects.exists())
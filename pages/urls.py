@@ -1,6 +1,5 @@
 
 from django.urls import path
-from django.views.generic import TemplateView
 
 from .views import (
     HomeView,
@@ -13,6 +12,7 @@ from .views import (
     CompletedProjectsView,
     UpcomingProjectsView,
     ContactView,
+    OurPartnersView,
 )
 
 app_name = "pages"
@@ -31,5 +31,5 @@ urlpatterns = [
     path("upcoming-projects/", UpcomingProjectsView.as_view(), name="upcoming_projects"),
 
     path("contact/", ContactView.as_view(), name="contact"),
-    path("our-partners/", TemplateView.as_view(template_name="pages/our_partners.html"), name="our_partners"),
+    path("our-partners/", OurPartnersView.as_view(), name="our_partners"),
 ]
@@ -1,51 +1,38 @@
 from django.views.generic import TemplateView, FormView
 from accounts.models import CustomUser
 from django.contrib import messages
+from django.shortcuts import redirect
 from django.urls import reverse_lazy
 from django.core.mail import send_mail
 from django.conf import settings
+from django.db import transaction
 
+from core import ratelimit
+from core.page_cache import PageCacheMixin
 from pages.forms import LeadForm
-from pages.models import SiteSettings
-from catalog.models import Lead, LeadSource, Community, FloorPlan, AvailableHome
+from pages.site_cache import get_lead_recipients
+from catalog.featured import featured_slate
+from catalog.gallery import first_page
+from catalog.models import Lead, LeadSource, Community
 
 
-class HomeView(TemplateView):
+class HomeView(PageCacheMixin, TemplateView):
     template_name = "pages/home.html"
+    page_cache_tags = ("site", "communities:list", "plans:list", "homes:list")
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
-
-        comm_qs = Community.objects.filter(is_featured=True).order_by(
-            "featured_rank", "name"
-        )[:3]
-        plan_qs = FloorPlan.objects.filter(is_featured=True).order_by(
-            "featured_rank", "name"
-        )[:3]
-        home_qs = (
-            AvailableHome.objects.select_related("community")
-            .filter(is_featured=True)
-            .order_by("featured_rank", "-created")[:3]
-        )
-
-        if not comm_qs.exists():
-            comm_qs = Community.objects.all()[:3]
-        if not plan_qs.exists():
-            plan_qs = FloorPlan.objects.all()[:3]
-        if not home_qs.exists():
-            home_qs = AvailableHome.objects.select_related("community")[:3]
-
-        ctx["featured_communities"] = comm_qs
-        ctx["featured_plans"] = plan_qs
-        ctx["featured_homes"] = home_qs
+        # Materialized per worker; rebuilt when featured flags/ranks change.
+        ctx.update(featured_slate())
         return ctx
 
 
-class AboutView(TemplateView):
+class AboutView(PageCacheMixin, TemplateView):
     """
     'Our Story' page.
     """
     template_name = "pages/about.html"
+    page_cache_tags = ("site", "team")
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
@@ -53,63 +40,83 @@ class AboutView(TemplateView):
         return ctx
 
 
-class CustomHomesView(TemplateView):
+class CustomHomesView(PageCacheMixin, TemplateView):
     template_name = "pages/custom_homes.html"
+    page_cache_tags = ("site",)
 
 
-class ModelHomesView(TemplateView):
+class ModelHomesView(PageCacheMixin, TemplateView):
     """
     Listing / explanation page for model homes.
     """
     template_name = "pages/model_homes.html"
+    page_cache_tags = ("site",)
 
 
-class TeamView(TemplateView):
+class TeamView(PageCacheMixin, TemplateView):
     """
     'Meet Our Team' page.
     """
     template_name = "pages/team.html"
+    page_cache_tags = ("site", "team")
 
 
-class WeBuyLandView(TemplateView):
+class WeBuyLandView(PageCacheMixin, TemplateView):
     """
     Land acquisition / 'We Buy Land' page.
     """
     template_name = "pages/we_buy_land.html"
+    page_cache_tags = ("site",)
 
 
-class MediaGalleryView(TemplateView):
+class MediaGalleryView(PageCacheMixin, TemplateView):
     """
     Portfolio - Media Gallery.
     """
     template_name = "pages/gallery.html"
+    page_cache_tags = ("site", "communities:list", "plans:list", "homes:list")
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         # Active communities only
-        ctx["communities"] = Community.objects.filter(status="active").order_by("name")
+        ctx["communities"] = Community.objects.filter(status="active").select_related("cover_photo").order_by("name")
+        # Photo wall across every community, plan and home; the rest loads on scroll.
+        ctx["gallery"] = first_page()
         return ctx
 
 
-class CompletedProjectsView(TemplateView):
+class CompletedProjectsView(PageCacheMixin, TemplateView):
     """
     Portfolio - Completed Projects.
     """
     template_name = "pages/completed_projects.html"
+    page_cache_tags = ("site", "communities:list")
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         # Completed = sold out
-        ctx["communities"] = Community.objects.filter(status="sold_out").order_by("name")
+        ctx["communities"] = Community.objects.filter(status="sold_out").select_related("cover_photo").order_by("name")
         return ctx
 
 
+class OurPartnersView(PageCacheMixin, TemplateView):
+    template_name = "pages/our_partners.html"
+    page_cache_tags = ("site",)
+
+
 class UpcomingProjectsView(TemplateView):
     """
     Portfolio - Upcoming / Future Projects.
     """
     template_name = "pages/upcoming_projects.html"
 
+    def get_context_data(self, **kwargs):
+        # The interest-list form posts to ContactView, which drops anything
+        # without LeadForm's bot-trap fields.
+        context = super().get_context_data(**kwargs)
+        context["lead_form"] = LeadForm()
+        return context
+
 
 class ContactView(FormView):
     template_name = "pages/contact.html"
@@ -123,39 +130,64 @@ class ContactView(FormView):
             initial["message"] = msg
         return initial
 
+    def post(self, request, *args, **kwargs):
+        # Bots get the normal thank-you and nothing is written, so the traps
+        # don't teach them what gave them away.
+        form = self.get_form()
+        if form.looks_automated():
+            ratelimit.record("lead:rejected")
+            messages.success(request, "Thanks! We'll be in touch shortly.")
+            return redirect(self.get_success_url())
+
+        # Validation writes nothing, so typos are fixed without spending a
+        # token; only a submission that would create a lead is throttled.
+        if not form.is_valid():
+            return self.form_invalid(form)
+
+        retry_after = self.throttle()
+        if retry_after:
+            ratelimit.record("lead:throttled")
+            form.add_error(None, "We've received a lot of messages just now. Please try again shortly, or give us a call.")
+            response = self.render_to_response(self.get_context_data(form=form), status=429)
+            response["Retry-After"] = str(retry_after)
+            return response
+        return self.form_valid(form)
+
+    def throttle(self):
+        """0 if this submission may go through, else seconds to wait."""
+        per_ip = ratelimit.TokenBucket("lead-ip", *settings.LEAD_RATE_LIMIT_PER_IP)
+        admitted, retry_after = per_ip.take(ratelimit.client_ip(self.request))
+        if not admitted:
+            return retry_after
+        admitted, retry_after = ratelimit.TokenBucket("lead-global", *settings.LEAD_RATE_LIMIT_GLOBAL).take()
+        if not admitted:
+            per_ip.give_back(ratelimit.client_ip(self.request))
+            return retry_after
+        return 0
+
     def form_valid(self, form):
-        # Save lead in DB
-        lead = Lead.objects.create(
-            name=form.cleaned_data["name"],
-            email=form.cleaned_data["email"],
-            phone=form.cleaned_data.get("phone", ""),
-            message=form.cleaned_data.get("message", ""),
-            source=LeadSource.GLOBAL,
-            page_url=self.request.build_absolute_uri(),
-        )
-
-        # Get recipients from SiteSettings.lead_recipients
-        recipients = []
-        try:
-            settings_obj = SiteSettings.get_solo()
-        except Exception:
-            settings_obj = None
-
-        if settings_obj and settings_obj.lead_recipients:
-            raw = settings_obj.lead_recipients.replace(";", ",")
-            for part in raw.replace("\r", "").split(","):
-                email = part.strip()
-                if email:
-                    recipients.append(email)
-
-        if recipients:
-            body = (
-                f"From: {lead.name}\n"
-                f"Email: {lead.email}\n"
-                f"Phone: {lead.phone}\n\n"
-                f"{lead.message}"
+        # Recipients come pre-parsed from the cached SiteSettings.lead_recipients
+        recipients = list(get_lead_recipients())
+
+        # The lead and its notification commit together. EMAIL_BACKEND is the
+        # outbox (outbox/backends.py), so this is an INSERT, not an SMTP
+        # session; drain_outbox delivers and retries it.
+        with transaction.atomic():
+            lead = Lead.objects.create(
+                name=form.cleaned_data["name"],
+                email=form.cleaned_data["email"],
+                phone=form.cleaned_data.get("phone", ""),
+                message=form.cleaned_data.get("message", ""),
+                source=LeadSource.GLOBAL,
+                page_url=self.request.build_absolute_uri(),
             )
-            try:
+            if recipients:
+                body = (
+                    f"From: {lead.name}\n"
+                    f"Email: {lead.email}\n"
+                    f"Phone: {lead.phone}\n\n"
+                    f"{lead.message}"
+                )
                 send_mail(
                     subject=f"New website lead: {lead.name}",
                     message=body,
@@ -163,11 +195,8 @@ class ContactView(FormView):
                         settings, "DEFAULT_FROM_EMAIL", "web@localhost"
                     ),
                     recipient_list=recipients,
-                    fail_silently=True,
                 )
-            except Exception:
-                # Don’t break the user experience if email fails.
-                pass
 
+        ratelimit.record("lead:accepted")
         messages.success(self.request, "Thanks! We'll be in touch shortly.")
         return super().form_valid(form)
@@ -0,0 +1,115 @@
+// Direct-to-S3 uploads for portal file inputs tagged with data-direct-upload
+// (employee_portal/direct_uploads.py). On submit each chosen file is posted
+// straight to the bucket with a presigned policy, then the form is submitted
+// with only the returned tokens (one upload_token per file). Untagged inputs
+// (USE_S3 off) post as usual.
+(function () {
+  function csrfToken(form) {
+    const input = form.querySelector("input[name=csrfmiddlewaretoken]");
+    return input ? input.value : "";
+  }
+
+  function presign(input, file, form) {
+    const body = new FormData();
+    body.append("kind", input.dataset.directUpload);
+    body.append("filename", file.name);
+    body.append("content_type", file.type || "application/octet-stream");
+    return fetch(input.dataset.presignUrl, {
+      method: "POST",
+      body: body,
+      headers: { "X-CSRFToken": csrfToken(form) },
+      credentials: "same-origin",
+    }).then(function (response) {
+      return response.json().then(function (data) {
+        if (!response.ok) throw new Error(data.error || "Could not start the upload.");
+        return data;
+      });
+    });
+  }
+
+  function upload(policy, file) {
+    const body = new FormData();
+    Object.keys(policy.fields).forEach(function (name) {
+      body.append(name, policy.fields[name]);
+    });
+    body.append("file", file);
+    return fetch(policy.url, { method: "POST", body: body }).then(function (response) {
+      if (!response.ok) throw new Error("Upload to storage failed (" + response.status + ").");
+      return policy.token;
+    });
+  }
+
+  function showError(form, message) {
+    let alert = form.querySelector("[data-direct-upload-error]");
+    if (!alert) {
+      alert = document.createElement("div");
+      alert.className = "alert alert-danger";
+      alert.setAttribute("data-direct-upload-error", "");
+      form.prepend(alert);
+    }
+    alert.textContent = message;
+  }
+
+  function uploadFile(input, file, form) {
+    return presign(input, file, form).then(function (policy) {
+      return upload(policy, file);
+    });
+  }
+
+  // A few at a time: enough to fill the pipe without tripping browser limits.
+  function uploadAll(input, files, form) {
+    const tokens = new Array(files.length);
+    let next = 0;
+    function worker() {
+      if (next >= files.length) return Promise.resolve();
+      const index = next++;
+      return uploadFile(input, files[index], form).then(function (token) {
+        tokens[index] = token;
+        return worker();
+      });
+    }
+    const workers = [];
+    for (let i = 0; i < Math.min(3, files.length); i++) workers.push(worker());
+    return Promise.all(workers).then(function () {
+      return tokens;
+    });
+  }
+
+  function setTokens(form, tokens) {
+    let inputs = Array.from(form.querySelectorAll("input[name=upload_token]"));
+    tokens.forEach(function (token, index) {
+      let tokenInput = inputs[index];
+      if (!tokenInput) {
+        tokenInput = document.createElement("input");
+        tokenInput.type = "hidden";
+        tokenInput.name = "upload_token";
+        form.appendChild(tokenInput);
+      }
+      tokenInput.value = token;
+    });
+  }
+
+  document.querySelectorAll("input[type=file][data-direct-upload]").forEach(function (input) {
+    const form = input.form;
+    const submit = form.querySelector("[type=submit]");
+
+    form.addEventListener("submit", function (event) {
+      const files = Array.from(input.files);
+      if (!files.length) return;
+      event.preventDefault();
+      if (submit) submit.disabled = true;
+
+      uploadAll(input, files, form)
+        .then(function (tokens) {
+          setTokens(form, tokens);
+          // The files are already in the bucket; don't send them again.
+          input.value = "";
+          form.submit();
+        })
+        .catch(function (error) {
+          if (submit) submit.disabled = false;
+          showError(form, error.message);
+        });
+    });
+  });
+})();
@@ -0,0 +1,138 @@
+// Infinite scroll for photo galleries (catalog/gallery.py). Pages render the
+// first screenful; a <div data-gallery data-gallery-next="url"> wrapper holds
+// the grid ([data-gallery-items]) and a <template data-gallery-item>. When the
+// end of the grid nears the viewport the next page of the gallery API is
+// fetched and each photo is stamped out from the template. An optional
+// data-gallery-slides="#carousel" gets matching carousel slides from the
+// <template data-gallery-slide> inside that carousel.
+//
+// Template hooks: [data-gallery-picture] receives the <picture>,
+// [data-gallery-caption] the caption ([data-gallery-caption-wrap] is removed
+// when there is none), [data-gallery-index] gets data-bs-slide-to and an
+// aria-label, [data-lightbox-src] and [data-gallery-href] the full-size URL
+// (as data-lightbox-src / href). The <template> carries
+// data-rendition, data-sizes and data-img-class for the <img>.
+(function () {
+  function renditionUrl(photo, name) {
+    const entry = photo.renditions[name];
+    return entry ? entry.url : photo.url;
+  }
+
+  function picture(photo, template) {
+    const name = template.dataset.rendition || "card";
+    const sizes = template.dataset.sizes || "100vw";
+    const entry = photo.renditions[name];
+    const img = document.createElement("img");
+    img.src = renditionUrl(photo, name);
+    img.alt = photo.caption || "";
+    img.loading = "lazy";
+    img.decoding = "async";
+    if (template.dataset.imgClass) img.className = template.dataset.imgClass;
+    const width = entry ? entry.width : photo.width;
+    const height = entry ? entry.height : photo.height;
+    if (width && height) {
+      img.width = width;
+      img.height = height;
+    }
+    if (!photo.srcset) return img;
+
+    img.srcset = photo.srcset;
+    img.sizes = sizes;
+    const wrap = document.createElement("picture");
+    const source = document.createElement("source");
+    source.type = "image/webp";
+    source.srcset = photo.webp_srcset;
+    source.sizes = sizes;
+    wrap.append(source, img);
+    return wrap;
+  }
+
+  function stamp(template, photo, index) {
+    const node = template.content.firstElementChild.cloneNode(true);
+    const all = function (selector) {
+      return [node].concat(Array.from(node.querySelectorAll(selector))).filter(function (el) {
+        return el.matches(selector);
+      });
+    };
+    all("[data-gallery-picture]").forEach(function (el) {
+      el.append(picture(photo, template));
+    });
+    all("[data-gallery-index]").forEach(function (el) {
+      el.setAttribute("data-bs-slide-to", index);
+      el.setAttribute("aria-label", "Open photo " + (index + 1));
+    });
+    all("[data-gallery-href]").forEach(function (el) {
+      el.href = renditionUrl(photo, "full");
+    });
+    all("[data-lightbox-src]").forEach(function (el) {
+      el.setAttribute("data-lightbox-src", renditionUrl(photo, "full"));
+      el.setAttribute("data-lightbox-caption", photo.caption || "");
+    });
+    if (photo.caption) {
+      all("[data-gallery-caption]").forEach(function (el) {
+        el.textContent = photo.caption;
+      });
+    } else {
+      all("[data-gallery-caption-wrap]").forEach(function (el) {
+        el.remove();
+      });
+    }
+    return node;
+  }
+
+  function setup(gallery) {
+    const items = gallery.querySelector("[data-gallery-items]");
+    const itemTemplate = gallery.querySelector("template[data-gallery-item]");
+    if (!items || !itemTemplate || !gallery.dataset.galleryNext) return;
+    const carousel = gallery.dataset.gallerySlides ? document.querySelector(gallery.dataset.gallerySlides) : null;
+    const slides = carousel ? carousel.querySelector(".carousel-inner") : null;
+    const slideTemplate = carousel ? carousel.querySelector("template[data-gallery-slide]") : null;
+    let next = gallery.dataset.galleryNext;
+    let count = items.querySelectorAll("[data-gallery-photo]").length;
+    let loading = false;
+
+    const sentinel = document.createElement("div");
+    sentinel.setAttribute("aria-hidden", "true");
+    items.after(sentinel);
+
+    function load() {
+      if (loading || !next) return;
+      loading = true;
+      fetch(next, { headers: { Accept: "application/json" }, credentials: "same-origin" })
+        .then(function (response) {
+          if (!response.ok) throw new Error("Gallery page failed: " + response.status);
+          return response.json();
+        })
+        .then(function (data) {
+          data.results.forEach(function (photo) {
+            items.append(stamp(itemTemplate, photo, count));
+            if (slides && slideTemplate) slides.append(stamp(slideTemplate, photo, count));
+            count += 1;
+          });
+          next = data.next;
+          loading = false;
+          if (!next) {
+            observer.disconnect();
+          } else if (sentinel.offsetParent && sentinel.getBoundingClientRect().top < window.innerHeight + 800) {
+            // A short page left the end in view (and visible): no new intersection will fire.
+            load();
+          }
+        })
+        .catch(function (err) {
+          // Leave the sentinel observed; the next scroll retries.
+          loading = false;
+          console.error(err);
+        });
+    }
+
+    const observer = new IntersectionObserver(
+      function (entries) {
+        if (entries.some(function (entry) { return entry.isIntersecting; })) load();
+      },
+      { rootMargin: "800px 0px" }
+    );
+    observer.observe(sentinel);
+  }
+
+  document.querySelectorAll("[data-gallery]").forEach(setup);
+})();
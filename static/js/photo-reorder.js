@@ -0,0 +1,74 @@
+// Drag-to-reorder for the portal photo tables. Rows of a
+// <tbody data-photo-reorder="url"> carry data-photo-id; after a drop the
+// full order is POSTed as `order` ids and saved server-side in one query.
+(function () {
+  function csrfToken() {
+    const input = document.querySelector("input[name=csrfmiddlewaretoken]");
+    return input ? input.value : "";
+  }
+
+  document.querySelectorAll("tbody[data-photo-reorder]").forEach(function (tbody) {
+    let dragging = null;
+    let before = "";
+
+    function rows() {
+      return Array.from(tbody.querySelectorAll("tr[data-photo-id]"));
+    }
+
+    function currentOrder() {
+      return rows().map(function (row) {
+        return row.dataset.photoId;
+      });
+    }
+
+    function save() {
+      const order = currentOrder();
+      if (order.join(",") === before) return;
+      const body = new FormData();
+      order.forEach(function (id) {
+        body.append("order", id);
+      });
+      fetch(tbody.dataset.photoReorder, {
+        method: "POST",
+        body: body,
+        headers: { "X-CSRFToken": csrfToken() },
+        credentials: "same-origin",
+      })
+        .then(function (response) {
+          if (!response.ok) throw new Error("Could not save the new order.");
+          rows().forEach(function (row, index) {
+            const cell = row.querySelector("[data-sort-order]");
+            if (cell) cell.textContent = index;
+          });
+        })
+        .catch(function (error) {
+          window.alert(error.message);
+          window.location.reload();
+        });
+    }
+
+    tbody.addEventListener("dragstart", function (event) {
+      dragging = event.target.closest("tr[data-photo-id]");
+      if (!dragging) return;
+      before = currentOrder().join(",");
+      dragging.classList.add("opacity-50");
+      event.dataTransfer.effectAllowed = "move";
+    });
+
+    tbody.addEventListener("dragover", function (event) {
+      const target = event.target.closest("tr[data-photo-id]");
+      if (!dragging || !target || target === dragging) return;
+      event.preventDefault();
+      const box = target.getBoundingClientRect();
+      const after = event.clientY > box.top + box.height / 2;
+      tbody.insertBefore(dragging, after ? target.nextSibling : target);
+    });
+
+    tbody.addEventListener("dragend", function () {
+      if (!dragging) return;
+      dragging.classList.remove("opacity-50");
+      dragging = null;
+      save();
+    });
+  });
+})();